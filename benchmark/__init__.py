@@ -0,0 +1,35 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .corpus import SyntheticSong, generate_song_corpus
+from .fonts import BUNDLED_FONT_DIR, use_bundled_fonts
+from .stages import STAGES, StageTimings, benchmark_song
+from .memory import benchmark_memory, log_memory_report
+from .report import (
+    get_benchmark_report,
+    write_benchmark_report,
+    log_benchmark_table,
+)
+from .golden import (
+    GOLDEN_SLIDE_DIR,
+    GOLDEN_SLIDE_STYLES,
+    GoldenSlideResult,
+    use_golden_slide_config,
+    has_golden_slides,
+    render_golden_corpus,
+    render_golden_corpus_at_revision,
+    check_golden_slides,
+    update_golden_slides,
+)
@@ -0,0 +1,129 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from random import Random
+from dataclasses import dataclass
+
+import config as const
+
+WORDS = (
+    "Grüße",
+    "Höhe",
+    "gnädig",
+    "König",
+    "Erlöser",
+    "süß",
+    "Ärger",
+    "Übermut",
+    "fröhlich",
+    "Güte",
+    "Schöpfer",
+    "über",
+    "für",
+    "Frieden",
+    "Herrlichkeit",
+    "Hände",
+    "Mächte",
+    "Träne",
+    "Öl",
+    "Blüte",
+    "Lämmer",
+    "Größe",
+    "wärmt",
+    "Herz",
+    "Licht",
+    "und",
+    "wir",
+    "dich",
+)
+
+
+@dataclass
+class SyntheticSong:
+    file_path: str
+    prompt: str
+
+
+def get_synthetic_line(rng: Random) -> str:
+    # the line break counts towards the per line character limit
+    max_length = rng.randint(
+        10, const.STRUCTURE_ELEMENT_PER_LINE_CHAR_LIMIT - 1
+    )
+    line = rng.choice(WORDS).capitalize()
+    while True:
+        word = rng.choice(WORDS)
+        if len(line) + len(word) + 1 > max_length:
+            return line
+        line += " " + word
+
+
+def get_synthetic_structure_element(rng: Random) -> str:
+    line_count = rng.randint(
+        max(1, const.STRUCTURE_ELEMENT_MAX_LINES - 4),
+        2 * const.STRUCTURE_ELEMENT_MAX_LINES + 2,
+    )
+    return "\n".join(get_synthetic_line(rng) for _ in range(line_count))
+
+
+def get_synthetic_song(rng: Random, song_number: int) -> tuple[str, str]:
+    verse_count = rng.randint(1, 6)
+    has_refrain = rng.random() < 0.7
+    structure = []
+    for verse in range(1, verse_count + 1):
+        structure.append(str(verse))
+        if has_refrain:
+            structure.append("R")
+
+    content = [
+        "title: Lied {} über Grüße".format(song_number),
+        "book: Benchmark {}".format(song_number),
+        "text: Jörg Müller",
+        "melody: Käthe Schäfer",
+        "structure: {}".format(",".join(structure)),
+    ]
+    elements = [str(verse) for verse in range(1, verse_count + 1)]
+    if has_refrain:
+        elements.insert(0, "R")
+    for element in elements:
+        content += ["", "[{}]".format(element)]
+        content.append(get_synthetic_structure_element(rng))
+    # ranged prompts make the prompt expansion do some actual work
+    prompt = "1-{}".format(verse_count) if verse_count > 1 else ""
+    return "\n".join(content) + "\n", prompt
+
+
+# every crlf_interval-th song is written with crlf line endings, which the
+# song parsers have to treat like plain line feeds
+def generate_song_corpus(
+    dest_dir: str, song_count: int, seed: int, crlf_interval: int = 0
+) -> list[SyntheticSong]:
+    rng = Random(seed)
+    songs = []
+    for song_number in range(1, song_count + 1):
+        song_file_path = os.path.join(
+            dest_dir, "song-{}.txt".format(str(song_number).zfill(3))
+        )
+        song_content, prompt = get_synthetic_song(rng, song_number)
+        use_crlf = crlf_interval > 0 and song_number % crlf_interval == 0
+        with open(
+            song_file_path,
+            mode="w",
+            encoding="utf-8",
+            newline="\r\n" if use_crlf else "\n",
+        ) as file_writer:
+            file_writer.write(song_content)
+        songs.append(SyntheticSong(song_file_path, prompt))
+    return songs
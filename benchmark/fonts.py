@@ -0,0 +1,33 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+
+import config as const
+
+BUNDLED_FONT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "media",
+    "fonts",
+)
+
+
+# the free dejavu fonts are shipped with the repository, so that benchmarks
+# give comparable results on machines without the configured fonts
+def use_bundled_fonts() -> None:
+    const.FONT_PATH = os.path.join(BUNDLED_FONT_DIR, "DejaVuSans.ttf")
+    const.BOLD_FONT_PATH = os.path.join(
+        BUNDLED_FONT_DIR, "DejaVuSans-Bold.ttf"
+    )
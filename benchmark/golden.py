@@ -0,0 +1,299 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import shutil
+import tarfile
+import subprocess
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+
+from slides import get_slide_style, wait_for_slides
+from slides.engine.pixel_diff import PixelDiff, get_pixel_diff
+from utils import error_msg
+
+import config as const
+from config import default_config
+
+from slidegen import Slidegen
+
+from .corpus import generate_song_corpus
+from .fonts import use_bundled_fonts
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GOLDEN_SLIDE_DIR = os.path.join(REPOSITORY_DIR, "media", "golden")
+GOLDEN_SLIDE_STYLES = ("classic", "pillow")
+GOLDEN_SONG_COUNT = 3
+# a seed whose corpus has songs both with and without a refrain
+GOLDEN_CORPUS_SEED = 8
+GOLDEN_CORPUS_CRLF_INTERVAL = 2
+# a non-base output resolution, so that the scaling of the layouts is covered
+GOLDEN_OUTPUT_RESOLUTIONS = ["1280x720"]
+# the songs are rendered with their full structure instead of the ranged
+# prompts of the benchmark, so that the refrains repeat and the slides built
+# from cached text canvases, indices, arrows and structure displays are
+# compared as well
+GOLDEN_SONG_STRUCTURE = ""
+
+
+@dataclass
+class GoldenSlideResult:
+    filename: str
+    passed: bool
+    message: str = ""
+    pixel_diff: PixelDiff | None = None
+
+
+# the golden slides must not depend on the local config, so they are rendered
+# with the default config, the bundled fonts and a lossless image format
+def use_golden_slide_config() -> None:
+    for name in dir(default_config):
+        if name.isupper():
+            setattr(const, name, getattr(default_config, name))
+    use_bundled_fonts()
+    const.OUTPUT_RESOLUTIONS = GOLDEN_OUTPUT_RESOLUTIONS
+    const.IMAGE_FORMAT = "png"
+    const.FILE_EXTENSION = "png"
+
+
+def has_golden_slides(style_name: str) -> bool:
+    return bool(get_slide_files(os.path.join(GOLDEN_SLIDE_DIR, style_name)))
+
+
+def get_slide_files(slide_dir: str) -> set[str]:
+    slide_files = set()
+    for root, _, filenames in os.walk(slide_dir):
+        for filename in filenames:
+            slide_files.add(
+                os.path.relpath(os.path.join(root, filename), slide_dir)
+            )
+    return slide_files
+
+
+def render_golden_corpus(
+    style_name: str, corpus_dir: str, dest_dir: str
+) -> set[str]:
+    slide_style = get_slide_style(style_name)
+    songs = generate_song_corpus(
+        corpus_dir,
+        GOLDEN_SONG_COUNT,
+        GOLDEN_CORPUS_SEED,
+        GOLDEN_CORPUS_CRLF_INTERVAL,
+    )
+    with ThreadPoolExecutor() as executor:
+        for song in songs:
+            song_dir = os.path.join(
+                dest_dir,
+                os.path.splitext(os.path.basename(song.file_path))[0],
+            )
+            os.makedirs(song_dir, exist_ok=True)
+            statuses = wait_for_slides(
+                Slidegen(
+                    slide_style,
+                    song.file_path,
+                    song_dir,
+                    GOLDEN_SONG_STRUCTURE,
+                ).execute(executor)
+            )
+            for status in statuses:
+                if not status.success:
+                    error_msg(
+                        "could not render '{}': {}".format(
+                            status.filename, status.message
+                        )
+                    )
+    return get_slide_files(dest_dir)
+
+
+# older revisions of the repository do not have this module, so their slides
+# are rendered through the slidegen.py command line of an exported copy of
+# the revision. It gets a config.py with the same golden slide settings, so
+# that the goldens of a style can be recorded with a known good revision.
+def render_golden_corpus_at_revision(
+    style_name: str, revision: str, corpus_dir: str, dest_dir: str
+) -> set[str]:
+    songs = generate_song_corpus(
+        corpus_dir,
+        GOLDEN_SONG_COUNT,
+        GOLDEN_CORPUS_SEED,
+        GOLDEN_CORPUS_CRLF_INTERVAL,
+    )
+    with TemporaryDirectory() as revision_dir:
+        export_revision(revision, revision_dir)
+        write_golden_slide_config(
+            style_name, os.path.join(revision_dir, "config", "config.py")
+        )
+        for song in songs:
+            song_dir = os.path.join(
+                dest_dir,
+                os.path.splitext(os.path.basename(song.file_path))[0],
+            )
+            os.makedirs(song_dir, exist_ok=True)
+            try:
+                subprocess.run(
+                    [
+                        sys.executable,
+                        "slidegen.py",
+                        song.file_path,
+                        song_dir,
+                        GOLDEN_SONG_STRUCTURE,
+                    ],
+                    cwd=revision_dir,
+                    check=True,
+                    # a revision that asks for input must fail, not hang
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                )
+            except subprocess.CalledProcessError as error:
+                error_msg(
+                    "could not render '{}' with revision '{}': {}".format(
+                        song.file_path, revision, error
+                    )
+                )
+            # older revisions only report failed slides from their render
+            # threads, without changing the exit status
+            if not os.listdir(song_dir):
+                error_msg(
+                    "revision '{}' rendered no slides of '{}'".format(
+                        revision, song.file_path
+                    )
+                )
+    add_missing_layout_slides(style_name, dest_dir)
+    return get_slide_files(dest_dir)
+
+
+# revisions from before the output resolutions only render the base one, the
+# slides of the other resolutions are then taken from the working tree
+def add_missing_layout_slides(style_name: str, dest_dir: str) -> None:
+    with TemporaryDirectory() as corpus_dir:
+        with TemporaryDirectory() as working_tree_dir:
+            slide_files = render_golden_corpus(
+                style_name, corpus_dir, working_tree_dir
+            )
+            for filename in slide_files - get_slide_files(dest_dir):
+                # the base resolution slides stay directly in the song dirs
+                if os.path.dirname(os.path.dirname(filename)):
+                    dest_path = os.path.join(dest_dir, filename)
+                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                    shutil.copyfile(
+                        os.path.join(working_tree_dir, filename), dest_path
+                    )
+
+
+def export_revision(revision: str, dest_dir: str) -> None:
+    archive_path = os.path.join(dest_dir, "revision.tar")
+    try:
+        subprocess.run(
+            [
+                "git",
+                "-C",
+                REPOSITORY_DIR,
+                "archive",
+                "--output",
+                archive_path,
+                revision,
+            ],
+            check=True,
+            capture_output=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as error:
+        error_msg("could not export revision '{}': {}".format(revision, error))
+    with tarfile.open(archive_path) as archive:
+        archive.extractall(dest_dir, filter="data")
+    os.remove(archive_path)
+
+
+def write_golden_slide_config(style_name: str, config_file_path: str) -> None:
+    use_golden_slide_config()
+    settings = {
+        "FONT_PATH": const.FONT_PATH,
+        "BOLD_FONT_PATH": const.BOLD_FONT_PATH,
+        "IMAGE_FORMAT": const.IMAGE_FORMAT,
+        "FILE_EXTENSION": const.FILE_EXTENSION,
+        "SLIDE_STYLE": style_name,
+        "OUTPUT_RESOLUTIONS": const.OUTPUT_RESOLUTIONS,
+        # slidegen.py must not hand the songs to a running render daemon
+        "RENDER_DAEMON_SOCKET": os.path.join(
+            os.path.dirname(config_file_path), "no-render-daemon.sock"
+        ),
+    }
+    with open(config_file_path, mode="w", encoding="utf-8") as config_writer:
+        for name, value in settings.items():
+            config_writer.write("{} = {!r}\n".format(name, value))
+
+
+def save_diff_image(pixel_diff: PixelDiff, diff_path: str) -> None:
+    os.makedirs(os.path.dirname(diff_path), exist_ok=True)
+    # stretch the differences, so that small shifts are visible as well
+    pixel_diff.diff_img.point(
+        lambda value: 0 if value == 0 else min(255, 64 + 4 * value)
+    ).save(diff_path)
+
+
+def check_golden_slide(
+    filename: str, golden_dir: str, rendered_dir: str, diff_dir: str
+) -> GoldenSlideResult:
+    golden_path = os.path.join(golden_dir, filename)
+    rendered_path = os.path.join(rendered_dir, filename)
+    if not os.path.isfile(golden_path):
+        return GoldenSlideResult(filename, False, "no golden slide")
+    if not os.path.isfile(rendered_path):
+        return GoldenSlideResult(filename, False, "not rendered")
+    pixel_diff = get_pixel_diff(golden_path, rendered_path)
+    passed = pixel_diff.within_tolerance()
+    if not passed:
+        save_diff_image(
+            pixel_diff,
+            os.path.join(diff_dir, os.path.splitext(filename)[0] + ".png"),
+        )
+    return GoldenSlideResult(
+        filename,
+        passed,
+        "mean diff {:.2f}, {:.2%} differing pixels".format(
+            pixel_diff.mean_diff, pixel_diff.differing_share
+        ),
+        pixel_diff,
+    )
+
+
+def check_golden_slides(
+    style_name: str, rendered_dir: str, diff_dir: str
+) -> list[GoldenSlideResult]:
+    golden_dir = os.path.join(GOLDEN_SLIDE_DIR, style_name)
+    filenames = sorted(
+        get_slide_files(rendered_dir) | get_slide_files(golden_dir)
+    )
+    # decoding and diffing release the gil, so the slides are compared on
+    # a thread pool as well
+    with ThreadPoolExecutor() as executor:
+        return list(
+            executor.map(
+                lambda filename: check_golden_slide(
+                    filename,
+                    golden_dir,
+                    rendered_dir,
+                    os.path.join(diff_dir, style_name),
+                ),
+                filenames,
+            )
+        )
+
+
+def update_golden_slides(style_name: str, rendered_dir: str) -> None:
+    golden_dir = os.path.join(GOLDEN_SLIDE_DIR, style_name)
+    shutil.rmtree(golden_dir, ignore_errors=True)
+    shutil.copytree(rendered_dir, golden_dir)
@@ -0,0 +1,119 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Thread
+import tracemalloc
+
+import psutil
+
+from slides import SlideStyle, wait_for_slides
+from utils import log
+
+import config as const
+
+from slidegen import Slidegen
+
+from .corpus import SyntheticSong
+
+MEGABYTE = 1024 * 1024
+RSS_SAMPLE_INTERVAL_SECONDS = 0.005
+
+
+class PeakRssSampler:
+    def __init__(self) -> None:
+        self.process = psutil.Process()
+        self.peak_rss: int = self.process.memory_info().rss
+        self.stopped = Event()
+        self.thread = Thread(target=self.sample, daemon=True)
+
+    def sample(self) -> None:
+        while not self.stopped.wait(RSS_SAMPLE_INTERVAL_SECONDS):
+            self.peak_rss = max(self.peak_rss, self.process.memory_info().rss)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stopped.set()
+        self.thread.join()
+        self.peak_rss = max(self.peak_rss, self.process.memory_info().rss)
+
+
+def render_songs(
+    slide_style: SlideStyle,
+    songs: list[SyntheticSong],
+    output_dir: str,
+    executor: ThreadPoolExecutor,
+) -> int:
+    futures = []
+    for song in songs:
+        futures += Slidegen(
+            slide_style, song.file_path, output_dir, song.prompt
+        ).execute(executor)
+    return len(wait_for_slides(futures))
+
+
+def benchmark_memory(
+    slide_style: SlideStyle,
+    songs: list[SyntheticSong],
+    output_dir: str,
+    workers: int,
+) -> dict:
+    # every slide has to be rendered to measure the compositing memory, the
+    # warm up pass fills the per process caches beforehand
+    const.SLIDE_CACHE_DIR = ""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        render_songs(slide_style, songs, output_dir, executor)
+
+        baseline_rss = psutil.Process().memory_info().rss
+        tracemalloc.start()
+        try:
+            with PeakRssSampler() as rss_sampler:
+                slide_count = render_songs(
+                    slide_style, songs, output_dir, executor
+                )
+            tracemalloc_peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    peak_rss_increase = max(0, rss_sampler.peak_rss - baseline_rss)
+    return {
+        "workers": workers,
+        "slide_count": slide_count,
+        "baseline_rss_mb": baseline_rss / MEGABYTE,
+        "peak_rss_mb": rss_sampler.peak_rss / MEGABYTE,
+        "peak_rss_increase_mb": peak_rss_increase / MEGABYTE,
+        "peak_rss_increase_per_worker_mb": peak_rss_increase
+        / workers
+        / MEGABYTE,
+        "tracemalloc_peak_mb": tracemalloc_peak / MEGABYTE,
+    }
+
+
+def log_memory_report(memory_report: dict) -> None:
+    log(
+        "{} slides on {} threads: peak rss {:.1f} MiB (+{:.1f} MiB, "
+        "+{:.1f} MiB per thread), tracemalloc peak {:.1f} MiB".format(
+            memory_report["slide_count"],
+            memory_report["workers"],
+            memory_report["peak_rss_mb"],
+            memory_report["peak_rss_increase_mb"],
+            memory_report["peak_rss_increase_per_worker_mb"],
+            memory_report["tracemalloc_peak_mb"],
+        ),
+        color="cyan",
+    )
@@ -0,0 +1,84 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from math import ceil
+from statistics import median
+import json
+
+from utils import log
+
+from .stages import STAGES, StageTimings
+
+
+def get_percentile(samples: list[float], percentile: float) -> float:
+    sorted_samples = sorted(samples)
+    return sorted_samples[max(0, ceil(percentile * len(sorted_samples)) - 1)]
+
+
+def get_stage_summary(samples: list[float]) -> dict:
+    if len(samples) == 0:
+        return {
+            "count": 0,
+            "min": 0.0,
+            "median": 0.0,
+            "p95": 0.0,
+            "total": 0.0,
+        }
+    return {
+        "count": len(samples),
+        "min": min(samples),
+        "median": median(samples),
+        "p95": get_percentile(samples, 0.95),
+        "total": sum(samples),
+    }
+
+
+def get_benchmark_report(timings: StageTimings, parameters: dict) -> dict:
+    return {
+        "parameters": parameters,
+        "slide_count": timings.slide_count,
+        "stages": {
+            stage: get_stage_summary(timings.samples[stage])
+            for stage in STAGES
+        },
+        "samples": timings.samples,
+    }
+
+
+def write_benchmark_report(report: dict, output_file_path: str) -> None:
+    with open(output_file_path, mode="w", encoding="utf-8") as file_writer:
+        json.dump(report, file_writer, indent=4)
+        file_writer.write("\n")
+
+
+def log_benchmark_table(report: dict) -> None:
+    log(
+        "{:<18}{:>7}{:>12}{:>12}{:>12}{:>12}".format(
+            "stage", "count", "min ms", "median ms", "p95 ms", "total s"
+        ),
+        color="cyan",
+    )
+    for stage, summary in report["stages"].items():
+        log(
+            "{:<18}{:>7}{:>12.2f}{:>12.2f}{:>12.2f}{:>12.2f}".format(
+                stage,
+                summary["count"],
+                1000 * summary["min"],
+                1000 * summary["median"],
+                1000 * summary["p95"],
+                summary["total"],
+            ),
+            color="cyan",
+        )
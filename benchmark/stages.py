@@ -0,0 +1,110 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from contextlib import contextmanager
+from time import perf_counter
+import os
+
+from slides import SlideStyle
+from slides.engine.generate_slides import split_structure_element
+from slides.engine.encoder import encode_slide, write_slide_atomically
+
+import config as const
+
+from input import clear_cached_song_documents
+from slidegen import Slidegen
+
+from .corpus import SyntheticSong
+
+STAGES = (
+    "parse",
+    "prompt expansion",
+    "song template",
+    "text canvas",
+    "compositing",
+    "save",
+)
+
+
+class StageTimings:
+    def __init__(self) -> None:
+        self.samples: dict[str, list[float]] = {stage: [] for stage in STAGES}
+        self.slide_count: int = 0
+
+    @contextmanager
+    def measure(self, stage: str):
+        start_time = perf_counter()
+        yield
+        self.samples[stage].append(perf_counter() - start_time)
+
+
+def benchmark_song(
+    slide_style: SlideStyle,
+    song: SyntheticSong,
+    output_dir: str,
+    timings: StageTimings,
+) -> None:
+    slidegen = Slidegen(slide_style, song.file_path, output_dir, song.prompt)
+    # repeated runs would otherwise only measure lookups in the in-memory
+    # song cache instead of parsing
+    clear_cached_song_documents()
+    with timings.measure("parse"):
+        slidegen.parse_file()
+    with timings.measure("prompt expansion"):
+        slidegen.calculate_desired_structures()
+
+    # bypasses the per process template cache of generate_song_template, so
+    # that repeated runs still measure the actual template rendering
+    with timings.measure("song template"):
+        template_img = slide_style.song_template_form().get_template(
+            slidegen.metadata["title"]
+        )
+
+    song_slide = slide_style.song_slide_form()
+    for index, structure in enumerate(slidegen.chosen_structure):
+        inner_slide_texts = split_structure_element(
+            slidegen.songtext[structure]
+        )
+        for inner_slide, slide_text in enumerate(inner_slide_texts):
+            timings.slide_count += 1
+            # the text fit rasterizes the canvas it checks, which the slide
+            # then takes from the sprite cache
+            with timings.measure("text canvas"):
+                font_size = song_slide.get_text_fit(slide_text)
+            with timings.measure("compositing"):
+                slide_img = song_slide.get_slide(
+                    template_img=template_img,
+                    slide_text=slide_text,
+                    font_size=font_size,
+                    song_structure=slidegen.chosen_structure,
+                    index=index,
+                    use_arrow=inner_slide != len(inner_slide_texts) - 1,
+                )
+
+            with timings.measure("save"):
+                encoded_slide = encode_slide(slide_img)
+                write_slide_atomically(
+                    encoded_slide.data,
+                    os.path.join(
+                        output_dir,
+                        "{}{}.{}".format(
+                            const.FILE_NAMING,
+                            timings.slide_count,
+                            const.FILE_EXTENSION,
+                        ),
+                    ),
+                )
+            slide_img.close()
+    template_img.close()
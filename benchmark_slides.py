@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import argparse
+from contextlib import redirect_stdout
+from tempfile import TemporaryDirectory
+
+import colorama
+
+from benchmark import (
+    StageTimings,
+    generate_song_corpus,
+    use_bundled_fonts,
+    benchmark_song,
+    benchmark_memory,
+    log_memory_report,
+    get_benchmark_report,
+    write_benchmark_report,
+    log_benchmark_table,
+)
+from slides import SLIDE_STYLES, get_slide_style
+from utils import log, warn
+
+import config as const
+
+
+def parse_benchmark_slides_argv() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="benchmark_slides",
+        description="renders a synthetic song corpus and times each stage "
+        + "of the slide generation.",
+    )
+    parser.add_argument(
+        "-n", "--songs", type=int, default=20, help="number of synthetic songs"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the synthetic corpus"
+    )
+    parser.add_argument(
+        "--style",
+        choices=list(SLIDE_STYLES),
+        default=const.SLIDE_STYLE,
+        help="slide style to benchmark",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=1,
+        help="number of runs over the corpus, later runs profit from the "
+        + "per process caches",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="",
+        help="file the json results are written to, they are only printed "
+        + "if it is not given",
+    )
+    parser.add_argument(
+        "--system-fonts",
+        action="store_true",
+        help="use the configured fonts instead of the bundled dejavu fonts",
+    )
+    parser.add_argument(
+        "--memory",
+        type=int,
+        metavar="WORKERS",
+        default=0,
+        help="also render the corpus on WORKERS threads and record the peak "
+        + "memory usage",
+    )
+    args = parser.parse_args()
+    if args.songs < 1 or args.repeat < 1:
+        parser.error("the number of songs and runs must be positive")
+    if args.memory < 0:
+        parser.error("the number of memory benchmark workers must be positive")
+    return args
+
+
+if __name__ == "__main__":
+    colorama.init()
+    args = parse_benchmark_slides_argv()
+
+    if not args.system_fonts:
+        use_bundled_fonts()
+    slide_style = get_slide_style(args.style)
+
+    timings = StageTimings()
+    with TemporaryDirectory() as corpus_dir, TemporaryDirectory() as slide_dir:
+        songs = generate_song_corpus(corpus_dir, args.songs, args.seed)
+        for run in range(1, args.repeat + 1):
+            for song_number, song in enumerate(songs, start=1):
+                log(
+                    "benchmarking run {} / {}, song {} / {}...".format(
+                        run, args.repeat, song_number, len(songs)
+                    ),
+                    end="\r",
+                )
+                try:
+                    with open(
+                        os.devnull, mode="w", encoding="utf-8"
+                    ) as devnull, redirect_stdout(devnull):
+                        benchmark_song(slide_style, song, slide_dir, timings)
+                except SystemExit:
+                    warn(
+                        "\ncould not benchmark '{}'".format(
+                            os.path.basename(song.file_path)
+                        )
+                    )
+        print()
+
+        memory_report = None
+        if args.memory:
+            with open(
+                os.devnull, mode="w", encoding="utf-8"
+            ) as devnull, redirect_stdout(devnull):
+                memory_report = benchmark_memory(
+                    slide_style, songs, slide_dir, args.memory
+                )
+
+    report = get_benchmark_report(
+        timings,
+        {
+            "songs": args.songs,
+            "seed": args.seed,
+            "style": args.style,
+            "repeat": args.repeat,
+            "image_format": const.IMAGE_FORMAT,
+            "font_path": const.FONT_PATH,
+        },
+    )
+    log_benchmark_table(report)
+    if memory_report:
+        report["memory"] = memory_report
+        log_memory_report(memory_report)
+    if args.output:
+        write_benchmark_report(report, args.output)
+        log("wrote benchmark results to '{}'".format(args.output))
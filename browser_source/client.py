@@ -0,0 +1,71 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+
+from websockets.exceptions import WebSocketException
+from websockets.sync.client import connect
+
+from utils import log, warn, error_msg
+
+import config as const
+
+
+def get_browser_source_websocket_url() -> str:
+    return "ws://{}:{}".format(
+        const.BROWSER_SOURCE_HOST, const.BROWSER_SOURCE_WEBSOCKET_PORT
+    )
+
+
+def send_browser_source_action(action: str, slot: int, **parameters) -> dict:
+    try:
+        with connect(
+            get_browser_source_websocket_url(), open_timeout=3
+        ) as websocket:
+            websocket.send(
+                json.dumps({"action": action, "slot": slot, **parameters})
+            )
+            if action != "load":
+                return {}
+            return json.loads(websocket.recv(timeout=10))
+    except (OSError, TimeoutError, WebSocketException) as error:
+        error_msg(
+            "could not reach the browser source server at '{}'. Reason: "
+            "{}".format(get_browser_source_websocket_url(), error)
+        )
+
+
+def load_song_into_browser_source(
+    slot: int, song_file_path: str, chosen_structure: str
+) -> None:
+    response = send_browser_source_action(
+        "load",
+        slot,
+        song=os.path.abspath(song_file_path),
+        structure=chosen_structure,
+    )
+    if response.get("event") != "loaded":
+        warn(
+            "browser source could not load '{}': {}".format(
+                song_file_path, response.get("message", "")
+            )
+        )
+        return
+    log(
+        "loaded {} slides of '{}' into the browser source of slot {}".format(
+            response["slide_count"], song_file_path, slot
+        )
+    )
@@ -0,0 +1,237 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from threading import Thread
+import asyncio
+import json
+
+import websockets
+from flask import Flask, abort, render_template_string, request, send_file
+
+from utils import log, warn
+from slides.engine.svg_image import get_font_face_name
+
+import config as const
+
+from .slides import get_browser_source_slides
+
+browser_source_webserver = Flask(__name__)
+
+BROWSER_SOURCE_PAGE = """<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <title>Song Slides {{ slot }}</title>
+    <style>
+        @font-face {
+            font-family: "{{ font_face }}";
+            src: url("/fonts/regular");
+        }
+        @font-face {
+            font-family: "{{ bold_font_face }}";
+            src: url("/fonts/bold");
+        }
+        html, body {
+            margin: 0;
+            height: 100%;
+            overflow: hidden;
+            background-color: {{ bg_color }};
+        }
+        #slide svg {
+            display: block;
+            width: 100vw;
+            height: 100vh;
+        }
+    </style>
+</head>
+<body>
+    <div id="slide"></div>
+    <script>
+        const slot = {{ slot }};
+        let slides = [];
+        let currentSlide = 0;
+
+        function showSlide() {
+            document.getElementById("slide").innerHTML =
+                slides[currentSlide] || "";
+        }
+
+        function connect() {
+            const socket = new WebSocket(
+                "ws://" + location.hostname + ":{{ websocket_port }}"
+            );
+            socket.onopen = function () {
+                socket.send(JSON.stringify({action: "subscribe", slot: slot}));
+            };
+            socket.onmessage = function (event) {
+                const state = JSON.parse(event.data);
+                if ("slides" in state) {
+                    slides = state.slides;
+                }
+                currentSlide = state.slide;
+                showSlide();
+            };
+            socket.onclose = function () {
+                setTimeout(connect, 1000);
+            };
+        }
+
+        connect();
+    </script>
+</body>
+</html>
+"""
+
+
+@browser_source_webserver.route("/")
+def index():
+    return render_template_string(
+        BROWSER_SOURCE_PAGE,
+        slot=request.args.get("slot", default=1, type=int),
+        font_face=get_font_face_name(const.FONT_PATH),
+        bold_font_face=get_font_face_name(const.BOLD_FONT_PATH),
+        bg_color=const.BG_COLOR,
+        websocket_port=const.BROWSER_SOURCE_WEBSOCKET_PORT,
+    )
+
+
+@browser_source_webserver.route("/fonts/<weight>")
+def font(weight: str):
+    if weight == "regular":
+        return send_file(const.FONT_PATH)
+    if weight == "bold":
+        return send_file(const.BOLD_FONT_PATH)
+    abort(404)
+
+
+class BrowserSourceState:
+    def __init__(self) -> None:
+        self.slots: dict[int, dict] = {}
+        self.subscribers: dict[int, set] = {}
+
+    def get_slot_state(self, slot: int) -> dict:
+        return self.slots.setdefault(slot, {"slides": [], "slide": 0})
+
+    def publish(self, slot: int, message: dict) -> None:
+        websockets.broadcast(
+            self.subscribers.get(slot, set()), json.dumps(message)
+        )
+
+    def move_to_slide(self, slot: int, slide: int) -> None:
+        slot_state = self.get_slot_state(slot)
+        slide = max(0, min(slide, len(slot_state["slides"]) - 1))
+        if slide != slot_state["slide"]:
+            slot_state["slide"] = slide
+            self.publish(slot, {"slide": slide})
+
+    async def load_song(
+        self, slot: int, song_file_path: str, chosen_structure: str
+    ) -> dict:
+        try:
+            slides = await asyncio.to_thread(
+                get_browser_source_slides, song_file_path, chosen_structure
+            )
+        except SystemExit:
+            return {
+                "event": "error",
+                "message": "invalid song, see the browser source log",
+            }
+        except OSError as error:
+            return {"event": "error", "message": str(error)}
+        slot_state = {"slides": slides, "slide": 0}
+        self.slots[slot] = slot_state
+        self.publish(slot, slot_state)
+        log(
+            "loaded {} slides of '{}' into slot {}".format(
+                len(slides), song_file_path, slot
+            )
+        )
+        return {"event": "loaded", "slide_count": len(slides)}
+
+
+async def handle_browser_source_message(
+    state: BrowserSourceState, websocket, message: dict
+) -> None:
+    action = message["action"]
+    slot = int(message.get("slot", 1))
+    if action == "subscribe":
+        state.subscribers.setdefault(slot, set()).add(websocket)
+        await websocket.send(json.dumps(state.get_slot_state(slot)))
+    elif action == "load":
+        await websocket.send(
+            json.dumps(
+                await state.load_song(
+                    slot, message["song"], message.get("structure", "")
+                )
+            )
+        )
+    elif action == "next":
+        state.move_to_slide(slot, state.get_slot_state(slot)["slide"] + 1)
+    elif action == "previous":
+        state.move_to_slide(slot, state.get_slot_state(slot)["slide"] - 1)
+    elif action == "goto":
+        state.move_to_slide(slot, int(message["slide"]))
+    else:
+        warn("unknown browser source action '{}'".format(action))
+
+
+async def handle_browser_source_connection(
+    state: BrowserSourceState, websocket
+) -> None:
+    try:
+        async for raw_message in websocket:
+            try:
+                message = json.loads(raw_message)
+                await handle_browser_source_message(state, websocket, message)
+            except (ValueError, KeyError, TypeError) as error:
+                warn("invalid browser source message: {}".format(error))
+    except websockets.exceptions.ConnectionClosed:
+        pass
+    finally:
+        for subscribers in state.subscribers.values():
+            subscribers.discard(websocket)
+
+
+async def serve_browser_source_websocket() -> None:
+    state = BrowserSourceState()
+    log(
+        "serving the browser source websocket on ws://{}:{}".format(
+            const.BROWSER_SOURCE_HOST, const.BROWSER_SOURCE_WEBSOCKET_PORT
+        )
+    )
+    async with websockets.serve(
+        lambda websocket: handle_browser_source_connection(state, websocket),
+        const.BROWSER_SOURCE_HOST,
+        const.BROWSER_SOURCE_WEBSOCKET_PORT,
+    ):
+        await asyncio.Future()  # Run forever
+
+
+def serve_browser_source() -> None:
+    Thread(
+        target=browser_source_webserver.run,
+        kwargs={
+            "host": const.BROWSER_SOURCE_HOST,
+            "port": const.BROWSER_SOURCE_HTTP_PORT,
+            "use_reloader": False,
+        },
+        daemon=True,
+    ).start()
+    log(
+        "serving the browser source page on http://{}:{}/?slot=1".format(
+            const.BROWSER_SOURCE_HOST, const.BROWSER_SOURCE_HTTP_PORT
+        )
+    )
+    asyncio.run(serve_browser_source_websocket())
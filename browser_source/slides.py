@@ -0,0 +1,63 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from slides import SLIDE_STYLES
+from slides.engine.generate_slides import split_structure_element
+from slides.engine.svg_image import SvgImage
+
+from slidegen import Slidegen
+
+
+# renders the slides of a song as svg documents in this process, which only
+# takes milliseconds, so that no slide images have to be generated at all
+def get_browser_source_slides(
+    song_file_path: str, chosen_structure: str
+) -> list[str]:
+    slide_style = SLIDE_STYLES["svg"]
+    slidegen = Slidegen(slide_style, song_file_path, "", chosen_structure)
+    slidegen.parse_file()
+    slidegen.calculate_desired_structures()
+
+    template_img = slide_style.song_template_form().get_template(
+        slidegen.metadata["title"]
+    )
+    slide_imgs: list[SvgImage] = [
+        slide_style.start_slide_form().get_slide(
+            template_img,
+            slidegen.metadata["book"],
+            slidegen.metadata["text"],
+            slidegen.metadata["melody"],
+        )
+    ]
+    song_slide = slide_style.song_slide_form()
+    for index, structure in enumerate(slidegen.chosen_structure):
+        inner_slide_texts = split_structure_element(
+            slidegen.songtext[structure]
+        )
+        for inner_slide, slide_text in enumerate(inner_slide_texts):
+            slide_imgs.append(
+                song_slide.get_slide(
+                    template_img=template_img,
+                    slide_text=slide_text,
+                    font_size=song_slide.get_text_fit(slide_text),
+                    song_structure=slidegen.chosen_structure,
+                    index=index,
+                    use_arrow=inner_slide != len(inner_slide_texts) - 1,
+                )
+            )
+    return [
+        slide_img.to_string(include_font_faces=False)
+        for slide_img in slide_imgs
+    ]
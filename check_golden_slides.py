@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import os
+import sys
+import argparse
+from contextlib import redirect_stdout
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+
+import colorama
+
+from benchmark import (
+    GOLDEN_SLIDE_DIR,
+    GOLDEN_SLIDE_STYLES,
+    use_golden_slide_config,
+    has_golden_slides,
+    render_golden_corpus,
+    render_golden_corpus_at_revision,
+    check_golden_slides,
+    update_golden_slides,
+)
+from utils import log, error_msg
+
+
+def parse_check_golden_slides_argv() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="check_golden_slides",
+        description="renders a fixed song corpus and compares the slides "
+        + "with the golden slides in '{}'.".format(GOLDEN_SLIDE_DIR),
+    )
+    parser.add_argument(
+        "--style",
+        choices=GOLDEN_SLIDE_STYLES,
+        action="append",
+        help="slide style to check, defaults to all styles",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="replace the golden slides with the rendered ones",
+    )
+    parser.add_argument(
+        "--revision",
+        type=str,
+        default="",
+        help="render the golden slides with the slidegen.py of this git "
+        + "revision instead of the working tree, requires --update",
+    )
+    parser.add_argument(
+        "--diff-dir",
+        type=str,
+        default="golden-slide-diffs",
+        help="directory the diff images of failed slides are written to",
+    )
+    args = parser.parse_args()
+    if args.revision and not args.update:
+        parser.error("--revision can only be used together with --update")
+    return args
+
+
+if __name__ == "__main__":
+    colorama.init()
+    args = parse_check_golden_slides_argv()
+
+    style_names = args.style or list(GOLDEN_SLIDE_STYLES)
+    use_golden_slide_config()
+
+    all_passed = True
+    for style_name in style_names:
+        # a style without golden slides must fail the check, instead of
+        # silently leaving it without regression coverage
+        if not args.update and not has_golden_slides(style_name):
+            log(
+                "{} style: no golden slides recorded, record them with "
+                "--update --style {}".format(style_name, style_name),
+                color="red",
+            )
+            all_passed = False
+            continue
+        start_time = default_timer()
+        with TemporaryDirectory() as corpus_dir:
+            with TemporaryDirectory() as dest:
+                if args.revision:
+                    slide_files = render_golden_corpus_at_revision(
+                        style_name, args.revision, corpus_dir, dest
+                    )
+                else:
+                    # the output of the renderers is only shown if they fail
+                    render_output = io.StringIO()
+                    try:
+                        with redirect_stdout(render_output):
+                            slide_files = render_golden_corpus(
+                                style_name, corpus_dir, dest
+                            )
+                    except SystemExit:
+                        print(render_output.getvalue(), end="")
+                        error_msg(
+                            "could not render the golden corpus with the "
+                            "{} style".format(style_name)
+                        )
+                if args.update:
+                    update_golden_slides(style_name, dest)
+                    log(
+                        "recorded {} golden slides of the {} style".format(
+                            len(slide_files), style_name
+                        ),
+                        color="green",
+                    )
+                    continue
+                results = check_golden_slides(style_name, dest, args.diff_dir)
+
+        for result in results:
+            if not result.passed:
+                log(
+                    "{}/{}: {}".format(
+                        style_name, result.filename, result.message
+                    ),
+                    color="red",
+                )
+        passed_count = sum(result.passed for result in results)
+        all_passed = all_passed and passed_count == len(results)
+        log(
+            "{} style: {} / {} slides match the golden slides "
+            "in {:.2f}s".format(
+                style_name,
+                passed_count,
+                len(results),
+                default_timer() - start_time,
+            ),
+            color="green" if passed_count == len(results) else "red",
+        )
+
+    if not all_passed:
+        if os.path.isdir(args.diff_dir):
+            log("wrote the diff images to '{}'".format(args.diff_dir))
+        sys.exit(1)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import argparse
+from tempfile import TemporaryDirectory
+
+import colorama
+
+from slides import SLIDE_STYLES, SequentialExecutor, wait_for_slides
+from slides.engine.pixel_diff import get_pixel_diff
+from utils import log, expand_dir
+
+import config as const
+import slidegen
+
+
+def parse_compare_slide_styles_argv() -> tuple:
+    parser = argparse.ArgumentParser(
+        prog="compare_slide_styles",
+        description="renders a song with the classic and the pillow slide "
+        + "style and reports how much the slides differ pixel by pixel. "
+        + "Exits with a nonzero status if a slide exceeds the tolerance.",
+    )
+    parser.add_argument("songfile", type=str, help="the input text file")
+    parser.add_argument(
+        "structure",
+        type=str,
+        help="the chosen song structure",
+        nargs="?",
+        default="",
+    )
+    parser.add_argument(
+        "--max-mean",
+        type=float,
+        default=const.STYLE_PARITY_MAX_MEAN,
+        help="largest allowed mean pixel difference of a slide",
+    )
+    parser.add_argument(
+        "--max-differing-share",
+        type=float,
+        default=const.STYLE_PARITY_MAX_DIFFERING_SHARE,
+        help="largest allowed share of differing pixels of a slide",
+    )
+    args = parser.parse_args()
+    return (
+        expand_dir(args.songfile),
+        args.structure,
+        args.max_mean,
+        args.max_differing_share,
+    )
+
+
+def render_song(style_name: str, song_file_path: str, structure: str, dest):
+    slidegen_instance = slidegen.Slidegen(
+        SLIDE_STYLES[style_name], song_file_path, dest, structure
+    )
+    return wait_for_slides(slidegen_instance.execute(SequentialExecutor()))
+
+
+if __name__ == "__main__":
+    colorama.init()
+    (
+        song_file_path,
+        structure,
+        allowed_mean_diff,
+        allowed_differing_share,
+    ) = parse_compare_slide_styles_argv()
+
+    max_mean_diff = 0.0
+    max_differing_share = 0.0
+    failed_slides = []
+    with TemporaryDirectory() as classic_dir:
+        with TemporaryDirectory() as pillow_dir:
+            classic_statuses = render_song(
+                "classic", song_file_path, structure, classic_dir
+            )
+            render_song("pillow", song_file_path, structure, pillow_dir)
+
+            for status in classic_statuses:
+                filename = os.path.basename(status.filename)
+                pillow_path = os.path.join(pillow_dir, filename)
+                if not os.path.isfile(pillow_path):
+                    log(
+                        "{}: not rendered by the pillow style".format(
+                            filename
+                        ),
+                        color="red",
+                    )
+                    failed_slides.append(filename)
+                    continue
+                pixel_diff = get_pixel_diff(status.filename, pillow_path)
+                passed = pixel_diff.within_tolerance(
+                    allowed_mean_diff, allowed_differing_share
+                )
+                if not passed:
+                    failed_slides.append(filename)
+                max_mean_diff = max(max_mean_diff, pixel_diff.mean_diff)
+                max_differing_share = max(
+                    max_differing_share, pixel_diff.differing_share
+                )
+                log(
+                    "{}: mean diff {:.2f}, {:.2%} differing pixels".format(
+                        filename,
+                        pixel_diff.mean_diff,
+                        pixel_diff.differing_share,
+                    ),
+                    color="green" if passed else "red",
+                )
+
+    log(
+        "largest mean diff {:.2f}, largest share of differing pixels "
+        "{:.2%}".format(max_mean_diff, max_differing_share),
+        color="red" if failed_slides else "green",
+    )
+    if failed_slides:
+        log(
+            "{} slides exceed the tolerance of a mean diff of {:.2f} and "
+            "{:.2%} differing pixels".format(
+                len(failed_slides), allowed_mean_diff, allowed_differing_share
+            ),
+            color="red",
+        )
+        sys.exit(1)
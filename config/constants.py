@@ -15,3 +15,15 @@
 
 CD_RECORD_FILENAME_ZFILL = 7
 HTTP_REQUEST_TIMEOUT_SECONDS = 7
+SONG_TEMPLATE_CACHE_SIZE = 2
+PRERENDER_CACHE_VERSION = 1
+SLIDE_CACHE_VERSION = 1
+PIXEL_DIFF_THRESHOLD = 64
+PIXEL_DIFF_MAX_MEAN = 2.0
+PIXEL_DIFF_MAX_DIFFERING_SHARE = 0.01
+STYLE_PARITY_MAX_MEAN = 8.0
+STYLE_PARITY_MAX_DIFFERING_SHARE = 0.05
+SETLIST_STRUCTURE_SEPARATOR = "|"
+LIBRARY_INDEX_VERSION = 3
+LIBRARY_INDEX_BUSY_TIMEOUT_SECONDS = 30
+LIBRARY_INDEX_COMMIT_BATCH_SIZE = 500
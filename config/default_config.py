@@ -13,12 +13,21 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+SLIDE_STYLE = "classic"
+
 IMAGE_FORMAT = "jpeg"
 FILE_EXTENSION = "jpg"
 FILE_NAMING = "slide-"
+JPEG_QUALITY = 92
+JPEG_SAMPLING_FACTOR = "4:4:4"
+PNG_COMPRESSION_LEVEL = 1
+WEBP_QUALITY = 90
+WEBP_LOSSLESS = False
+SVG_EMBED_FONTS = False
 
 WIDTH = 1920
 HEIGHT = 1080
+OUTPUT_RESOLUTIONS = []
 BG_COLOR = "white"
 FG_COLOR = "#6298a4"
 
@@ -70,17 +79,30 @@ ARROW_COLOR = "black"
 ARROW_X = 1725
 ARROW_Y = 900
 
+RENDER_BACKEND = "process"
+RENDER_MAX_WORKERS = 0
+RENDER_MAGICK_THREAD_LIMIT = 1
+RENDER_MAGICK_MEMORY_LIMIT_MEGABYTES = 0
+RENDER_DAEMON_SOCKET = ""
+
+SPRITE_CACHE_MAX_MEGABYTES = 128
+SLIDE_CACHE_DIR = ""
+SLIDE_CACHE_MAX_MEGABYTES = 500
+PRERENDER_CACHE_DIR = ""
+
 METADATA_STRINGS = ("title", "book", "text", "melody", "structure")
 
 RCLONE_REMOTE_DIR = ""
 RCLONE_LOCAL_DIR = ""
 
+SONG_PICKER = "search"
 FZF_ARGS = ""
 
 SSYNC_CACHE_DIR = ""
 SSYNC_CHECKFILE_NAMING = "slidegen-checkfile.txt"
 SSYNC_CACHEFILE_NAMING = "slidegen-cachefile.txt"
 SSYNC_CHOSEN_FILE_NAMING = "chosen-file.txt"
+SSYNC_LIBRARY_INDEX_NAMING = "library-index.sqlite3"
 SSYNC_SLIDESHOW_INPUT_NAMING = "Songslides "
 
 OBS_SLIDES_DIR = ""
@@ -93,6 +115,11 @@ OBS_WEBSOCKET_PORT = 4444
 OBS_WEBSOCKET_PASSWORD = ""
 OBS_SONG_SCENE_PREFIX = "song "
 
+BROWSER_SOURCE_ENABLED = False
+BROWSER_SOURCE_HOST = "localhost"
+BROWSER_SOURCE_HTTP_PORT = 8766
+BROWSER_SOURCE_WEBSOCKET_PORT = 8767
+
 CD_RECORD_CACHEFILE = ""
 CD_RECORD_OUTPUT_BASEDIR = ""
 CD_RECORD_FFMPEG_INPUT_ARGS = ""
@@ -14,6 +14,33 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from .parse_prompt import parse_prompt_input, generate_final_prompt
+from .song_document import (
+    SongDocument,
+    SongError,
+    SongSection,
+    parse_song_document,
+    parse_song_lines,
+)
+from .library_index import (
+    LibraryIndex,
+    IndexedSong,
+    LibraryRefresh,
+    get_song_file_paths,
+    get_library_index,
+    refresh_library_index,
+)
+from .song_cache import (
+    get_cached_song_document,
+    clear_cached_song_documents,
+)
+from .library_validator import (
+    SongValidation,
+    validate_song_file,
+    validate_song_files,
+    get_library_validation_report,
+)
+from .song_search import SongSearchIndex, SongSearchResult
+from .song_picker import choose_song
 from .parse_file import (
     parse_metadata,
     parse_songtext,
@@ -22,10 +49,15 @@ from .parse_file import (
 from .parse_argv import (
     parse_ssync_args_as_tuple,
     parse_slidegen_argv_as_tuple,
+    parse_slidegen_daemon_argv_as_tuple,
+    parse_rasterize_slides_argv_as_tuple,
+    parse_validate_library_argv_as_tuple,
     SsyncFlags,
 )
 from .validate_config import (
     validate_ssync_config,
+    validate_setlist_config,
+    validate_prerender_config,
     validate_obs_song_scene_switcher_config,
     validate_cd_record_config,
     validate_sermon_upload_config,
@@ -35,3 +67,4 @@ from .validate_config import (
     validate_obs_song_slides_switcher_config,
 )
 from .slide_selection_iterator import slide_selection_iterator
+from .setlist import SetlistEntry, parse_setlist, render_setlist
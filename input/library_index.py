@@ -0,0 +1,450 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import os
+import json
+import sqlite3
+from hashlib import sha256
+from dataclasses import dataclass, asdict
+from threading import Lock
+
+from utils import log, warn, expand_dir
+
+import config as const
+
+from .song_document import (
+    SongDocument,
+    SongError,
+    SongSection,
+    parse_song_lines,
+)
+
+LIBRARY_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_info (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS songs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    errors TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    path TEXT NOT NULL REFERENCES songs (path) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    line_number INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (path, name)
+);
+"""
+
+
+@dataclass
+class IndexedSong:
+    path: str
+    mtime_ns: int
+    size: int
+    content_hash: str
+    metadata: dict
+    errors: list[SongError]
+
+    @property
+    def structure(self) -> str | None:
+        return self.metadata.get("structure")
+
+
+@dataclass
+class LibraryRefresh:
+    parsed_count: int = 0
+    touched_count: int = 0
+    removed_count: int = 0
+    unchanged_count: int = 0
+
+
+# a song change without a stat removes the song from the index, one without
+# a song document only updates its mtime and size
+@dataclass
+class SongChange:
+    path: str
+    stat: os.stat_result | None = None
+    content_hash: str = ""
+    song_document: SongDocument | None = None
+
+
+def get_song_file_paths(rclone_local_dir: str) -> list[str]:
+    song_file_paths = []
+    for root, dirs, files in os.walk(rclone_local_dir):
+        dirs[:] = [
+            directory for directory in dirs if not directory.startswith(".")
+        ]
+        for file in files:
+            if not file.startswith("."):
+                song_file_paths.append(os.path.join(root, file))
+    song_file_paths.sort()
+    return song_file_paths
+
+
+# the parse results depend on these settings, so changing them invalidates
+# the whole index
+def get_parser_fingerprint() -> str:
+    return json.dumps(
+        [
+            const.LIBRARY_INDEX_VERSION,
+            list(const.METADATA_STRINGS),
+            const.STRUCTURE_ELEMENT_PER_LINE_CHAR_LIMIT,
+        ]
+    )
+
+
+def parse_song_content(song_file_path: str, content: bytes) -> SongDocument:
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError as error:
+        return SongDocument(
+            song_file_path,
+            metadata=dict.fromkeys(const.METADATA_STRINGS),
+            errors=[
+                SongError(
+                    "encoding", "not a valid utf-8 file: {}".format(error)
+                )
+            ],
+        )
+    # the lines are split like in a file opened in text mode, which turns
+    # crlf and cr line endings into plain line feeds
+    return parse_song_lines(
+        song_file_path, io.StringIO(text, newline=None).readlines()
+    )
+
+
+def get_song_change(
+    song_file_path: str,
+    indexed_song: tuple | None,
+    library_refresh: LibraryRefresh,
+) -> SongChange | None:
+    try:
+        stat = os.stat(song_file_path)
+        if indexed_song is not None and indexed_song[:2] == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            library_refresh.unchanged_count += 1
+            return None
+        with open(song_file_path, mode="rb") as song_file_reader:
+            content = song_file_reader.read()
+    except FileNotFoundError:
+        return None if indexed_song is None else SongChange(song_file_path)
+    except (PermissionError, IOError) as error:
+        warn("could not index '{}': {}".format(song_file_path, error))
+        return None
+
+    content_hash = sha256(content).hexdigest()
+    if indexed_song is not None and indexed_song[2] == content_hash:
+        library_refresh.touched_count += 1
+        return SongChange(song_file_path, stat)
+
+    library_refresh.parsed_count += 1
+    return SongChange(
+        song_file_path,
+        stat,
+        content_hash,
+        parse_song_content(song_file_path, content),
+    )
+
+
+# keeps the parse results of every song in the library in sqlite, so that
+# its metadata and sections can be looked up without opening the song file.
+# Songs are keyed by their absolute path and only parsed again when their
+# mtime or size changed and their content hash as well.
+class LibraryIndex:
+    def __init__(self, index_file_path: str, library_dir: str) -> None:
+        self.library_dir = library_dir
+        self.lock = Lock()
+        # other processes may refresh the same index at the same time, in
+        # which case writes wait for them instead of failing right away
+        self.connection = sqlite3.connect(
+            index_file_path,
+            timeout=const.LIBRARY_INDEX_BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+        )
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.prepare_schema()
+
+    def prepare_schema(self) -> None:
+        with self.lock, self.connection:
+            self.connection.executescript(LIBRARY_INDEX_SCHEMA)
+            row = self.connection.execute(
+                "SELECT value FROM index_info WHERE key = 'parser'"
+            ).fetchone()
+            if row is None or row[0] != get_parser_fingerprint():
+                self.connection.execute("DELETE FROM songs")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO index_info VALUES ('parser', ?)",
+                    (get_parser_fingerprint(),),
+                )
+
+    # the songs are read and parsed without holding the write lock of the
+    # database, which is only taken to write a batch of changed songs. So
+    # other processes can use the index while a large library is refreshed.
+    def refresh(self) -> LibraryRefresh:
+        library_refresh = LibraryRefresh()
+        with self.lock:
+            indexed_songs = {
+                path: (mtime_ns, size, content_hash)
+                for path, mtime_ns, size, content_hash in (
+                    self.connection.execute(
+                        "SELECT path, mtime_ns, size, content_hash FROM songs"
+                    )
+                )
+            }
+        song_changes = []
+        for song_file_path in get_song_file_paths(self.library_dir):
+            song_change = get_song_change(
+                song_file_path,
+                indexed_songs.pop(song_file_path, None),
+                library_refresh,
+            )
+            if song_change is not None:
+                song_changes.append(song_change)
+            if len(song_changes) >= const.LIBRARY_INDEX_COMMIT_BATCH_SIZE:
+                self.write_song_changes(song_changes)
+                song_changes = []
+        # this also removes songs from outside of the library, which older
+        # versions of the index kept
+        for song_file_path in indexed_songs:
+            song_changes.append(SongChange(song_file_path))
+            library_refresh.removed_count += 1
+        self.write_song_changes(song_changes)
+        return library_refresh
+
+    def write_song_changes(self, song_changes: list[SongChange]) -> None:
+        with self.lock, self.connection:
+            for song_change in song_changes:
+                self.write_song_change(song_change)
+
+    def write_song_change(self, song_change: SongChange) -> None:
+        if song_change.stat is None:
+            self.connection.execute(
+                "DELETE FROM songs WHERE path = ?", (song_change.path,)
+            )
+            return
+        if song_change.song_document is None:
+            self.connection.execute(
+                "UPDATE songs SET mtime_ns = ?, size = ? WHERE path = ?",
+                (
+                    song_change.stat.st_mtime_ns,
+                    song_change.stat.st_size,
+                    song_change.path,
+                ),
+            )
+            return
+
+        song_document = song_change.song_document
+        self.connection.execute(
+            "DELETE FROM songs WHERE path = ?", (song_change.path,)
+        )
+        self.connection.execute(
+            "INSERT INTO songs VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                song_change.path,
+                song_change.stat.st_mtime_ns,
+                song_change.stat.st_size,
+                song_change.content_hash,
+                json.dumps(song_document.metadata, ensure_ascii=False),
+                json.dumps(
+                    [asdict(error) for error in song_document.errors],
+                    ensure_ascii=False,
+                ),
+            ),
+        )
+        self.connection.executemany(
+            "INSERT INTO sections VALUES (?, ?, ?, ?)",
+            [
+                (
+                    song_change.path,
+                    section.name,
+                    section.line_number,
+                    section.text,
+                )
+                for section in song_document.sections.values()
+            ],
+        )
+
+    # makes sure a single song is up to date, which only costs a stat call
+    # if it did not change since it was indexed
+    def get_song(self, song_file_path: str) -> IndexedSong | None:
+        song_file_path = os.path.abspath(song_file_path)
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT * FROM songs WHERE path = ?", (song_file_path,)
+            ).fetchone()
+        song_change = get_song_change(
+            song_file_path,
+            None if row is None else row[1:4],
+            LibraryRefresh(),
+        )
+        if song_change is None:
+            return None if row is None else get_indexed_song(row)
+        self.write_song_changes([song_change])
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT * FROM songs WHERE path = ?", (song_file_path,)
+            ).fetchone()
+        return None if row is None else get_indexed_song(row)
+
+    def is_library_song(self, song_file_path: str) -> bool:
+        if self.library_dir == "":
+            return False
+        try:
+            return (
+                os.path.commonpath(
+                    [self.library_dir, os.path.abspath(song_file_path)]
+                )
+                == self.library_dir
+            )
+        except ValueError:
+            return False
+
+    def get_songs(self) -> list[IndexedSong]:
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT * FROM songs ORDER BY path"
+            ).fetchall()
+        return [get_indexed_song(row) for row in rows]
+
+    def get_sections(self, song_file_path: str) -> dict[str, SongSection]:
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT name, line_number, text FROM sections WHERE path = ? "
+                "ORDER BY line_number",
+                (os.path.abspath(song_file_path),),
+            ).fetchall()
+        return {
+            name: SongSection(name, line_number, text.split("\n"))
+            for name, line_number, text in rows
+        }
+
+    def get_invalid_song_count(self) -> int:
+        with self.lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM songs WHERE errors != '[]'"
+            ).fetchone()[0]
+
+    def get_lyrics(self) -> dict[str, str]:
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT path, GROUP_CONCAT(text, char(10)) FROM sections "
+                "GROUP BY path"
+            ).fetchall()
+        return dict(rows)
+
+    def get_song_document(self, song_file_path: str) -> SongDocument | None:
+        try:
+            indexed_song = self.get_song(song_file_path)
+        except sqlite3.OperationalError as error:
+            # if another process holds the index for longer than the busy
+            # timeout, the song is parsed without it
+            warn("could not use the song library index: {}".format(error))
+            return read_song_document(song_file_path)
+        if indexed_song is None:
+            return None
+        return SongDocument(
+            indexed_song.path,
+            indexed_song.metadata,
+            self.get_sections(indexed_song.path),
+            indexed_song.errors,
+        )
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+def read_song_document(song_file_path: str) -> SongDocument | None:
+    song_file_path = os.path.abspath(song_file_path)
+    try:
+        with open(song_file_path, mode="rb") as song_file_reader:
+            return parse_song_content(song_file_path, song_file_reader.read())
+    except (FileNotFoundError, PermissionError, IOError):
+        return None
+
+
+def get_indexed_song(row: tuple) -> IndexedSong:
+    path, mtime_ns, size, content_hash, metadata, errors = row
+    return IndexedSong(
+        path,
+        mtime_ns,
+        size,
+        content_hash,
+        json.loads(metadata),
+        [SongError(**error) for error in json.loads(errors)],
+    )
+
+
+library_indices: dict[str, LibraryIndex] = {}
+library_indices_lock = Lock()
+
+
+# without an ssync cache directory, the index only lives as long as the
+# process
+def get_library_index() -> LibraryIndex:
+    if const.SSYNC_CACHE_DIR == "":
+        index_file_path = ":memory:"
+    else:
+        cache_dir = expand_dir(const.SSYNC_CACHE_DIR)
+        os.makedirs(cache_dir, exist_ok=True)
+        index_file_path = os.path.join(
+            cache_dir, const.SSYNC_LIBRARY_INDEX_NAMING
+        )
+    with library_indices_lock:
+        if index_file_path not in library_indices:
+            library_indices[index_file_path] = LibraryIndex(
+                index_file_path,
+                (
+                    expand_dir(const.RCLONE_LOCAL_DIR)
+                    if const.RCLONE_LOCAL_DIR
+                    else ""
+                ),
+            )
+        return library_indices[index_file_path]
+
+
+def refresh_library_index() -> LibraryIndex:
+    log("refreshing song library index...")
+    library_index = get_library_index()
+    try:
+        library_refresh = library_index.refresh()
+    except sqlite3.OperationalError as error:
+        warn("could not refresh the song library index: {}".format(error))
+        return library_index
+    log(
+        "indexed songs: {} parsed, {} touched, {} removed, "
+        "{} unchanged".format(
+            library_refresh.parsed_count,
+            library_refresh.touched_count,
+            library_refresh.removed_count,
+            library_refresh.unchanged_count,
+        )
+    )
+    invalid_song_count = library_index.get_invalid_song_count()
+    if invalid_song_count:
+        warn(
+            "{} songs have problems, run validate_library.py for "
+            "details".format(invalid_song_count)
+        )
+    return library_index
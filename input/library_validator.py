@@ -0,0 +1,89 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import multiprocessing
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+
+from .library_index import parse_song_content
+from .song_document import SongError
+
+
+@dataclass
+class SongValidation:
+    path: str
+    errors: list[SongError]
+
+
+# never exits, so that a single invalid song does not stop the validation of
+# the whole library
+def validate_song_file(song_file_path: str) -> SongValidation:
+    try:
+        with open(song_file_path, mode="rb") as song_file_reader:
+            content = song_file_reader.read()
+    except (FileNotFoundError, PermissionError, IOError) as error:
+        return SongValidation(
+            song_file_path, [SongError("unreadable", str(error))]
+        )
+    return SongValidation(
+        song_file_path, parse_song_content(song_file_path, content).errors
+    )
+
+
+def validate_song_files(
+    song_file_paths: list[str], workers: int
+) -> list[SongValidation]:
+    if workers == 1:
+        return [
+            validate_song_file(song_file_path)
+            for song_file_path in song_file_paths
+        ]
+    # a single song parses in well under a millisecond, so the songs are
+    # sent to the workers in a few large chunks
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(
+            executor.map(
+                validate_song_file,
+                song_file_paths,
+                chunksize=max(1, len(song_file_paths) // (workers * 4)),
+            )
+        )
+
+
+def get_library_validation_report(
+    library_dir: str, validations: list[SongValidation], seconds: float
+) -> dict:
+    invalid_validations = [
+        validation for validation in validations if validation.errors
+    ]
+    return {
+        "library_dir": library_dir,
+        "song_count": len(validations),
+        "invalid_song_count": len(invalid_validations),
+        "error_count": sum(
+            len(validation.errors) for validation in invalid_validations
+        ),
+        "seconds": seconds,
+        "songs": [
+            {
+                "path": os.path.relpath(validation.path, library_dir),
+                "errors": [asdict(error) for error in validation.errors],
+            }
+            for validation in invalid_validations
+        ],
+    }
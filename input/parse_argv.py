@@ -13,10 +13,36 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 import argparse
 from dataclasses import dataclass
 
 from utils import log, error_msg, expand_dir
+from slides import RenderBackend
+
+import config as const
+
+
+def add_render_backend_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-b",
+        "--backend",
+        help="the backend used to render the slides (default: {})".format(
+            const.RENDER_BACKEND
+        ),
+        choices=[backend.value for backend in RenderBackend],
+        default=const.RENDER_BACKEND,
+    )
+
+
+def add_trace_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--trace",
+        help="writes the timings of all slide generation stages as a chrome "
+        + "trace to the given json file",
+        metavar="TRACE_FILE",
+        default="",
+    )
 
 
 def parse_slidegen_argv_as_tuple() -> tuple:
@@ -27,11 +53,15 @@ def parse_slidegen_argv_as_tuple() -> tuple:
         "songfile",
         type=str,
         help="the input text file (with header and body)",
+        nargs="?",
+        default="",
     )
     parser.add_argument(
         "output",
         type=str,
         help="output directory where the generated slides are placed",
+        nargs="?",
+        default="",
     )
     parser.add_argument(
         "structure",
@@ -40,9 +70,40 @@ def parse_slidegen_argv_as_tuple() -> tuple:
         nargs="?",
         default="",
     )
+    add_render_backend_argument(parser)
+    add_trace_argument(parser)
+    parser.add_argument(
+        "--no-daemon",
+        help="always render in this process, even if a render daemon is "
+        + "running",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--setlist",
+        help="renders every song of the setlist file into its obs slot "
+        + "instead of a single song",
+        metavar="SETLIST_FILE",
+        default="",
+    )
 
     args = parser.parse_args()
 
+    trace_file_path = expand_dir(args.trace) if args.trace else ""
+    if args.setlist:
+        if args.songfile:
+            parser.error("a setlist cannot be combined with a song file")
+        return (
+            "",
+            "",
+            "",
+            RenderBackend(args.backend),
+            trace_file_path,
+            False,
+            expand_dir(args.setlist),
+        )
+    if not args.output:
+        parser.error("the song file and output directory are required")
+
     try:
         song_file_path = expand_dir(args.songfile)
         output_dir = expand_dir(args.output)
@@ -56,7 +117,15 @@ def parse_slidegen_argv_as_tuple() -> tuple:
         chosen_structure = ""
 
     log("parsing '{}'...".format(song_file_path))
-    return song_file_path, output_dir, chosen_structure
+    return (
+        song_file_path,
+        output_dir,
+        chosen_structure,
+        RenderBackend(args.backend),
+        trace_file_path,
+        not args.no_daemon,
+        "",
+    )
 
 
 def parse_ssync_args_as_tuple() -> tuple:
@@ -66,19 +135,112 @@ def parse_ssync_args_as_tuple() -> tuple:
         + "you choose songs to generate slides for using fzf.",
     )
     parser.add_argument(
-        "-o", "--offline", help="skips syncing with remote", action="store_true"
+        "-o",
+        "--offline",
+        help="skips syncing with remote",
+        action="store_true",
     )
     parser.add_argument(
         "-s",
         "--sequential",
-        help="disables async slide generation",
+        help="disables async slide generation, same as '--backend sequential'",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--stream",
+        help="puts the slides of a song into obs as soon as they are "
+        + "rendered, instead of at the end of the session",
         action="store_true",
     )
+    add_render_backend_argument(parser)
+    add_trace_argument(parser)
+    args = parser.parse_args()
+    trace_file_path = expand_dir(args.trace) if args.trace else ""
+    render_backend = (
+        RenderBackend.SEQUENTIAL
+        if args.sequential
+        else RenderBackend(args.backend)
+    )
+    return args.offline, render_backend, trace_file_path, args.stream
+
+
+def parse_slidegen_daemon_argv_as_tuple() -> tuple:
+    parser = argparse.ArgumentParser(
+        prog="slidegen_daemon",
+        description="slidegen_daemon - keeps a slide renderer running, "
+        + "that slidegen.py hands its songs to.",
+    )
+    add_render_backend_argument(parser)
     args = parser.parse_args()
-    return args.offline, args.sequential
+    return (RenderBackend(args.backend),)
+
+
+def parse_rasterize_slides_argv_as_tuple() -> tuple:
+    parser = argparse.ArgumentParser(
+        prog="rasterize_slides",
+        description="rasterize_slides - converts svg slides into images "
+        + "for consumers that need bitmaps.",
+    )
+    parser.add_argument(
+        "slides_dirs",
+        type=str,
+        nargs="+",
+        help="directories containing the svg slides",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["jpeg", "png", "webp"],
+        default="jpeg",
+        help="image format of the rasterized slides",
+    )
+    args = parser.parse_args()
+    slides_dirs = [expand_dir(slides_dir) for slides_dir in args.slides_dirs]
+    return slides_dirs, args.format
+
+
+def parse_validate_library_argv_as_tuple() -> tuple:
+    parser = argparse.ArgumentParser(
+        prog="validate_library",
+        description="validate_library - checks every song file of the "
+        + "library and reports all problems at once.",
+    )
+    parser.add_argument(
+        "library_dir",
+        type=str,
+        nargs="?",
+        default=const.RCLONE_LOCAL_DIR,
+        help="the song directory (default: RCLONE_LOCAL_DIR)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="",
+        help="file the json report is written to",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes (default: one per cpu core)",
+    )
+    args = parser.parse_args()
+    if not args.library_dir:
+        parser.error("no library directory given and RCLONE_LOCAL_DIR unset")
+    if args.workers < 1:
+        parser.error("the number of workers must be positive")
+    return (
+        expand_dir(args.library_dir),
+        expand_dir(args.output) if args.output else "",
+        args.workers,
+    )
 
 
 @dataclass
 class SsyncFlags:
     offline_enabled: bool
-    disable_async_enabled: bool
+    render_backend: RenderBackend
+    trace_file_path: str
+    stream_enabled: bool
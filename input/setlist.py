@@ -0,0 +1,172 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from dataclasses import dataclass
+from concurrent.futures import Future
+from timeit import default_timer
+
+from utils import (
+    log,
+    error_msg,
+    expand_dir,
+    trace_span,
+    clear_obs_slides_dir,
+    create_min_obs_subdirs,
+)
+from slides import (
+    SlideStyle,
+    RenderBackend,
+    RenderScheduler,
+    get_slide_executor,
+    get_render_worker_count,
+    wait_for_slides,
+    copy_prerendered_slides,
+)
+
+import config as const
+
+from browser_source import load_song_into_browser_source
+
+from .parse_prompt import generate_final_prompt
+from .validate_config import validate_setlist_config
+from .slide_selection_iterator import (
+    add_slides_to_obs_slideshow_inputs,
+    create_and_get_dest_dir,
+    generate_slides_for_selected_song,
+    get_structure_for_prompt,
+)
+
+
+@dataclass
+class SetlistEntry:
+    slot: int
+    song_file_path: str
+    structure: str
+
+
+# every line of a setlist fills the next obs slot with a song file, which is
+# either absolute or relative to RCLONE_LOCAL_DIR, optionally followed by the
+# separator and the chosen structure. Empty lines and comments are skipped.
+def parse_setlist(setlist_file_path: str) -> list[SetlistEntry]:
+    try:
+        with open(
+            setlist_file_path, mode="r", encoding="utf-8-sig"
+        ) as file_reader:
+            lines = file_reader.readlines()
+    except (FileNotFoundError, PermissionError, IOError) as error:
+        error_msg(
+            "could not read setlist '{}'. Reason: {}".format(
+                setlist_file_path, error
+            )
+        )
+
+    rclone_local_dir = expand_dir(const.RCLONE_LOCAL_DIR)
+    setlist = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        song_file, _, structure = line.partition(
+            const.SETLIST_STRUCTURE_SEPARATOR
+        )
+        song_file_path = os.path.join(
+            rclone_local_dir, os.path.expanduser(song_file.strip())
+        )
+        if not os.path.isfile(song_file_path):
+            error_msg(
+                "song file '{}' in line {} of '{}' does not exist".format(
+                    song_file_path, line_number, setlist_file_path
+                )
+            )
+        setlist.append(
+            SetlistEntry(len(setlist) + 1, song_file_path, structure.strip())
+        )
+    if not setlist:
+        error_msg("setlist '{}' contains no songs".format(setlist_file_path))
+    return setlist
+
+
+def submit_setlist_entry(
+    scheduler: RenderScheduler, slide_style: SlideStyle, entry: SetlistEntry
+) -> list[Future]:
+    dest_dir = create_and_get_dest_dir(
+        expand_dir(const.OBS_SLIDES_DIR), entry.slot
+    )
+    full_song_structure = get_structure_for_prompt(entry.song_file_path)
+    calculated_prompt = generate_final_prompt(
+        entry.structure, full_song_structure
+    )
+    log(
+        "generating slides '{}' to '{}{}'...".format(
+            os.path.basename(entry.song_file_path),
+            const.OBS_SUBDIR_NAMING,
+            entry.slot,
+        )
+    )
+    if const.BROWSER_SOURCE_ENABLED:
+        load_song_into_browser_source(
+            entry.slot, entry.song_file_path, calculated_prompt
+        )
+        return []
+    if calculated_prompt == full_song_structure and (
+        copy_prerendered_slides(slide_style, entry.song_file_path, dest_dir)
+    ):
+        return []
+    return generate_slides_for_selected_song(
+        slide_style,
+        entry.song_file_path,
+        dest_dir,
+        calculated_prompt,
+        scheduler.get_slot_executor(entry.slot),
+    )
+
+
+# renders all songs of a setlist in one pool, with the caches of the render
+# workers shared between the songs, and updates obs only once at the end
+def render_setlist(
+    setlist: list[SetlistEntry],
+    slide_style: SlideStyle,
+    render_backend: RenderBackend,
+) -> None:
+    validate_setlist_config()
+    clear_obs_slides_dir()
+
+    start_time = default_timer()
+    with get_slide_executor(render_backend) as executor:
+        scheduler = RenderScheduler(
+            executor,
+            (
+                1
+                if render_backend == RenderBackend.SEQUENTIAL
+                else get_render_worker_count()
+            ),
+        )
+        futures = []
+        for entry in setlist:
+            futures += submit_setlist_entry(scheduler, slide_style, entry)
+        statuses = wait_for_slides(futures)
+    create_min_obs_subdirs()
+    log(
+        "rendered {} slides of {} songs in {:.2f}s".format(
+            len(statuses), len(setlist), default_timer() - start_time
+        ),
+        color="green",
+    )
+
+    if const.BROWSER_SOURCE_ENABLED:
+        return
+    with trace_span("update obs slideshow inputs"):
+        add_slides_to_obs_slideshow_inputs(len(setlist), interactive=False)
@@ -0,0 +1,178 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import Future
+from pathlib import Path
+from queue import Queue
+from threading import Lock, Thread
+import contextlib
+import io
+import re
+
+import obsws_python as obs
+
+from utils import log, warn
+
+import config as const
+
+
+def get_slide_file_pattern() -> re.Pattern:
+    return re.compile(
+        rf"{const.FILE_NAMING}(\d+)\.{re.escape(const.FILE_EXTENSION)}$",
+        re.IGNORECASE,
+    )
+
+
+def get_numbered_slide_files(folder: Path) -> list[tuple[int, str]]:
+    pattern = get_slide_file_pattern()
+    slides = []
+    for p in folder.iterdir():
+        m = pattern.match(p.name)
+        if m:
+            slides.append((int(m.group(1)), str(p.resolve())))
+    slides.sort(key=lambda x: x[0])
+    return slides
+
+
+def get_ordered_slide_files(folder: Path) -> list[dict]:
+    return [{"value": path} for _, path in get_numbered_slide_files(folder)]
+
+
+# slides can finish out of order, so only the slides up to the first missing
+# one are shown, to never let the slideshow skip over a slide
+def get_finished_slide_files(folder: Path) -> list[dict]:
+    finished_slides = []
+    for expected_number, (number, path) in enumerate(
+        get_numbered_slide_files(folder), start=1
+    ):
+        if number != expected_number:
+            break
+        finished_slides.append({"value": path})
+    return finished_slides
+
+
+def get_slideshow_input_name(folder: Path) -> str:
+    return (
+        f"{const.SSYNC_SLIDESHOW_INPUT_NAMING}"
+        + f"{str(folder.name)[len(const.OBS_SUBDIR_NAMING) :]}"
+    )
+
+
+def connect_to_obs() -> obs.ReqClient:
+    # suppress stderr from obsws_python internals
+    with contextlib.redirect_stderr(io.StringIO()):
+        return obs.ReqClient(
+            host=const.OBS_WEBSOCKET_HOSTNAME,
+            port=const.OBS_WEBSOCKET_PORT,
+            password=const.OBS_WEBSOCKET_PASSWORD,
+        )
+
+
+def set_slideshow_input_files(
+    client: obs.ReqClient, source: str, ordered_files: list[dict]
+) -> None:
+    with contextlib.redirect_stderr(io.StringIO()):
+        current_settings = client.get_input_settings(
+            source
+        ).input_settings  # type: ignore
+
+        new_settings = dict(current_settings)
+        new_settings["files"] = ordered_files
+
+        client.set_input_settings(
+            name=source,
+            settings=new_settings,
+            overlay=False,
+        )
+
+
+# publishes the slides of a song to its obs slideshow input while the rest of
+# the song is still rendering. OBS is only contacted from a single background
+# thread, so that the render workers never wait on the websocket.
+class StreamingSlidePublisher:
+    def __init__(self) -> None:
+        self.folders: Queue[Path | None] = Queue()
+        self.published_slide_counts: dict[Path, int] = {}
+        self.lock = Lock()
+        self.client: obs.ReqClient | None = None
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def slide_done(self, future: Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        status = future.result()
+        if status.success:
+            self.publish(Path(status.filename).parent)
+
+    def publish(self, folder: str | Path) -> None:
+        self.folders.put(Path(folder))
+
+    # the slides of a cleared song slot are gone, so the next song in it has
+    # to be published from its first slide again
+    def forget(self, folder: str | Path) -> None:
+        with self.lock:
+            self.published_slide_counts.pop(Path(folder), None)
+
+    def stop(self) -> None:
+        self.folders.put(None)
+        self.thread.join()
+
+    def run(self) -> None:
+        while True:
+            folder = self.folders.get()
+            if folder is None:
+                return
+            pending_folders = {folder}
+            # coalesces the updates of slides that finished in the meantime
+            while not self.folders.empty():
+                next_folder = self.folders.get()
+                if next_folder is None:
+                    self.publish_folders(pending_folders)
+                    return
+                pending_folders.add(next_folder)
+            self.publish_folders(pending_folders)
+
+    def publish_folders(self, folders: set[Path]) -> None:
+        for folder in sorted(folders):
+            with self.lock:
+                self.publish_folder(folder)
+
+    def publish_folder(self, folder: Path) -> None:
+        try:
+            finished_slides = get_finished_slide_files(folder)
+        except FileNotFoundError:
+            return
+        if len(finished_slides) <= self.published_slide_counts.get(folder, 0):
+            return
+        source = get_slideshow_input_name(folder)
+        try:
+            if self.client is None:
+                self.client = connect_to_obs()
+            set_slideshow_input_files(self.client, source, finished_slides)
+        except (
+            ConnectionError,
+            obs.error.OBSSDKError,  # type: ignore
+        ) as error:
+            # the final update at the end of the session asks the user to
+            # fix the obs setup, so streaming just skips the update
+            self.client = None
+            warn("could not stream slides to '{}': {}".format(source, error))
+            return
+        self.published_slide_counts[folder] = len(finished_slides)
+        log(
+            "streamed {} slides to '{}'.".format(len(finished_slides), source),
+            color="cyan",
+        )
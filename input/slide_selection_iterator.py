@@ -14,32 +14,94 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
-from threading import Thread
+import shutil
+from concurrent.futures import Executor, Future, wait
 from pathlib import Path
-import contextlib
-import io
-import re
 
 import obsws_python as obs
 
 from utils import (
     log,
+    warn,
+    trace_span,
     create_min_obs_subdirs,
     error_msg,
     expand_dir,
 )
-from input import parse_metadata, generate_final_prompt
-from slides import SlideStyle
+from input import (
+    generate_final_prompt,
+    get_library_index,
+    get_cached_song_document,
+)
+from slides import (
+    SlideStyle,
+    RenderBackend,
+    get_slide_executor,
+    get_render_worker_count,
+    warm_up_render_workers,
+    RenderScheduler,
+    wait_for_slides,
+    copy_prerendered_slides,
+)
 
 import config as const
 
 import slidegen
+from browser_source import load_song_into_browser_source
+
+from .song_picker import (
+    song_search_enabled,
+    build_song_search_index_in_background,
+    choose_song,
+)
+from .slide_publisher import (
+    StreamingSlidePublisher,
+    get_ordered_slide_files,
+    get_slideshow_input_name,
+    connect_to_obs,
+    set_slideshow_input_files,
+)
 
 
 def slide_selection_iterator(
-    disable_async_enabled: bool, slide_style: SlideStyle
+    render_backend: RenderBackend,
+    slide_style: SlideStyle,
+    stream_enabled: bool = False,
 ) -> None:
-    iterator_prompt = "Exit now? [y/N]: "
+    publisher = StreamingSlidePublisher() if stream_enabled else None
+    with get_slide_executor(render_backend) as executor:
+        if stream_enabled:
+            warm_up_render_workers(executor)
+        scheduler = RenderScheduler(
+            executor,
+            (
+                1
+                if render_backend == RenderBackend.SEQUENTIAL
+                else get_render_worker_count()
+            ),
+            boost_first_slides=stream_enabled,
+        )
+        futures = choose_and_submit_songs(scheduler, slide_style, publisher)
+
+        log("waiting for subprocesses to finish ...")
+        wait_for_slides(futures)
+        log("subprocesses finished.")
+    if publisher is not None:
+        publisher.stop()
+
+    remove_chosenfile()
+    if const.BROWSER_SOURCE_ENABLED:
+        return
+    with trace_span("update obs slideshow inputs"):
+        add_slides_to_obs_slideshow_inputs()
+
+
+def choose_and_submit_songs(
+    scheduler: RenderScheduler,
+    slide_style: SlideStyle,
+    publisher: StreamingSlidePublisher | None = None,
+) -> list[Future]:
+    iterator_prompt = "Exit now? [y/N/r to re-pick the previous song]: "
     structure_prompt = (
         "Choose song structure (leave blank for full song)"
         + " eg. [1,R,2,R] / [1-4]: "
@@ -47,28 +109,54 @@ def slide_selection_iterator(
     rclone_local_dir = expand_dir(const.RCLONE_LOCAL_DIR)
 
     song_counter = 0
-    threads = []
+    futures_per_slot: dict[int, list[Future]] = {}
+    search_index_future = (
+        build_song_search_index_in_background(get_library_index())
+        if song_search_enabled()
+        else None
+    )
     while True:
         song_counter += 1
         input_prompt_prefix = "[{}{}] ".format(
             const.OBS_SUBDIR_NAMING, song_counter
         )
-        prompt_answer = str(input(input_prompt_prefix + iterator_prompt))
+        prompt_answer = str(
+            input(
+                input_prompt_prefix
+                + get_render_progress_info(scheduler)
+                + iterator_prompt
+            )
+        )
         if prompt_answer.lower() == "y":
             create_min_obs_subdirs()
             break
-
-        os.system(
-            "cd {} && fzf {} > {}".format(
-                rclone_local_dir,
-                const.FZF_ARGS,
-                os.path.join(
-                    const.SSYNC_CACHE_DIR, const.SSYNC_CHOSEN_FILE_NAMING
-                ),
+        if prompt_answer.lower() == "r" and song_counter > 1:
+            song_counter -= 1
+            input_prompt_prefix = "[{}{}] ".format(
+                const.OBS_SUBDIR_NAMING, song_counter
+            )
+            clear_song_slot(
+                scheduler,
+                song_counter,
+                futures_per_slot.pop(song_counter, []),
+                publisher,
             )
-        )
 
-        chosen_song_file = read_chosen_song_file()
+        if search_index_future is not None:
+            chosen_song_file = choose_song(
+                search_index_future, input_prompt_prefix + "> "
+            )
+        else:
+            os.system(
+                "cd {} && fzf {} > {}".format(
+                    rclone_local_dir,
+                    const.FZF_ARGS,
+                    os.path.join(
+                        const.SSYNC_CACHE_DIR, const.SSYNC_CHOSEN_FILE_NAMING
+                    ),
+                )
+            )
+            chosen_song_file = read_chosen_song_file()
 
         if len(chosen_song_file) == 0:
             log("no slides chosen, skipping...")
@@ -78,9 +166,7 @@ def slide_selection_iterator(
                 expand_dir(const.OBS_SLIDES_DIR), song_counter
             )
 
-            full_song_structure = get_structure_for_prompt(
-                slide_style, src_dir, dest_dir
-            )
+            full_song_structure = get_structure_for_prompt(src_dir)
             log(
                 "full song structure of '{}':\n{}".format(
                     chosen_song_file,
@@ -99,85 +185,111 @@ def slide_selection_iterator(
                 )
             )
 
-            threads.extend(
-                generate_slides_for_selected_song(
-                    slide_style,
-                    src_dir,
-                    dest_dir,
-                    generate_final_prompt(
-                        structure_prompt_answer, full_song_structure
-                    ),
-                    disable_async_enabled,
+            calculated_prompt = generate_final_prompt(
+                structure_prompt_answer, full_song_structure
+            )
+            if const.BROWSER_SOURCE_ENABLED:
+                load_song_into_browser_source(
+                    song_counter, src_dir, calculated_prompt
                 )
+                continue
+            if calculated_prompt == full_song_structure and (
+                copy_prerendered_slides(slide_style, src_dir, dest_dir)
+            ):
+                if publisher is not None:
+                    publisher.publish(dest_dir)
+                continue
+
+            song_futures = generate_slides_for_selected_song(
+                slide_style,
+                src_dir,
+                dest_dir,
+                calculated_prompt,
+                scheduler.get_slot_executor(song_counter),
             )
+            if publisher is not None:
+                for future in song_futures:
+                    future.add_done_callback(publisher.slide_done)
+            futures_per_slot[song_counter] = song_futures
+
+    return [
+        future
+        for slot in sorted(futures_per_slot)
+        for future in futures_per_slot[slot]
+    ]
+
+
+def get_render_progress_info(scheduler: RenderScheduler) -> str:
+    progress = scheduler.get_progress()
+    if progress.total == 0:
+        return ""
+    return "({} queued, {} rendering, {} / {} done) ".format(
+        progress.queued, progress.rendering, progress.done, progress.total
+    )
 
-    log("waiting for subprocesses to finish ...")
-    for thread in threads:
-        if thread.is_alive():
-            thread.join()
-    log("subprocesses finished.")
-
-    remove_chosenfile()
-    add_slides_to_obs_slideshow_inputs()
 
+# cancels the slides of a song slot that did not start rendering yet, waits
+# for the rest and removes its slides, so that the slot can be chosen again
+def clear_song_slot(
+    scheduler: RenderScheduler,
+    slot: int,
+    slot_futures: list[Future],
+    publisher: StreamingSlidePublisher | None,
+) -> None:
+    scheduler.cancel_slot(slot)
+    wait([future for future in slot_futures if not future.cancelled()])
+    dest_dir = os.path.join(
+        expand_dir(const.OBS_SLIDES_DIR), const.OBS_SUBDIR_NAMING + str(slot)
+    )
+    if os.path.isdir(dest_dir):
+        shutil.rmtree(dest_dir)
+    if publisher is not None:
+        publisher.forget(dest_dir)
+    log(
+        "cleared '{}{}', choose its song again.".format(
+            const.OBS_SUBDIR_NAMING, slot
+        )
+    )
 
-def add_slides_to_obs_slideshow_inputs():
-    pattern = re.compile(rf"{const.FILE_NAMING}(\d+)\.jpg$", re.IGNORECASE)
 
+# without interaction, inputs that cannot be updated are skipped with a
+# warning instead of waiting for the user to fix obs
+def add_slides_to_obs_slideshow_inputs(
+    slot_count: int = 0, interactive: bool = True
+):
     folders = []
-    for i in range(1, const.OBS_MIN_SUBDIRS + 1):
+    for i in range(1, max(const.OBS_MIN_SUBDIRS, slot_count) + 1):
         folders.append(
             Path(const.OBS_SLIDES_DIR).joinpath(
                 Path(f"{const.OBS_SUBDIR_NAMING}{i}")
             )
         )
     for folder in folders:
-        slides = []
-        for p in folder.iterdir():
-            m = pattern.match(p.name)
-            if m:
-                slides.append((int(m.group(1)), str(p.resolve())))
-        slides.sort(key=lambda x: x[0])
-        ordered_files = [{"value": path} for _, path in slides]
+        ordered_files = get_ordered_slide_files(folder)
 
         while True:
             try:
-                # suppress stderr from obsws_python internals
-                with contextlib.redirect_stderr(io.StringIO()):
-                    cl = obs.ReqClient(
-                        host=const.OBS_WEBSOCKET_HOSTNAME,
-                        port=const.OBS_WEBSOCKET_PORT,
-                        password=const.OBS_WEBSOCKET_PASSWORD,
-                    )
-                source = (
-                    f"{const.SSYNC_SLIDESHOW_INPUT_NAMING}"
-                    + f"{str(folder.name)[len(const.OBS_SUBDIR_NAMING) :]}"
-                )
+                cl = connect_to_obs()
+                source = get_slideshow_input_name(folder)
 
                 try:
-                    with contextlib.redirect_stderr(io.StringIO()):
-                        current_settings = cl.get_input_settings(
-                            source
-                        ).input_settings  # type: ignore
+                    set_slideshow_input_files(cl, source, ordered_files)
 
-                        new_settings = dict(current_settings)
-                        new_settings["files"] = ordered_files
-
-                        cl.set_input_settings(
-                            name=source,
-                            settings=new_settings,
-                            overlay=False,
-                        )
-
-                    log(f"{len(ordered_files)} slides put in " + f"'{source}'.")
+                    log(
+                        f"{len(ordered_files)} slides put in " + f"'{source}'."
+                    )
 
                     break
 
                 except obs.error.OBSSDKRequestError:  # type: ignore
+                    if not interactive:
+                        warn(f"cannot access slideshow input: '{source}'")
+                        break
                     log(
                         message=str(
-                            f"Error: Cannot access slideshow input: '{source}' "
-                            + "Please add to OBS and press enter to try again: "
+                            "Error: Cannot access slideshow input: "
+                            + f"'{source}' Please add to OBS and press enter "
+                            + "to try again: "
                         ),
                         color="red",
                         end="",
@@ -185,10 +297,13 @@ def add_slides_to_obs_slideshow_inputs():
                     input()
 
             except (ConnectionError, obs.error.OBSSDKError):  # type: ignore
+                if not interactive:
+                    warn("cannot connect to obs websocket, slides not put in")
+                    return
                 log(
                     message=str(
-                        "Error: Cannot connect to OBS Websocket. Please start OBS "
-                        + "and press enter to try again: "
+                        "Error: Cannot connect to OBS Websocket. Please "
+                        + "start OBS and press enter to try again: "
                     ),
                     color="red",
                     end="",
@@ -201,27 +316,21 @@ def generate_slides_for_selected_song(
     src_dir: str,
     dest_dir: str,
     calculated_prompt: str | list[str],
-    disable_async_enabled: bool,
-) -> list[Thread]:
+    executor: Executor,
+) -> list[Future]:
     executing_slidegen_instance = slidegen.Slidegen(
         classic_slide_style,
         src_dir,
         dest_dir,
         calculated_prompt,
     )
-    return executing_slidegen_instance.execute(disable_async_enabled)
+    return executing_slidegen_instance.execute(executor)
 
 
-def get_structure_for_prompt(classic_slide_style, src_dir, dest_dir):
-    dummy_slidegen_instance = slidegen.Slidegen(
-        classic_slide_style,
-        src_dir,
-        dest_dir,
-        "",
-    )
-    parse_metadata(dummy_slidegen_instance)
-    full_song_structure = dummy_slidegen_instance.metadata["structure"]
-    return full_song_structure
+def get_structure_for_prompt(src_dir: str) -> str:
+    song_document = get_cached_song_document(src_dir)
+    song_document.exit_on_errors()
+    return song_document.metadata["structure"]
 
 
 def get_file_list_inside(rclone_local_dir):
@@ -0,0 +1,75 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from threading import Lock
+
+from utils import error_msg
+
+from .library_index import get_library_index, read_song_document
+from .song_document import SongDocument
+
+# absolute song file path -> (mtime_ns, size, song document)
+cached_song_documents: dict[str, tuple[int, int, SongDocument]] = {}
+cached_song_documents_lock = Lock()
+
+
+# songs that did not change since they were last parsed in this process
+# only cost a stat call and a dictionary lookup. All other songs of the
+# library are taken from the library index, which keeps the parse results on
+# disk and only parses a song again if its content hash changed. Songs from
+# outside of the library are only cached in memory, so that they never show
+# up in the index.
+def get_cached_song_document(song_file_path: str) -> SongDocument:
+    song_file_path = os.path.abspath(song_file_path)
+    try:
+        stat = os.stat(song_file_path)
+    except (FileNotFoundError, PermissionError, IOError):
+        error_msg(
+            "could not read the the song input file: '{}'".format(
+                song_file_path
+            )
+        )
+    with cached_song_documents_lock:
+        cached_song_document = cached_song_documents.get(song_file_path)
+    if cached_song_document is not None and cached_song_document[:2] == (
+        stat.st_mtime_ns,
+        stat.st_size,
+    ):
+        return cached_song_document[2]
+
+    library_index = get_library_index()
+    if library_index.is_library_song(song_file_path):
+        song_document = library_index.get_song_document(song_file_path)
+    else:
+        song_document = read_song_document(song_file_path)
+    if song_document is None:
+        error_msg(
+            "could not read the the song input file: '{}'".format(
+                song_file_path
+            )
+        )
+    with cached_song_documents_lock:
+        cached_song_documents[song_file_path] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            song_document,
+        )
+    return song_document
+
+
+def clear_cached_song_documents() -> None:
+    with cached_song_documents_lock:
+        cached_song_documents.clear()
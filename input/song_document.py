@@ -0,0 +1,215 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass, field
+from re import compile as compile_regex
+
+from utils import error_msg, structure_as_list, get_unique_structure_elements
+
+import config as const
+
+METADATA_LINE_PATTERN = compile_regex(
+    r"^(?!structure)\S+: .+|^structure: ([0-9]+|R)(,([0-9]+|R))*$"
+)
+
+
+@dataclass
+class SongError:
+    kind: str
+    message: str
+    line_number: int = 0
+
+    def __str__(self) -> str:
+        if self.line_number == 0:
+            return self.message
+        return "line {}: {}".format(self.line_number, self.message)
+
+
+@dataclass
+class SongSection:
+    name: str
+    line_number: int
+    lines: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
+# a song file is tokenized in a single pass into its metadata, the section
+# headers and their body lines, and every problem found on the way is
+# collected, so that all of them can be reported together
+@dataclass
+class SongDocument:
+    file_path: str
+    metadata: dict = field(default_factory=dict)
+    sections: dict[str, SongSection] = field(default_factory=dict)
+    errors: list[SongError] = field(default_factory=list)
+
+    def get_structure(self) -> list[str]:
+        return structure_as_list(self.metadata["structure"])
+
+    def get_songtext(self) -> dict[str, str]:
+        return {
+            element: self.sections[element].text
+            for element in get_unique_structure_elements(self.get_structure())
+            if element in self.sections
+        }
+
+    def exit_on_errors(self) -> None:
+        if self.errors:
+            error_msg(
+                "invalid song file '{}':\n{}".format(
+                    self.file_path, "\n".join(map(str, self.errors))
+                )
+            )
+
+
+def is_section_header(stripped_line: str) -> bool:
+    return stripped_line.startswith("[") and stripped_line.endswith("]")
+
+
+def parse_metadata_line(
+    document: SongDocument, line_number: int, line: str
+) -> None:
+    if not METADATA_LINE_PATTERN.match(line):
+        document.errors.append(
+            SongError(
+                "metadata-syntax",
+                "invalid metadata syntax:\n{}".format(line),
+                line_number,
+            )
+        )
+        return
+    metadata_str = line[: line.index(":")]
+    if metadata_str not in document.metadata:
+        document.errors.append(
+            SongError(
+                "unknown-metadata",
+                "invalid metadata string '{}'".format(metadata_str),
+                line_number,
+            )
+        )
+    elif document.metadata[metadata_str] is not None:
+        document.errors.append(
+            SongError(
+                "duplicate-metadata",
+                "duplicate metadata string '{}'".format(metadata_str),
+                line_number,
+            )
+        )
+    else:
+        document.metadata[metadata_str] = line[line.index(": ") + 2 :]
+
+
+def parse_body_line(
+    document: SongDocument,
+    current_section: SongSection | None,
+    line_number: int,
+    line: str,
+) -> SongSection | None:
+    # the line break counts towards the character limit
+    if len(line) > const.STRUCTURE_ELEMENT_PER_LINE_CHAR_LIMIT:
+        document.errors.append(
+            SongError(
+                "line-too-long",
+                "line is configured to a character limit of {} but has {} "
+                "characters:\n{}".format(
+                    const.STRUCTURE_ELEMENT_PER_LINE_CHAR_LIMIT,
+                    len(line),
+                    line.rstrip("\n"),
+                ),
+                line_number,
+            )
+        )
+    stripped_line = line.strip()
+    if not is_section_header(stripped_line):
+        if current_section is not None:
+            current_section.lines.append(stripped_line)
+        return current_section
+
+    name = stripped_line[1:-1].strip()
+    if name in document.sections:
+        document.errors.append(
+            SongError(
+                "duplicate-section",
+                "duplicate structure '{}', first defined on line {}".format(
+                    name, document.sections[name].line_number
+                ),
+                line_number,
+            )
+        )
+    section = SongSection(name, line_number)
+    document.sections.setdefault(name, section)
+    return section
+
+
+def parse_song_lines(file_path: str, lines: list[str]) -> SongDocument:
+    document = SongDocument(
+        file_path, metadata=dict.fromkeys(const.METADATA_STRINGS)
+    )
+    # the metadata block ends early at the first empty line or section header
+    in_metadata = True
+    current_section = None
+    for line_number, line in enumerate(lines, start=1):
+        stripped_line = line.strip()
+        if (
+            in_metadata
+            and stripped_line
+            and not is_section_header(stripped_line)
+        ):
+            parse_metadata_line(document, line_number, line.rstrip("\n"))
+            in_metadata = None in document.metadata.values()
+            continue
+        in_metadata = False
+        current_section = parse_body_line(
+            document, current_section, line_number, line
+        )
+
+    missing_metadata_strs = [
+        metadata_str
+        for metadata_str, value in document.metadata.items()
+        if value is None
+    ]
+    if missing_metadata_strs:
+        document.errors.append(
+            SongError(
+                "missing-metadata",
+                "the following metadata strings are missing: {}".format(
+                    ", ".join(missing_metadata_strs)
+                ),
+            )
+        )
+    else:
+        for element in get_unique_structure_elements(document.get_structure()):
+            if element not in document.sections:
+                document.errors.append(
+                    SongError(
+                        "missing-section",
+                        "could not find structure '{}'".format(element),
+                    )
+                )
+    return document
+
+
+def parse_song_document(file_path: str) -> SongDocument:
+    try:
+        with open(file_path, mode="r", encoding="utf-8-sig") as opener:
+            lines = opener.readlines()
+    except IOError:
+        error_msg(
+            "could not read the the song input file: '{}'".format(file_path)
+        )
+    return parse_song_lines(file_path, lines)
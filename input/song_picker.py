@@ -0,0 +1,152 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from concurrent.futures import Future
+from threading import Thread
+from timeit import default_timer
+
+from utils import log, error_msg
+
+import config as const
+
+from .library_index import LibraryIndex
+from .song_search import SongSearchIndex, SongSearchResult
+
+if os.name != "nt":
+    import curses
+
+SONG_PICKER_HEADER_LINES = 2
+ESCAPE_KEYS = ("\x1b", "\x07")
+ENTER_KEYS = ("\n", "\r")
+BACKSPACE_KEYS = ("\x7f", "\b")
+CLEAR_QUERY_KEY = "\x15"
+PREVIOUS_RESULT_KEY = "\x10"
+NEXT_RESULT_KEY = "\x0e"
+
+
+def validate_song_picker() -> None:
+    if const.SONG_PICKER not in ("search", "fzf"):
+        error_msg(
+            "invalid SONG_PICKER '{}', choose 'search' or 'fzf'".format(
+                const.SONG_PICKER
+            )
+        )
+
+
+# curses is not part of python on windows, where fzf is used instead
+def song_search_enabled() -> bool:
+    validate_song_picker()
+    return const.SONG_PICKER == "search" and os.name != "nt"
+
+
+# building the search index takes a moment for large libraries, so it runs
+# while the first prompt of the session is answered
+def build_song_search_index_in_background(
+    library_index: LibraryIndex,
+) -> Future:
+    future = Future()
+
+    def build_song_search_index() -> None:
+        try:
+            future.set_result(SongSearchIndex(library_index))
+        except Exception as error:  # pylint: disable=broad-except
+            future.set_exception(error)
+
+    Thread(target=build_song_search_index, daemon=True).start()
+    return future
+
+
+def get_result_line(result: SongSearchResult) -> str:
+    if not result.title:
+        return result.path
+    if not result.book:
+        return "{}  ({})".format(result.title, result.path)
+    return "{}  [{}]  ({})".format(result.title, result.book, result.path)
+
+
+def draw_song_picker(
+    screen,
+    prompt: str,
+    query: str,
+    results: list[SongSearchResult],
+    selected: int,
+    status: str,
+) -> None:
+    _, width = screen.getmaxyx()
+    screen.erase()
+    screen.addnstr(1, 0, status, width - 1, curses.A_DIM)
+    for row, result in enumerate(results):
+        screen.addnstr(
+            row + SONG_PICKER_HEADER_LINES,
+            0,
+            get_result_line(result),
+            width - 1,
+            curses.A_REVERSE if row == selected else curses.A_NORMAL,
+        )
+    screen.addnstr(0, 0, prompt + query, width - 1, curses.A_BOLD)
+    screen.move(0, min(len(prompt) + len(query), width - 1))
+    screen.refresh()
+
+
+def run_song_picker(screen, search_index: SongSearchIndex, prompt: str) -> str:
+    query = ""
+    selected = 0
+    while True:
+        height, _ = screen.getmaxyx()
+        start_time = default_timer()
+        results = search_index.search(
+            query, max(1, height - SONG_PICKER_HEADER_LINES)
+        )
+        status = "  {} / {} songs ({:.1f} ms)".format(
+            len(results),
+            len(search_index),
+            (default_timer() - start_time) * 1000,
+        )
+        selected = max(0, min(selected, len(results) - 1))
+        draw_song_picker(screen, prompt, query, results, selected, status)
+
+        key = screen.get_wch()
+        if key in ENTER_KEYS or key == curses.KEY_ENTER:
+            return results[selected].path if results else ""
+        if key in ESCAPE_KEYS:
+            return ""
+        if key in (curses.KEY_UP, PREVIOUS_RESULT_KEY):
+            selected -= 1
+        elif key in (curses.KEY_DOWN, NEXT_RESULT_KEY):
+            selected += 1
+        elif key in BACKSPACE_KEYS or key == curses.KEY_BACKSPACE:
+            query = query[:-1]
+            selected = 0
+        elif key == CLEAR_QUERY_KEY:
+            query = ""
+            selected = 0
+        elif isinstance(key, str) and key.isprintable():
+            query += key
+            selected = 0
+
+
+# returns the chosen song file relative to the library, or an empty string
+# if nothing was chosen
+def choose_song(search_index_future: Future, prompt: str) -> str:
+    if not search_index_future.done():
+        log("indexing songs for the search...")
+    search_index = search_index_future.result()
+    # do not wait a whole second to tell escape sequences from the escape key
+    os.environ.setdefault("ESCDELAY", "25")
+    try:
+        return curses.wrapper(run_song_picker, search_index, prompt)
+    except KeyboardInterrupt:
+        return ""
@@ -0,0 +1,174 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .library_index import LibraryIndex
+
+SEARCH_FIELD_WEIGHTS = {"title": 4.0, "path": 3.0, "book": 3.0, "lyrics": 1.0}
+TITLE_MATCH_BONUS = 2.0
+BONUS_CANDIDATE_COUNT = 200
+
+
+@dataclass
+class SongSearchResult:
+    path: str
+    title: str
+    book: str
+    score: float
+
+
+NON_WORD_PATTERN = re.compile(r"[\W_]+")
+COMBINING_MARK_PATTERN = re.compile(r"[\u0300-\u036f]")
+
+
+# umlauts and case are folded away, so that 'grusse' also finds 'Grüße'
+def normalize_search_text(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return NON_WORD_PATTERN.sub(
+        " ", COMBINING_MARK_PATTERN.sub("", decomposed)
+    ).strip()
+
+
+# song texts mostly consist of the same few thousand words, so the trigrams
+# are computed once per distinct word
+@lru_cache(maxsize=None)
+def get_word_trigrams(word: str, is_prefix: bool = False) -> frozenset[str]:
+    trigrams = set()
+    for normalized_word in normalize_search_text(word).split():
+        padded_word = " " + normalized_word + ("" if is_prefix else " ")
+        trigrams.update(
+            padded_word[start : start + 3]
+            for start in range(len(padded_word) - 2)
+        )
+    return frozenset(trigrams)
+
+
+# the last word of a query is usually still being typed, so it only has to
+# match the start of a word
+def get_trigrams(text: str, is_query: bool = False) -> set[str]:
+    words = text.split()
+    last_word = words.pop() if is_query and words else None
+    trigrams = set()
+    for word in set(words):
+        trigrams.update(get_word_trigrams(word))
+    if last_word is not None:
+        trigrams.update(get_word_trigrams(last_word, is_prefix=True))
+    return trigrams
+
+
+# a trigram index over the title, book, path and lyrics of every song in the
+# library. A query adds the field weight of each of its trigrams to all songs
+# containing it, which ranks songs by their weighted trigram overlap and
+# tolerates typos and word order.
+class SongSearchIndex:
+    def __init__(self, library_index: LibraryIndex) -> None:
+        # indices written by older versions may still hold songs from
+        # outside the library, which cannot be chosen in the picker
+        songs = [
+            song
+            for song in library_index.get_songs()
+            if library_index.is_library_song(song.path)
+        ]
+        lyrics = library_index.get_lyrics()
+        library_dir = library_index.library_dir
+
+        self.paths: list[str] = []
+        self.titles: list[str] = []
+        self.books: list[str] = []
+        self.normalized_titles: list[str] = []
+        postings: dict[str, dict[str, list[int]]] = {
+            field: {} for field in SEARCH_FIELD_WEIGHTS
+        }
+        for song_id, song in enumerate(songs):
+            path = os.path.relpath(song.path, library_dir)
+            title = song.metadata.get("title") or ""
+            book = song.metadata.get("book") or ""
+            self.paths.append(path)
+            self.titles.append(title)
+            self.books.append(book)
+            self.normalized_titles.append(normalize_search_text(title))
+            for field, text in (
+                ("title", title),
+                ("path", os.path.splitext(path)[0]),
+                ("book", book),
+                ("lyrics", lyrics.get(song.path, "")),
+            ):
+                field_postings = postings[field]
+                for trigram in get_trigrams(text):
+                    field_postings.setdefault(trigram, []).append(song_id)
+
+        self.postings: dict[str, dict[str, np.ndarray]] = {
+            field: {
+                trigram: np.array(song_ids, dtype=np.int32)
+                for trigram, song_ids in field_postings.items()
+            }
+            for field, field_postings in postings.items()
+        }
+        self.alphabetical_ids = sorted(
+            range(len(self.paths)), key=lambda song_id: self.paths[song_id]
+        )
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def get_result(self, song_id: int, score: float) -> SongSearchResult:
+        return SongSearchResult(
+            self.paths[song_id],
+            self.titles[song_id],
+            self.books[song_id],
+            score,
+        )
+
+    def search(self, query: str, limit: int) -> list[SongSearchResult]:
+        normalized_query = normalize_search_text(query)
+        query_trigrams = get_trigrams(query, is_query=True)
+        if not query_trigrams:
+            return [
+                self.get_result(song_id, 0.0)
+                for song_id in self.alphabetical_ids[:limit]
+            ]
+
+        scores = np.zeros(len(self.paths), dtype=np.float32)
+        for field, weight in SEARCH_FIELD_WEIGHTS.items():
+            field_postings = self.postings[field]
+            for trigram in query_trigrams:
+                song_ids = field_postings.get(trigram)
+                # the song ids of a posting list are unique
+                if song_ids is not None:
+                    scores[song_ids] += weight
+        scores /= len(query_trigrams)
+
+        candidate_count = min(len(scores), max(limit, BONUS_CANDIDATE_COUNT))
+        candidate_ids = np.argpartition(-scores, candidate_count - 1)[
+            :candidate_count
+        ]
+        for song_id in candidate_ids:
+            if normalized_query in self.normalized_titles[song_id]:
+                scores[song_id] += TITLE_MATCH_BONUS
+        candidate_ids = sorted(
+            (song_id for song_id in candidate_ids if scores[song_id] > 0),
+            key=lambda song_id: (-scores[song_id], self.paths[song_id]),
+        )
+        return [
+            self.get_result(song_id, float(scores[song_id]))
+            for song_id in candidate_ids[:limit]
+        ]
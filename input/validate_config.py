@@ -42,6 +42,26 @@ def validate_ssync_config() -> None:
     general_config_validator(needed_constants)
 
 
+def validate_setlist_config() -> None:
+    needed_constants: dict = {
+        "OBS_SLIDES_DIR": const.OBS_SLIDES_DIR,
+        "OBS_SUBDIR_NAMING": const.OBS_SUBDIR_NAMING,
+        "OBS_MIN_SUBDIRS": const.OBS_MIN_SUBDIRS,
+        "SSYNC_SLIDESHOW_INPUT_NAMING": const.SSYNC_SLIDESHOW_INPUT_NAMING,
+        "OBS_WEBSOCKET_HOSTNAME": const.OBS_WEBSOCKET_HOSTNAME,
+        "OBS_WEBSOCKET_PORT": const.OBS_WEBSOCKET_PORT,
+    }
+    general_config_validator(needed_constants)
+
+
+def validate_prerender_config() -> None:
+    needed_constants: dict = {
+        "RCLONE_LOCAL_DIR": const.RCLONE_LOCAL_DIR,
+        "PRERENDER_CACHE_DIR": const.PRERENDER_CACHE_DIR,
+    }
+    general_config_validator(needed_constants)
+
+
 def validate_obs_song_scene_switcher_config() -> None:
     needed_constants: dict = {
         "NEXTSONG_CACHE_FILE": const.NEXTSONG_CACHE_FILE,
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import colorama
+
+from slides import get_slide_style
+from input import validate_prerender_config
+from sync import prerender_library
+
+import config as const
+
+if __name__ == "__main__":
+    colorama.init()
+    validate_prerender_config()
+
+    prerender_library(get_slide_style(const.SLIDE_STYLE))
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import colorama
+
+from input import parse_rasterize_slides_argv_as_tuple
+from slides import rasterize_svg_slides
+from utils import log
+
+if __name__ == "__main__":
+    colorama.init()
+    slides_dirs, image_format = parse_rasterize_slides_argv_as_tuple()
+
+    for slides_dir in slides_dirs:
+        log(
+            "rasterized {} slides in '{}' as {}".format(
+                rasterize_svg_slides(slides_dir, image_format),
+                slides_dir,
+                image_format,
+            )
+        )
@@ -0,0 +1,23 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# the server is not re-exported, as it depends on slidegen.py, which itself
+# uses the client
+from .protocol import render_daemon_supported, get_render_daemon_socket_path
+from .client import (
+    render_via_daemon,
+    render_argv_via_daemon,
+    is_plain_render_argv,
+)
@@ -0,0 +1,127 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import socket
+
+from .protocol import (
+    render_daemon_supported,
+    get_render_daemon_socket_path,
+    send_message,
+    read_messages,
+)
+
+
+# slidegen.py tries the render daemon before importing the renderers, so the
+# client only uses the standard library and prints its messages itself
+# instead of importing utils, which pulls in PyQt5 and Wand
+def log(message: str) -> None:
+    print("[*] {}".format(message))
+
+
+def warn(message: str) -> None:
+    print("[*] Warning: {}".format(message))
+
+
+def error_msg(message: str):
+    print("[*] Error: {}".format(message))
+    sys.exit(1)
+
+
+def connect_to_render_daemon() -> socket.socket | None:
+    if not render_daemon_supported():
+        return None
+    client = socket.socket(
+        socket.AF_UNIX, socket.SOCK_STREAM  # pyright: ignore
+    )
+    try:
+        client.connect(get_render_daemon_socket_path())
+    except OSError:
+        client.close()
+        return None
+    return client
+
+
+# returns whether the daemon rendered the slides, so that the caller can fall
+# back to rendering them itself otherwise
+def render_via_daemon(
+    song_file_path: str, output_dir: str, chosen_structure: str
+) -> bool:
+    client = connect_to_render_daemon()
+    if client is None:
+        return False
+
+    log("rendering slides with the render daemon...")
+    try:
+        with client, client.makefile("rwb") as connection:
+            send_message(
+                connection,
+                {
+                    "song_file_path": os.path.abspath(song_file_path),
+                    "output_dir": os.path.abspath(output_dir),
+                    "structure": chosen_structure,
+                },
+            )
+            return handle_render_daemon_messages(read_messages(connection))
+    except (OSError, ValueError) as error:
+        warn("lost connection to the render daemon: {}".format(error))
+        return False
+
+
+def handle_render_daemon_messages(messages) -> bool:
+    slide_count = 0
+    finished_slides = 0
+    for message in messages:
+        if message["event"] == "error":
+            error_msg(message["message"])
+        elif message["event"] == "accepted":
+            slide_count = message["slide_count"]
+        elif message["event"] == "slide":
+            finished_slides += 1
+            if message["success"]:
+                log(
+                    "rendered slide [{} / {}]".format(
+                        finished_slides, slide_count
+                    )
+                )
+            else:
+                log(message["message"])
+        elif message["event"] == "done":
+            return True
+    warn("the render daemon closed the connection early")
+    return False
+
+
+# only the plain "SONGFILE OUTPUT [STRUCTURE]" call is handed to the daemon
+# here. Calls with options fall back to the full argument parser, which
+# imports the renderers and still tries the daemon where it applies.
+# only the plain "SONG_FILE OUTPUT_DIR [STRUCTURE]" form is handed over
+# before the argument parser of slidegen.py is imported
+def is_plain_render_argv(argv: list[str]) -> bool:
+    return 2 <= len(argv) <= 3 and not any(arg.startswith("-") for arg in argv)
+
+
+def render_argv_via_daemon(argv: list[str]) -> bool:
+    if not is_plain_render_argv(argv):
+        return False
+    song_file_path, output_dir = (
+        os.path.abspath(os.path.expandvars(os.path.expanduser(path)))
+        for path in argv[:2]
+    )
+    chosen_structure = argv[2] if len(argv) == 3 else ""
+    if chosen_structure.strip() == "":
+        chosen_structure = ""
+    return render_via_daemon(song_file_path, output_dir, chosen_structure)
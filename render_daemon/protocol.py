@@ -0,0 +1,49 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import json
+import getpass
+import socket
+from tempfile import gettempdir
+from typing import BinaryIO, Iterator
+
+import config as const
+
+
+def render_daemon_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def get_render_daemon_socket_path() -> str:
+    if const.RENDER_DAEMON_SOCKET != "":
+        return os.path.abspath(
+            os.path.expandvars(os.path.expanduser(const.RENDER_DAEMON_SOCKET))
+        )
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or gettempdir()
+    return os.path.join(
+        runtime_dir, "slidegen-render-daemon-{}.sock".format(getpass.getuser())
+    )
+
+
+# messages are sent as json objects, one per line
+def send_message(writer: BinaryIO, message: dict) -> None:
+    writer.write((json.dumps(message) + "\n").encode("utf-8"))
+    writer.flush()
+
+
+def read_messages(reader: BinaryIO) -> Iterator[dict]:
+    for line in reader:
+        yield json.loads(line.decode("utf-8"))
@@ -0,0 +1,150 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import signal
+import socket
+import socketserver
+from concurrent.futures import Executor, as_completed
+
+from utils import log, error_msg
+from slides import SlideStyle, get_slide_status, finish_slides
+
+from slidegen import Slidegen
+
+from .protocol import (
+    get_render_daemon_socket_path,
+    send_message,
+    read_messages,
+)
+
+
+class RenderRequestHandler(socketserver.StreamRequestHandler):
+    server: "RenderDaemonServer"
+
+    def handle(self) -> None:
+        try:
+            request = next(read_messages(self.rfile), None)
+            if request is None:
+                return
+            song_file_path = str(request["song_file_path"])
+            output_dir = str(request["output_dir"])
+            structure = str(request.get("structure", ""))
+        except (ValueError, KeyError, TypeError) as error:
+            self.send({"event": "error", "message": "invalid request"})
+            log("ignoring invalid request: {}".format(error), color="red")
+            return
+
+        log("rendering '{}' to '{}'...".format(song_file_path, output_dir))
+        slidegen = Slidegen(
+            self.server.slide_style, song_file_path, output_dir, structure
+        )
+        try:
+            futures = slidegen.execute(self.server.executor)
+        except SystemExit:
+            self.send(
+                {
+                    "event": "error",
+                    "message": "could not parse '{}', ".format(song_file_path)
+                    + "see the render daemon log for details",
+                }
+            )
+            return
+
+        self.send({"event": "accepted", "slide_count": len(futures)})
+        statuses = []
+        for future in as_completed(futures):
+            status = get_slide_status(future)
+            if status is None:
+                self.send(
+                    {
+                        "event": "slide",
+                        "success": False,
+                        "message": "could not generate a slide, see the "
+                        + "render daemon log for details",
+                    }
+                )
+                continue
+            statuses.append(status)
+            self.send(
+                {
+                    "event": "slide",
+                    "success": status.success,
+                    "slide_number": status.slide_number,
+                    "filename": status.filename,
+                    "cache_hit": status.cache_hit,
+                    "message": "could not write slide {} to '{}': {}".format(
+                        status.slide_number, status.filename, status.message
+                    ),
+                }
+            )
+        finish_slides(statuses)
+        self.send({"event": "done"})
+
+    # the slides still get rendered when the client went away, there is just
+    # nobody left to tell about it
+    def send(self, message: dict) -> None:
+        try:
+            send_message(self.wfile, message)
+        except OSError:
+            pass
+
+
+class RenderDaemonServer(
+    socketserver.ThreadingUnixStreamServer  # pyright: ignore
+):
+    daemon_threads = True
+
+    def __init__(
+        self, socket_path: str, slide_style: SlideStyle, executor: Executor
+    ) -> None:
+        self.slide_style = slide_style
+        self.executor = executor
+        super().__init__(socket_path, RenderRequestHandler)
+        os.chmod(socket_path, 0o600)
+
+
+def remove_stale_socket(socket_path: str) -> None:
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(
+        socket.AF_UNIX, socket.SOCK_STREAM  # pyright: ignore
+    ) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            os.remove(socket_path)
+            return
+    error_msg(
+        "another render daemon is already listening on '{}'".format(
+            socket_path
+        )
+    )
+
+
+def serve_render_daemon(slide_style: SlideStyle, executor: Executor) -> None:
+    socket_path = get_render_daemon_socket_path()
+    remove_stale_socket(socket_path)
+    # lets service managers stop the daemon without leaving the socket behind
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with RenderDaemonServer(socket_path, slide_style, executor) as server:
+        log("render daemon listening on '{}'".format(socket_path))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            log("stopping render daemon...")
+        finally:
+            os.remove(socket_path)
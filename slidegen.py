@@ -15,29 +15,46 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from threading import Thread
+import sys
 
-import colorama
+from render_daemon import (
+    render_argv_via_daemon,
+    render_via_daemon,
+    is_plain_render_argv,
+)
+
+# handing a song to the render daemon only needs the standard library, so it
+# is tried before the slide renderers and their dependencies get imported
+DAEMON_TRIED = __name__ == "__main__" and is_plain_render_argv(sys.argv[1:])
+if DAEMON_TRIED and render_argv_via_daemon(sys.argv[1:]):
+    sys.exit(0)
 
-from wand.image import Image
+# pylint: disable=wrong-import-position
+from concurrent.futures import Executor, Future
+
+import colorama
 
 from slides import (
-    ClassicSongTemplate,
-    ClassicStartSlide,
-    ClassicSongSlide,
     SlideStyle,
+    get_slide_style,
     generate_slides,
-    generate_song_template,
+    wait_for_slides,
+    get_slide_executor,
     count_number_of_slides_to_be_generated,
 )
 
+from utils import trace_span, enable_tracing, write_trace
+
 from input import (
     parse_prompt_input,
     parse_metadata,
     parse_songtext,
     parse_slidegen_argv_as_tuple,
+    SongDocument,
 )
 
+import config as const
+
 
 class Slidegen:
     def __init__(
@@ -50,15 +67,18 @@ class Slidegen:
         self.metadata: dict = {"": ""}
         self.songtext: dict = {"": ""}
         self.song_file_path: str = song_file_path
-        self.song_file_content: list = []
+        self.song_document: SongDocument | None = None
         self.output_dir: str = output_dir
         self.chosen_structure = chosen_structure
         self.slide_style: SlideStyle = slide_style
 
-    def execute(self, disable_async=False) -> list[Thread]:
-        self.parse_file()
-        self.calculate_desired_structures()
-        return self.generate_slides(disable_async)
+    def execute(self, executor: Executor) -> list[Future]:
+        with trace_span("parse", song=self.song_file_path):
+            self.parse_file()
+        with trace_span("prompt expansion"):
+            self.calculate_desired_structures()
+        with trace_span("submit slides"):
+            return self.generate_slides(executor)
 
     def parse_file(self):
         parse_metadata(self)
@@ -67,24 +87,50 @@ class Slidegen:
     def calculate_desired_structures(self) -> None:
         self.chosen_structure = parse_prompt_input(self)
 
-    def generate_slides(self, disable_async: bool) -> list[Thread]:
-        template_img: Image = generate_song_template(self)
-
+    def generate_slides(self, executor: Executor) -> list[Future]:
         slide_count: int = count_number_of_slides_to_be_generated(self)
         zfill_length: int = len(str(slide_count))
 
-        return generate_slides(
-            self, slide_count, template_img, zfill_length, disable_async
-        )
+        return generate_slides(self, slide_count, zfill_length, executor)
 
 
 if __name__ == "__main__":
     colorama.init()
 
-    classic_slide_style = SlideStyle(
-        ClassicSongTemplate,  # pyright: ignore [reportGeneralTypeIssues]
-        ClassicStartSlide,  # pyright: ignore [reportGeneralTypeIssues]
-        ClassicSongSlide,  # pyright: ignore [reportGeneralTypeIssues]
-    )
-    slidegen = Slidegen(classic_slide_style, *parse_slidegen_argv_as_tuple())
-    slidegen.execute()
+    slide_style = get_slide_style(const.SLIDE_STYLE)
+    (
+        song_file_path,
+        output_dir,
+        chosen_structure,
+        render_backend,
+        trace_file_path,
+        use_daemon,
+        setlist_file_path,
+    ) = parse_slidegen_argv_as_tuple()
+    # traces can only be recorded when rendering in this process, and plain
+    # arguments were already handed to the daemon before the imports
+    if (
+        use_daemon
+        and not trace_file_path
+        and not DAEMON_TRIED
+        and render_via_daemon(song_file_path, output_dir, chosen_structure)
+    ):
+        sys.exit(0)
+
+    if trace_file_path:
+        enable_tracing()
+    if setlist_file_path:
+        # the setlist module imports this one, so it is only imported here
+        from input import parse_setlist, render_setlist
+
+        render_setlist(
+            parse_setlist(setlist_file_path), slide_style, render_backend
+        )
+    else:
+        slidegen = Slidegen(
+            slide_style, song_file_path, output_dir, chosen_structure
+        )
+        with get_slide_executor(render_backend) as executor:
+            wait_for_slides(slidegen.execute(executor))
+    if trace_file_path:
+        write_trace(trace_file_path)
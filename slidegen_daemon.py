@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import colorama
+
+from utils import error_msg
+from slides import get_slide_style, get_slide_executor
+from input import parse_slidegen_daemon_argv_as_tuple
+from render_daemon import render_daemon_supported
+from render_daemon.server import serve_render_daemon
+
+import config as const
+
+if __name__ == "__main__":
+    colorama.init()
+
+    (render_backend,) = parse_slidegen_daemon_argv_as_tuple()
+    if not render_daemon_supported():
+        error_msg("the render daemon needs unix domain sockets")
+
+    slide_style = get_slide_style(const.SLIDE_STYLE)
+    with get_slide_executor(render_backend) as executor:
+        serve_render_daemon(slide_style, executor)
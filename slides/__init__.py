@@ -23,6 +23,40 @@ from .classic_song_template import ClassicSongTemplate
 from .classic_start_slide import ClassicStartSlide
 from .classic_song_slide import ClassicSongSlide
 
-from .engine.generate_slides import generate_slides
+from .pillow_song_template import PillowSongTemplate
+from .pillow_start_slide import PillowStartSlide
+from .pillow_song_slide import PillowSongSlide
+
+from .svg_song_template import SvgSongTemplate
+from .svg_start_slide import SvgStartSlide
+from .svg_song_slide import SvgSongSlide
+
+from .slide_styles import SLIDE_STYLES, get_slide_style
+
+from .engine.executor import (
+    RenderBackend,
+    SequentialExecutor,
+    get_slide_executor,
+    get_render_worker_count,
+    warm_up_render_workers,
+)
+from .engine.scheduler import (
+    RenderScheduler,
+    SlotExecutor,
+    SchedulerProgress,
+)
+from .engine.generate_slides import (
+    generate_slides,
+    wait_for_slides,
+    get_slide_status,
+    finish_slides,
+    SlideRenderStatus,
+)
 from .engine.song_template import generate_song_template
+from .engine.rasterize import rasterize_svg_slides
 from .engine.calc_slide_count import count_number_of_slides_to_be_generated
+from .engine.prerender_cache import (
+    get_prerender_cache_dir,
+    get_prerendered_slides_dir,
+    copy_prerendered_slides,
+)
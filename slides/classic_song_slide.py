@@ -12,7 +12,6 @@
 
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
-
 from wand.image import Image
 from wand.drawing import Drawing
 from wand.font import Font
@@ -20,8 +19,15 @@ from wand.color import Color
 
 import config as const
 
-from utils import get_empty_image
+from utils import get_empty_image, trace_span
 from .song_slide import SongSlide
+from .engine.sprite_cache import get_cached_sprite, peek_cached_sprite
+from .engine.text_fit import (
+    get_font_size_candidates,
+    get_first_fitting_font_size_index,
+    get_largest_raster_fitting_font_size,
+    text_fits,
+)
 
 
 class ClassicSongSlide(SongSlide):
@@ -29,141 +35,257 @@ class ClassicSongSlide(SongSlide):
         self,
         template_img: Image,
         slide_text: str,
+        font_size: int,
         song_structure: list,
         index: int,
         use_arrow: bool,
     ) -> Image:
-        canvas_img, font_size = self.get_text_canvas(slide_text)
+        px = self.layout.px
+        with trace_span("text canvas"):
+            if font_size:
+                canvas_img = self.get_cached_text_canvas(slide_text, font_size)
+            else:
+                canvas_img = get_empty_image()
         verse_or_chorus = song_structure[index]
         bg_img = template_img.clone()
         if "R" not in verse_or_chorus:
             bg_img.composite(
                 self.get_index(verse_or_chorus, font_size),
-                top=const.STRUCTURE_ELEMENT_Y,
-                left=const.STRUCTURE_ELEMENT_X,
+                top=px(const.STRUCTURE_ELEMENT_Y),
+                left=px(const.STRUCTURE_ELEMENT_X),
             )
         bg_img.composite(
-            canvas_img, top=const.TEXT_CANVAS_Y, left=const.TEXT_CANVAS_X
+            canvas_img,
+            top=px(const.TEXT_CANVAS_Y),
+            left=px(const.TEXT_CANVAS_X),
         )
         if use_arrow:
             bg_img.composite(
-                self.get_arrow(), top=const.ARROW_Y, left=const.ARROW_X
+                self.get_arrow(), top=px(const.ARROW_Y), left=px(const.ARROW_X)
             )
         bg_img.composite(
             self.get_structure_info_display(song_structure, index),
-            top=const.INFODISPLAY_Y,
-            left=const.INFODISPLAY_X,
+            top=px(const.INFODISPLAY_Y),
+            left=px(const.INFODISPLAY_X),
         )
-        return bg_img.clone()
+        return bg_img
 
     def get_arrow(self) -> Image:
+        arrow_height = self.layout.px(const.ARROW_HEIGHT)
+        return get_cached_sprite(
+            ("arrow", arrow_height, const.ARROW_COLOR, const.BG_COLOR),
+            lambda: self.render_arrow(arrow_height),
+        )
+
+    def render_arrow(self, arrow_height: int) -> Image:
         with Drawing() as draw:
             draw.stroke_width = 1
             draw.stroke_color = Color(const.ARROW_COLOR)
             draw.fill_color = Color(const.ARROW_COLOR)
-            arrow_width = const.ARROW_HEIGHT * 3 // 2
+            arrow_width = arrow_height * 3 // 2
 
             draw.path_start()
-            draw.path_move(
-                to=(0, const.ARROW_HEIGHT / 2 - const.ARROW_HEIGHT / 10)
-            )
-            draw.path_line(
-                to=(0, const.ARROW_HEIGHT / 2 + const.ARROW_HEIGHT / 10)
-            )
+            draw.path_move(to=(0, arrow_height / 2 - arrow_height / 10))
+            draw.path_line(to=(0, arrow_height / 2 + arrow_height / 10))
             draw.path_line(
                 to=(
                     arrow_width / 3 * 2,
-                    const.ARROW_HEIGHT / 2 + const.ARROW_HEIGHT / 10,
+                    arrow_height / 2 + arrow_height / 10,
                 )
             )
-            draw.path_line(to=(arrow_width / 3 * 2, const.ARROW_HEIGHT))
-            draw.path_line(to=(arrow_width, const.ARROW_HEIGHT / 2))
+            draw.path_line(to=(arrow_width / 3 * 2, arrow_height))
+            draw.path_line(to=(arrow_width, arrow_height / 2))
             draw.path_line(to=(arrow_width / 3 * 2, 0))
             draw.path_line(
                 to=(
                     arrow_width / 3 * 2,
-                    const.ARROW_HEIGHT / 2 - const.ARROW_HEIGHT / 10,
+                    arrow_height / 2 - arrow_height / 10,
                 )
             )
             draw.path_close()
             draw.path_finish()
 
-            with Image(
+            image = Image(
                 width=arrow_width,
-                height=const.ARROW_HEIGHT,
+                height=arrow_height,
                 background=Color(const.BG_COLOR),
-            ) as image:
-                draw(image)
-                return image.clone()
-
-    def get_text_canvas(self, slide_text: str) -> tuple[Image, int]:
-        font_size = const.MAX_CANVAS_FONT_SIZE
-        while font_size >= const.MIN_CANVAS_FONT_SIZE:
-            with Drawing() as draw:
-                draw.fill_color = Color(const.TEXT_COLOR)
-                draw.text_interline_spacing = const.INTERLINE_SPACING
-                draw.font_size = font_size
-                draw.font = const.FONT_PATH
-                draw.text(0, font_size, slide_text)
-                with Image(
-                    width=const.WIDTH,
-                    height=const.HEIGHT,
-                    background=Color(const.BG_COLOR),
-                ) as img:
-                    draw(img)
-                    img.trim()
-                    if (
-                        img.width > const.TEXT_CANVAS_WIDTH
-                        or img.height > const.TEXT_CANVAS_HEIGHT
-                    ):
-                        font_size -= const.CANVAS_FONT_SIZE_STEP
-                    else:
-                        return img.clone(), font_size
-        return get_empty_image(), 0
+            )
+            draw(image)
+            return image
+
+    def get_text_fit(self, slide_text: str) -> int:
+        font_sizes = get_font_size_candidates(
+            const.MAX_CANVAS_FONT_SIZE,
+            const.MIN_CANVAS_FONT_SIZE,
+            const.CANVAS_FONT_SIZE_STEP,
+        )
+        first_fitting_index = get_first_fitting_font_size_index(
+            font_sizes,
+            lambda font_size: text_fits(
+                slide_text,
+                const.FONT_PATH,
+                font_size,
+                const.TEXT_CANVAS_WIDTH,
+                const.TEXT_CANVAS_HEIGHT,
+                const.INTERLINE_SPACING,
+            ),
+        )
+        # the probed canvases are not cached, so that rejected font sizes do
+        # not evict other sprites. Only the chosen canvas is kept for the
+        # slide, which then takes it from the sprite cache.
+        probed_canvases: dict[int, Image] = {}
+        font_size = get_largest_raster_fitting_font_size(
+            font_sizes,
+            first_fitting_index,
+            lambda font_size: self.text_canvas_fits(
+                slide_text, font_size, probed_canvases
+            ),
+        )
+        for probed_font_size, canvas_img in probed_canvases.items():
+            if probed_font_size == font_size:
+                self.cache_text_canvas(slide_text, font_size, canvas_img)
+            else:
+                canvas_img.close()
+        return 0 if font_size is None else font_size
+
+    def cache_text_canvas(
+        self, slide_text: str, font_size: int, canvas_img: Image
+    ) -> None:
+        cached_img = get_cached_sprite(
+            self.get_text_canvas_key(slide_text, font_size),
+            lambda: canvas_img,
+        )
+        # another thread may have cached the same canvas in the meantime
+        if cached_img is not canvas_img:
+            canvas_img.close()
+
+    def text_canvas_fits(
+        self,
+        slide_text: str,
+        font_size: int,
+        probed_canvases: dict[int, Image],
+    ) -> bool:
+        img = peek_cached_sprite(
+            self.get_text_canvas_key(slide_text, font_size)
+        )
+        if img is None:
+            img = self.draw_text_canvas(slide_text, font_size)
+            probed_canvases[font_size] = img
+        return img.width <= self.layout.px(
+            const.TEXT_CANVAS_WIDTH
+        ) and img.height <= self.layout.px(const.TEXT_CANVAS_HEIGHT)
+
+    # refrains repeat throughout a song and often across the songs of a
+    # session, so their rasterized canvases are shared via the sprite cache
+    def get_cached_text_canvas(self, slide_text: str, font_size: int) -> Image:
+        return get_cached_sprite(
+            self.get_text_canvas_key(slide_text, font_size),
+            lambda: self.draw_text_canvas(slide_text, font_size),
+        )
+
+    def get_text_canvas_key(self, slide_text: str, font_size: int) -> tuple:
+        px = self.layout.px
+        return (
+            "text_canvas",
+            slide_text,
+            const.FONT_PATH,
+            px(font_size),
+            px(const.INTERLINE_SPACING),
+            const.TEXT_COLOR,
+            const.BG_COLOR,
+            self.layout.width,
+            self.layout.height,
+        )
+
+    def draw_text_canvas(self, slide_text: str, font_size: int) -> Image:
+        px = self.layout.px
+        with Drawing() as draw:
+            draw.fill_color = Color(const.TEXT_COLOR)
+            draw.text_interline_spacing = px(const.INTERLINE_SPACING)
+            draw.font_size = px(font_size)
+            draw.font = const.FONT_PATH
+            draw.text(0, px(font_size), slide_text)
+            img = Image(
+                width=self.layout.width,
+                height=self.layout.height,
+                background=Color(const.BG_COLOR),
+            )
+            draw(img)
+            img.trim()
+            return img
 
     def get_structure_info_display(self, structure: list, index: int) -> Image:
+        return get_cached_sprite(
+            (
+                "structure_info_display",
+                tuple(structure),
+                index,
+                const.FONT_PATH,
+                const.BOLD_FONT_PATH,
+                const.INFODISPLAY_FONT_SIZE,
+                const.INFODISPLAY_ITEM_WIDTH,
+                const.TEXT_COLOR,
+                const.BG_COLOR,
+                self.layout.width,
+                self.layout.height,
+            ),
+            lambda: self.render_structure_info_display(structure, index),
+        )
+
+    def render_structure_info_display(
+        self, structure: list, index: int
+    ) -> Image:
+        font_size = self.layout.px(const.INFODISPLAY_FONT_SIZE)
+        item_width = self.layout.px(const.INFODISPLAY_ITEM_WIDTH)
         with Drawing() as draw:
             draw.fill_color = Color(const.TEXT_COLOR)
-            draw.font_size = const.INFODISPLAY_FONT_SIZE
+            draw.font_size = font_size
             draw.font = const.FONT_PATH
             for current_index, item in enumerate(structure):
                 if current_index == index:
                     draw.font = const.BOLD_FONT_PATH
-                    draw.text(
-                        current_index * const.INFODISPLAY_ITEM_WIDTH,
-                        const.INFODISPLAY_FONT_SIZE,
-                        item,
-                    )
+                    draw.text(current_index * item_width, font_size, item)
                     draw.font = const.FONT_PATH
                 else:
-                    draw.text(
-                        current_index * const.INFODISPLAY_ITEM_WIDTH,
-                        const.INFODISPLAY_FONT_SIZE,
-                        item,
-                    )
-            with Image(
-                width=const.WIDTH,
-                height=const.HEIGHT,
+                    draw.text(current_index * item_width, font_size, item)
+            img = Image(
+                width=self.layout.width,
+                height=self.layout.height,
                 background=Color(const.BG_COLOR),
-            ) as img:
-                draw(img)
-                img.trim()
+            )
+            draw(img)
+            img.trim()
 
-                return img.clone()
+            return img
 
     def get_index(self, verse: str, font_size: int) -> Image:
-        with Image(
-            width=const.WIDTH,
-            height=const.HEIGHT,
+        return get_cached_sprite(
+            (
+                "index",
+                verse,
+                const.FONT_PATH,
+                self.layout.px(font_size),
+                const.TEXT_COLOR,
+                const.BG_COLOR,
+                self.layout.width,
+                self.layout.height,
+            ),
+            lambda: self.render_index(verse, font_size),
+        )
+
+    def render_index(self, verse: str, font_size: int) -> Image:
+        img = Image(
+            width=self.layout.width,
+            height=self.layout.height,
             background=Color(const.BG_COLOR),
-        ) as img:
-            img.caption(
-                verse + ".",
-                font=Font(
-                    const.FONT_PATH,
-                    size=font_size,
-                    color=Color(const.TEXT_COLOR),
-                ),
-            )
-            img.trim()
-            return img.clone()
+        )
+        img.caption(
+            verse + ".",
+            font=Font(
+                const.FONT_PATH,
+                size=self.layout.px(font_size),
+                color=Color(const.TEXT_COLOR),
+            ),
+        )
+        img.trim()
+        return img
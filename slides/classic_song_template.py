@@ -13,6 +13,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
+from threading import Lock
+
 from wand.image import Image
 from wand.drawing import Drawing
 from wand.color import Color
@@ -23,96 +26,184 @@ from utils import get_empty_image
 import config as const
 
 from .song_template import SongTemplate
+from .engine.layout import SlideLayout
+from .engine.sprite_cache import get_cached_sprite
+from .engine.text_fit import (
+    get_font_size_candidates,
+    get_first_fitting_font_size_index,
+    get_largest_raster_fitting_font_size,
+    measure_text,
+)
+
+TITLEBAR_TEXT_BORDER = 30
+
+title_font_sizes: OrderedDict[str, int | None] = OrderedDict()
+title_font_sizes_lock = Lock()
 
 
 class ClassicSongTemplate(SongTemplate):
-    def __init__(self) -> None:
+    def __init__(self, layout: SlideLayout | None = None) -> None:
+        super().__init__(layout)
         self.song_template = ""
 
     def get_base_image(self) -> Image:
-        with Image(
-            width=const.WIDTH,
-            height=const.HEIGHT,
+        return Image(
+            width=self.layout.width,
+            height=self.layout.height,
             background=Color(const.BG_COLOR),
-        ) as img:
-            return img.clone()
+        )
 
     def get_titlebar_rectangle(self, text: str) -> Image:
-        font_size = const.MAX_TITLE_FONT_SIZE
-        while font_size >= const.MIN_TITLE_FONT_SIZE:
-            with Image(
-                width=const.WIDTH,
-                height=const.TITLE_HEIGHT,
+        font_size, title_img = self.get_title_fit(text)
+        if font_size is None:
+            return get_empty_image()
+        if title_img is None:
+            title_img = self.get_title_caption(text, font_size)
+        return self.get_titlebar_from_caption(title_img)
+
+    # like the slide text, the title is fitted only once in layout units,
+    # every other output resolution rasterizes the fitted font size. The
+    # caption that passed the check is returned along if it is usable here.
+    def get_title_fit(self, text: str) -> tuple[int | None, Image | None]:
+        with title_font_sizes_lock:
+            if text in title_font_sizes:
+                title_font_sizes.move_to_end(text)
+                return title_font_sizes[text], None
+
+        base_template = (
+            self if self.layout.is_base_layout() else ClassicSongTemplate()
+        )
+        max_width = (
+            const.WIDTH - const.PLAYER_WIDTH - const.TITLEBAR_TRIANGLE_WIDTH
+        )
+        font_sizes = get_font_size_candidates(
+            const.MAX_TITLE_FONT_SIZE,
+            const.MIN_TITLE_FONT_SIZE,
+            const.TITLE_FONT_SIZE_STEP,
+        )
+        first_fitting_index = get_first_fitting_font_size_index(
+            font_sizes,
+            lambda font_size: measure_text(
+                text, const.BOLD_FONT_PATH, font_size
+            )[0]
+            + 2 * TITLEBAR_TEXT_BORDER
+            <= max_width,
+        )
+        # as with the text canvas, the metrics are only an estimate of the
+        # trimmed caption, so it is checked before the titlebar gets built
+        probed_captions: dict[int, Image] = {}
+        font_size = get_largest_raster_fitting_font_size(
+            font_sizes,
+            first_fitting_index,
+            lambda font_size: base_template.title_caption_fits(
+                text, font_size, max_width, probed_captions
+            ),
+        )
+        title_img = None
+        if base_template is self:
+            title_img = probed_captions.pop(font_size, None)
+        for rejected_img in probed_captions.values():
+            rejected_img.close()
+
+        with title_font_sizes_lock:
+            title_font_sizes[text] = font_size
+            while len(title_font_sizes) > const.SONG_TEMPLATE_CACHE_SIZE:
+                title_font_sizes.popitem(last=False)
+        return font_size, title_img
+
+    def title_caption_fits(
+        self,
+        text: str,
+        font_size: int,
+        max_width: int,
+        probed_captions: dict[int, Image],
+    ) -> bool:
+        title_img = self.get_title_caption(text, font_size)
+        probed_captions[font_size] = title_img
+        return title_img.width <= self.layout.px(max_width)
+
+    def get_title_caption(self, text: str, font_size: int) -> Image:
+        img = Image(
+            width=self.layout.width,
+            height=self.layout.px(const.TITLE_HEIGHT),
+            background=Color(const.FG_COLOR),
+        )
+        img.caption(
+            text,
+            font=Font(
+                const.BOLD_FONT_PATH,
+                size=self.layout.px(font_size),
+                color=Color(const.TITLE_COLOR),
+            ),
+        )
+        img.trim()
+        img.border(
+            color=Color(const.FG_COLOR),
+            width=self.layout.px(TITLEBAR_TEXT_BORDER),
+            height=0,
+        )
+        return img
+
+    def get_titlebar_from_caption(self, title_img: Image) -> Image:
+        with title_img:
+            titlebar_img = Image(
+                width=title_img.width,
+                height=self.layout.px(const.TITLEBAR_TRIANGLE_HEIGTH),
                 background=Color(const.FG_COLOR),
-            ) as img:
-                img.caption(
-                    text,
-                    font=Font(
-                        const.BOLD_FONT_PATH,
-                        size=font_size,
-                        color=Color(const.TITLE_COLOR),
-                    ),
-                )
-                img.trim()
-                img.border(color=Color(const.FG_COLOR), width=30, height=0)
-                trimmed_img_width = img.width
-                trimmed_img_height = img.height
-                concat_height = int(
-                    (const.TITLE_HEIGHT - trimmed_img_height) / 2
-                )
-                correction_heigt = (
-                    const.TITLEBAR_TRIANGLE_HEIGTH
-                    - trimmed_img_height
-                    - (2 * concat_height)
-                )
-                concatenated_img = Image(
-                    width=trimmed_img_width,
-                    height=concat_height,
-                    background=Color(const.FG_COLOR),
-                )
-                concatenated_img.sequence.append(img)
-                concatenated_img.sequence.append(
-                    Image(
-                        width=trimmed_img_width,
-                        height=concat_height + correction_heigt,
-                        background=Color(const.FG_COLOR),
-                    )
-                )
-                concatenated_img.concat(stacked=True)
-                if concatenated_img.width > (
-                    const.WIDTH
-                    - const.PLAYER_WIDTH
-                    - const.TITLEBAR_TRIANGLE_WIDTH
-                ):
-                    font_size -= const.TITLE_FONT_SIZE_STEP
-                    continue
-
-                return concatenated_img.clone()
-        return get_empty_image()
+            )
+            titlebar_img.composite(
+                title_img,
+                top=int(
+                    (self.layout.px(const.TITLE_HEIGHT) - title_img.height) / 2
+                ),
+                left=0,
+            )
+        return titlebar_img
 
     def get_template(self, title: str) -> Image:
         titlebar_rectangle = self.get_titlebar_rectangle(title)
         titlebar_rectangle.sequence.append(self.get_titlebar_triangle())
         titlebar_rectangle.concat(stacked=False)
         base_img = self.get_base_image()
-        base_img.composite(titlebar_rectangle, top=const.TITLEBAR_Y)
-        self.song_template = base_img.clone()
-        return base_img.clone()
+        with titlebar_rectangle:
+            base_img.composite(
+                titlebar_rectangle, top=self.layout.px(const.TITLEBAR_Y)
+            )
+        self.song_template = base_img
+        return base_img
 
     def get_titlebar_triangle(self) -> Image:
+        triangle_width = self.layout.px(const.TITLEBAR_TRIANGLE_WIDTH)
+        triangle_height = self.layout.px(const.TITLEBAR_TRIANGLE_HEIGTH)
+        return get_cached_sprite(
+            (
+                "titlebar_triangle",
+                triangle_width,
+                triangle_height,
+                const.FG_COLOR,
+                const.BG_COLOR,
+            ),
+            lambda: self.render_titlebar_triangle(
+                triangle_width, triangle_height
+            ),
+        )
+
+    def render_titlebar_triangle(
+        self, triangle_width: int, triangle_height: int
+    ) -> Image:
         with Drawing() as draw:
             draw.fill_color = Color(const.FG_COLOR)
             draw.path_start()
-            draw.path_move(to=(const.TITLEBAR_TRIANGLE_WIDTH, 0))
+            draw.path_move(to=(triangle_width, 0))
             draw.path_line(to=(0, 0))
-            draw.path_line(to=(0, const.TITLEBAR_TRIANGLE_HEIGTH))
+            draw.path_line(to=(0, triangle_height))
             draw.path_close()
             draw.path_finish()
 
-            with Image(
-                width=const.TITLEBAR_TRIANGLE_WIDTH,
-                height=const.TITLEBAR_TRIANGLE_HEIGTH,
+            img = Image(
+                width=triangle_width,
+                height=triangle_height,
                 background=Color(const.BG_COLOR),
-            ) as img:
-                draw(img)
-                return img.clone()
+            )
+            draw(img)
+            return img
@@ -30,33 +30,36 @@ class ClassicStartSlide(StartSlide):
         text_author: str,
         melody_author: str,
     ) -> Image:
+        px = self.layout.px
         start_img = template_img.clone()
-        start_img.composite(
-            self.get_attributions(text_author, melody_author),
-            left=const.METADATA_X,
-            top=const.ATTRIBUTIONS_Y,
-        )
-        start_img.composite(
-            self.get_book(book), left=const.METADATA_X, top=const.BOOK_Y
-        )
-        return start_img.clone()
+        with self.get_attributions(text_author, melody_author) as attributions:
+            start_img.composite(
+                attributions,
+                left=px(const.METADATA_X),
+                top=px(const.ATTRIBUTIONS_Y),
+            )
+        with self.get_book(book) as book_img:
+            start_img.composite(
+                book_img, left=px(const.METADATA_X), top=px(const.BOOK_Y)
+            )
+        return start_img
 
     def get_metadata(self, text: str) -> Image:
-        with Image(
-            width=const.WIDTH,
-            height=const.HEIGHT,
+        img = Image(
+            width=self.layout.width,
+            height=self.layout.height,
             background=Color(const.BG_COLOR),
-        ) as img:
-            img.caption(
-                text,
-                font=Font(
-                    const.FONT_PATH,
-                    size=const.METADATA_FONT_SIZE,
-                    color=Color(const.TEXT_COLOR),
-                ),
-            )
-            img.trim()
-            return img.clone()
+        )
+        img.caption(
+            text,
+            font=Font(
+                const.FONT_PATH,
+                size=self.layout.px(const.METADATA_FONT_SIZE),
+                color=Color(const.TEXT_COLOR),
+            ),
+        )
+        img.trim()
+        return img
 
     def get_attributions(self, text_author: str, melody_author: str) -> Image:
         if text_author == melody_author:
@@ -0,0 +1,105 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import io
+import shutil
+from time import perf_counter
+from dataclasses import dataclass
+
+from PIL.Image import Image as PillowImage
+
+import config as const
+
+from .svg_image import SvgImage
+
+
+@dataclass
+class EncodedSlide:
+    data: bytes
+    encode_seconds: float
+
+
+def encode_slide(slide_img) -> EncodedSlide:
+    start_time = perf_counter()
+    image_format = const.IMAGE_FORMAT.lower()
+    if isinstance(slide_img, SvgImage):
+        data = slide_img.to_bytes()
+    elif isinstance(slide_img, PillowImage):
+        data = encode_pillow_slide(slide_img, image_format)
+    else:
+        data = encode_wand_slide(slide_img, image_format)
+    return EncodedSlide(data, perf_counter() - start_time)
+
+
+def encode_wand_slide(slide_img, image_format: str) -> bytes:
+    slide_img.format = image_format
+    if image_format in ("jpeg", "jpg"):
+        slide_img.compression_quality = const.JPEG_QUALITY
+        slide_img.options["jpeg:sampling-factor"] = const.JPEG_SAMPLING_FACTOR
+    elif image_format == "png":
+        slide_img.options["png:compression-level"] = str(
+            const.PNG_COMPRESSION_LEVEL
+        )
+    elif image_format == "webp":
+        slide_img.compression_quality = const.WEBP_QUALITY
+        slide_img.options["webp:lossless"] = str(const.WEBP_LOSSLESS).lower()
+    return slide_img.make_blob()
+
+
+def encode_pillow_slide(slide_img: PillowImage, image_format: str) -> bytes:
+    buffer = io.BytesIO()
+    if image_format in ("jpeg", "jpg"):
+        slide_img.save(
+            buffer,
+            format="JPEG",
+            quality=const.JPEG_QUALITY,
+            subsampling=const.JPEG_SAMPLING_FACTOR,
+        )
+    elif image_format == "png":
+        slide_img.save(
+            buffer, format="PNG", compress_level=const.PNG_COMPRESSION_LEVEL
+        )
+    elif image_format == "webp":
+        slide_img.save(
+            buffer,
+            format="WEBP",
+            quality=const.WEBP_QUALITY,
+            lossless=const.WEBP_LOSSLESS,
+        )
+    else:
+        slide_img.save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+# obs may reload the slideshow at any time, so the slide is written under a
+# hidden temporary name first and only renamed when it is complete
+def write_slide_atomically(data: bytes, filename: str) -> None:
+    temp_filename = get_temp_slide_filename(filename)
+    with open(temp_filename, mode="wb") as slide_writer:
+        slide_writer.write(data)
+    os.replace(temp_filename, filename)
+
+
+def copy_slide_atomically(source_filename: str, filename: str) -> None:
+    temp_filename = get_temp_slide_filename(filename)
+    shutil.copyfile(source_filename, temp_filename)
+    os.replace(temp_filename, filename)
+
+
+def get_temp_slide_filename(filename: str) -> str:
+    return os.path.join(
+        os.path.dirname(filename), "." + os.path.basename(filename) + ".tmp"
+    )
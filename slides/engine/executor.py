@@ -0,0 +1,104 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from enum import Enum
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import multiprocessing
+
+from wand.resource import limits
+
+from utils import enable_tracing, is_tracing_enabled
+
+import config as const
+
+
+class RenderBackend(Enum):
+    PROCESS = "process"
+    THREAD = "thread"
+    SEQUENTIAL = "sequential"
+
+
+class SequentialExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        # pylint: disable-next=broad-except
+        except (Exception, SystemExit) as error:
+            future.set_exception(error)
+        return future
+
+
+def get_render_worker_count() -> int:
+    if const.RENDER_MAX_WORKERS > 0:
+        return const.RENDER_MAX_WORKERS
+    return os.cpu_count() or 1
+
+
+def get_magick_memory_limit() -> int:
+    return const.RENDER_MAGICK_MEMORY_LIMIT_MEGABYTES * 1024 * 1024
+
+
+# every worker already renders a slide on its own core, so the OpenMP threads
+# of ImageMagick would only oversubscribe the cpu
+def init_render_worker(
+    trace_enabled: bool = False, magick_memory_limit: int = 0
+) -> None:
+    if const.RENDER_MAGICK_THREAD_LIMIT > 0:
+        limits["thread"] = const.RENDER_MAGICK_THREAD_LIMIT
+    # beyond its memory limit, ImageMagick falls back to a disk cache
+    if magick_memory_limit > 0:
+        limits["memory"] = magick_memory_limit
+    if trace_enabled:
+        enable_tracing()
+
+
+def get_slide_executor(render_backend: RenderBackend) -> Executor:
+    if render_backend == RenderBackend.PROCESS:
+        # spawn instead of fork, as forking after ImageMagick and its OpenMP
+        # runtime have been initialised can deadlock the workers
+        return ProcessPoolExecutor(
+            max_workers=get_render_worker_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_render_worker,
+            # the memory budget is meant for the whole pool, so every
+            # worker only gets its share of it
+            initargs=(
+                is_tracing_enabled(),
+                get_magick_memory_limit() // get_render_worker_count(),
+            ),
+        )
+    if render_backend == RenderBackend.THREAD:
+        init_render_worker(magick_memory_limit=get_magick_memory_limit())
+        return ThreadPoolExecutor(max_workers=get_render_worker_count())
+    return SequentialExecutor()
+
+
+def warm_up_render_worker() -> None:
+    pass
+
+
+# process pool workers are only spawned on demand and then still have to
+# import ImageMagick, so they get started while the user is choosing a song
+def warm_up_render_workers(executor: Executor) -> None:
+    if isinstance(executor, ProcessPoolExecutor):
+        for _ in range(get_render_worker_count()):
+            executor.submit(warm_up_render_worker)
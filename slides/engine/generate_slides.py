@@ -13,21 +13,67 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from threading import Thread
-from os import path, utime
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from os import makedirs, path, utime
 from pathlib import Path
-from re import compile
+from re import compile, escape
 import datetime
 
-from wand.exceptions import BlobError
+from wand.exceptions import WandException
 
-from utils import (
-    log,
-    error_msg,
-)
+from utils import log, trace_span, collect_trace_events, add_trace_events
 
 import config as const
 
+from ..slide_style import SlideStyle
+from .song_template import get_song_template
+from .layout import SlideLayout, get_output_layouts, get_layout_filename
+from .encoder import encode_slide, write_slide_atomically
+from .slide_cache import (
+    get_slide_cache_key,
+    copy_cached_slide,
+    store_slide_in_cache,
+    prune_slide_cache,
+    log_slide_cache_stats,
+)
+
+
+@dataclass
+class StartSlideJob:
+    slide_style: SlideStyle
+    title: str
+    book: str
+    text_author: str
+    melody_author: str
+    filename: str
+    layouts: tuple[SlideLayout, ...]
+
+
+@dataclass
+class SongSlideJob:
+    slide_style: SlideStyle
+    title: str
+    slide_text: str
+    song_structure: list
+    index: int
+    use_arrow: bool
+    slide_number: int
+    filename: str
+    layouts: tuple[SlideLayout, ...]
+
+
+@dataclass
+class SlideRenderStatus:
+    slide_number: int
+    filename: str
+    success: bool
+    message: str = ""
+    cache_hit: bool = False
+    encode_seconds: float = 0.0
+    size_bytes: int = 0
+    trace_events: list = field(default_factory=list)
+
 
 # used in attempt to get a correct ordering as obs image slide shows ignores
 # filenames, but it appearently also ignores a/m-times as seen in
@@ -37,7 +83,9 @@ def fix_timestamps(slidegen):
 
     folder = Path(slidegen.output_dir).resolve()
 
-    pattern = compile(rf"{const.FILE_NAMING}(\d+)\.jpg$")
+    pattern = compile(
+        rf"{const.FILE_NAMING}(\d+)\.{escape(const.FILE_EXTENSION)}$"
+    )
 
     slides = []
     for f in folder.iterdir():
@@ -58,162 +106,319 @@ def fix_timestamps(slidegen):
         utime(file_path, (ts, ts))
 
 
+def get_slide_filename(slidegen, slide_number: int, zfill_length: int) -> str:
+    return path.join(
+        slidegen.output_dir,
+        const.FILE_NAMING
+        + str(slide_number).zfill(zfill_length)
+        + "."
+        + const.FILE_EXTENSION,
+    )
+
+
+def split_structure_element(structure_element_value: str) -> list[str]:
+    structure_element_splitted: list = structure_element_value.splitlines()
+    line_count = len(structure_element_splitted)
+    if line_count <= const.STRUCTURE_ELEMENT_MAX_LINES:
+        return [structure_element_value]
+
+    inner_slide_count: int = (
+        line_count // const.STRUCTURE_ELEMENT_MAX_LINES + 1
+    )
+    use_lines_per_index = [line_count // inner_slide_count] * inner_slide_count
+
+    for inner_slide in range(inner_slide_count):
+        if sum(use_lines_per_index) == line_count:
+            break
+        use_lines_per_index[inner_slide] = use_lines_per_index[inner_slide] + 1
+
+    inner_slide_texts = []
+    for inner_slide in range(inner_slide_count):
+        first_line = sum(use_lines_per_index[:inner_slide])
+        inner_slide_texts.append(
+            "\n".join(
+                structure_element_splitted[
+                    first_line : first_line + use_lines_per_index[inner_slide]
+                ]
+            )
+        )
+    return inner_slide_texts
+
+
 def generate_slides(
-    slidegen, slide_count, template_img, zfill_length, disable_async: bool
-) -> list[Thread]:
+    slidegen, slide_count, zfill_length, executor: Executor
+) -> list[Future]:
     log("generating song slides...")
 
-    current_slide_index: int = 0
+    layouts = get_output_layouts()
+    for layout in layouts:
+        if not layout.is_base_layout():
+            makedirs(
+                path.join(slidegen.output_dir, layout.name), exist_ok=True
+            )
 
-    log("spawning subprocess for start slide...", color="yellow")
+    current_slide_index: int = 0
 
-    threads = [
-        Thread(
-            target=generate_start_slide,
-            args=(slidegen, template_img, zfill_length, disable_async),
+    log("submitting start slide...", color="yellow")
+
+    futures = [
+        executor.submit(
+            generate_start_slide,
+            StartSlideJob(
+                slidegen.slide_style,
+                slidegen.metadata["title"],
+                slidegen.metadata["book"],
+                slidegen.metadata["text"],
+                slidegen.metadata["melody"],
+                get_slide_filename(slidegen, 1, zfill_length),
+                layouts,
+            ),
         )
     ]
 
     for index, structure in enumerate(slidegen.chosen_structure):
-        structure_element_splitted: list = slidegen.songtext[
-            structure
-        ].splitlines()
-        line_count = len(structure_element_splitted)
-        use_line_ranges_per_index = []
-        use_lines_per_index = []
-        if line_count <= const.STRUCTURE_ELEMENT_MAX_LINES:
-            inner_slide_count = 1
-        else:
-            inner_slide_count: int = (
-                line_count // const.STRUCTURE_ELEMENT_MAX_LINES + 1
-            )
-            use_lines_per_index = [
-                line_count // inner_slide_count
-            ] * inner_slide_count
-
-            for inner_slide in range(inner_slide_count):
-                if sum(use_lines_per_index) == line_count:
-                    break
-                use_lines_per_index[inner_slide] = (
-                    use_lines_per_index[inner_slide] + 1
-                )
-            for inner_slide in range(inner_slide_count):
-                use_line_ranges_per_index.append(
-                    sum(use_lines_per_index[:inner_slide])
-                )
-
-        for inner_slide in range(inner_slide_count):
+        inner_slide_texts = split_structure_element(
+            slidegen.songtext[structure]
+        )
+        inner_slide_count = len(inner_slide_texts)
+        for inner_slide, structure_element_value in enumerate(
+            inner_slide_texts
+        ):
             current_slide_index += 1
 
             log(
-                "spawning subprocess for song slide [{} / {}]...".format(
+                "submitting song slide [{} / {}]...".format(
                     current_slide_index, slide_count
                 ),
                 color="yellow",
             )
 
-            if inner_slide_count == 1:
-                structure_element_value: str = slidegen.songtext[structure]
-            else:
-                splitted_wanted_range: list = structure_element_splitted[
-                    use_line_ranges_per_index[
-                        inner_slide
-                    ] : use_line_ranges_per_index[inner_slide]
-                    + use_lines_per_index[inner_slide]
-                ]
-                structure_element_value: str = ""
-                for element in splitted_wanted_range:
-                    structure_element_value += element + "\n"
-
-                structure_element_value = structure_element_value[:-1]
-
-            threads.append(
-                Thread(
-                    target=generate_song_slide,
-                    args=(
-                        slidegen.slide_style.song_slide_form,
-                        template_img,
+            futures.append(
+                executor.submit(
+                    generate_song_slide,
+                    SongSlideJob(
+                        slidegen.slide_style,
+                        slidegen.metadata["title"],
                         structure_element_value,
-                        slidegen,
+                        slidegen.chosen_structure,
                         index,
-                        inner_slide_count,
-                        inner_slide,
-                        current_slide_index,
-                        zfill_length,
-                        disable_async,
+                        bool(
+                            inner_slide_count != 1
+                            and inner_slide != inner_slide_count - 1
+                        ),
+                        current_slide_index + 1,
+                        get_slide_filename(
+                            slidegen, current_slide_index + 1, zfill_length
+                        ),
+                        layouts,
                     ),
                 )
             )
 
-    for thread in threads:
-        thread.start()
+    return futures
+
+
+def generate_start_slide(job: StartSlideJob) -> SlideRenderStatus:
+    with collect_trace_events() as trace_events:
+        with trace_span("start slide", slide=1):
+            status = render_start_slide(job)
+    status.trace_events = trace_events
+    return status
 
-    return threads
 
+def generate_song_slide(job: SongSlideJob) -> SlideRenderStatus:
+    with collect_trace_events() as trace_events:
+        with trace_span("song slide", slide=job.slide_number):
+            status = render_song_slide(job)
+    status.trace_events = trace_events
+    return status
 
-def generate_start_slide(slidegen, template_img, zfill_length, disable_async):
-    first_slide = slidegen.slide_style.start_slide_form()
-    start_slide_img = first_slide.get_slide(
-        template_img,
-        slidegen.metadata["book"],
-        slidegen.metadata["text"],
-        slidegen.metadata["melody"],
+
+def render_start_slide(job: StartSlideJob) -> SlideRenderStatus:
+    return merge_layout_statuses(
+        [
+            render_start_slide_layout(job, layout)
+            for layout in job.layouts
+        ]
     )
-    start_slide_img.format = const.IMAGE_FORMAT
-    try:
-        start_slide_img.save(
-            filename=path.join(
-                slidegen.output_dir,
-                const.FILE_NAMING
-                + "1".zfill(zfill_length)
-                + "."
-                + const.FILE_EXTENSION,
-            )
-        )
-        if disable_async:
-            log("start slide generated and saved")
-    except BlobError:
-        error_msg("could not write start slide to target directory")
-
-
-def generate_song_slide(
-    song_slide,
-    template_img,
-    structure_element_value,
-    slidegen,
-    index,
-    inner_slide_count,
-    inner_slide,
-    current_slide_index,
-    zfill_length,
-    disable_async,
-):
-    song_slide_img = song_slide.get_slide(
-        self=slidegen.slide_style.song_slide_form(),
-        template_img=template_img,
-        slide_text=structure_element_value,
-        song_structure=slidegen.chosen_structure,
-        index=index,
-        use_arrow=bool(
-            inner_slide_count != 1 and inner_slide != inner_slide_count - 1
-        ),
+
+
+def render_start_slide_layout(
+    job: StartSlideJob, layout: SlideLayout
+) -> SlideRenderStatus:
+    filename = get_layout_filename(job.filename, layout)
+    cache_key = get_slide_cache_key(
+        job.slide_style,
+        "start",
+        layout.name,
+        job.title,
+        job.book,
+        job.text_author,
+        job.melody_author,
     )
-    song_slide_img.format = const.IMAGE_FORMAT
-    try:
-        song_slide_img.save(
-            filename=path.join(
-                slidegen.output_dir,
-                const.FILE_NAMING
-                + str(current_slide_index + 1).zfill(zfill_length)
-                + "."
-                + const.FILE_EXTENSION,
+    with trace_span("slide cache lookup", layout=layout.name):
+        cache_hit = copy_cached_slide(cache_key, filename)
+    if cache_hit:
+        return SlideRenderStatus(1, filename, True, cache_hit=True)
+
+    with trace_span("song template", layout=layout.name):
+        template_img = get_song_template(
+            job.slide_style.song_template_form, job.title, layout
+        )
+    with trace_span("compositing", layout=layout.name):
+        start_slide_img = job.slide_style.start_slide_form(layout).get_slide(
+            template_img,
+            job.book,
+            job.text_author,
+            job.melody_author,
+        )
+    return save_slide(start_slide_img, 1, filename, cache_key)
+
+
+# the text fit is searched only once in layout units, the first time one of
+# the output resolutions misses the slide cache, so that every further
+# resolution only costs its rasterization and encoding
+def render_song_slide(job: SongSlideJob) -> SlideRenderStatus:
+    font_size = None
+    statuses = []
+    for layout in job.layouts:
+        filename = get_layout_filename(job.filename, layout)
+        cache_key = get_slide_cache_key(
+            job.slide_style,
+            "song",
+            layout.name,
+            job.title,
+            job.slide_text,
+            job.song_structure,
+            job.index,
+            job.use_arrow,
+        )
+        with trace_span("slide cache lookup", layout=layout.name):
+            cache_hit = copy_cached_slide(cache_key, filename)
+        if cache_hit:
+            statuses.append(
+                SlideRenderStatus(
+                    job.slide_number, filename, True, cache_hit=True
+                )
+            )
+            continue
+
+        if font_size is None:
+            with trace_span("text fit"):
+                font_size = job.slide_style.song_slide_form().get_text_fit(
+                    job.slide_text
+                )
+        with trace_span("song template", layout=layout.name):
+            template_img = get_song_template(
+                job.slide_style.song_template_form, job.title, layout
             )
+        with trace_span("compositing", layout=layout.name):
+            song_slide_img = job.slide_style.song_slide_form(layout).get_slide(
+                template_img=template_img,
+                slide_text=job.slide_text,
+                font_size=font_size,
+                song_structure=job.song_structure,
+                index=job.index,
+                use_arrow=job.use_arrow,
+            )
+        statuses.append(
+            save_slide(song_slide_img, job.slide_number, filename, cache_key)
         )
-        if disable_async:
-            log("song slide {} generated and saved".format(current_slide_index))
-    except BlobError:
-        error_msg(
-            "could not write song slide {} to target directory".format(
-                current_slide_index
+    return merge_layout_statuses(statuses)
+
+
+# reports the slide of the base resolution, which the statuses start with,
+# and only fails it if the slide of any resolution could not be written
+def merge_layout_statuses(
+    statuses: list[SlideRenderStatus],
+) -> SlideRenderStatus:
+    status = statuses[0]
+    for layout_status in statuses[1:]:
+        if status.success and not layout_status.success:
+            status.success = False
+            status.message = "{}: {}".format(
+                layout_status.filename, layout_status.message
             )
+        status.cache_hit = status.cache_hit and layout_status.cache_hit
+        status.encode_seconds += layout_status.encode_seconds
+        status.size_bytes += layout_status.size_bytes
+    return status
+
+
+def save_slide(
+    slide_img, slide_number: int, filename: str, cache_key: str
+) -> SlideRenderStatus:
+    try:
+        with trace_span("encode"):
+            encoded_slide = encode_slide(slide_img)
+        with trace_span("write", size_bytes=len(encoded_slide.data)):
+            write_slide_atomically(encoded_slide.data, filename)
+    except (WandException, OSError) as error:
+        return SlideRenderStatus(slide_number, filename, False, str(error))
+    with trace_span("slide cache store"):
+        store_slide_in_cache(cache_key, filename)
+    return SlideRenderStatus(
+        slide_number,
+        filename,
+        True,
+        encode_seconds=encoded_slide.encode_seconds,
+        size_bytes=len(encoded_slide.data),
+    )
+
+
+def wait_for_slides(futures: list[Future]) -> list[SlideRenderStatus]:
+    statuses = []
+    with trace_span("wait for slides", slide_count=len(futures)):
+        for future in futures:
+            status = get_slide_status(future)
+            if status is not None:
+                statuses.append(status)
+
+    finish_slides(statuses)
+    return statuses
+
+
+def get_slide_status(future: Future) -> SlideRenderStatus | None:
+    try:
+        status = future.result()
+    except (Exception, SystemExit) as error:  # pylint: disable=broad-except
+        log("could not generate slide: {}".format(error), color="red")
+        return None
+    add_trace_events(status.trace_events)
+    if not status.success:
+        log(
+            "could not write slide {} to '{}': {}".format(
+                status.slide_number, status.filename, status.message
+            ),
+            color="red",
         )
+    return status
+
+
+def finish_slides(statuses: list[SlideRenderStatus]) -> None:
+    log_encoder_stats(statuses)
+    log_slide_cache_stats(statuses)
+    prune_slide_cache()
+
+
+def log_encoder_stats(statuses: list[SlideRenderStatus]) -> None:
+    encoded_statuses = [
+        status
+        for status in statuses
+        if status.success and not status.cache_hit
+    ]
+    if len(encoded_statuses) == 0:
+        return
+    log(
+        "encoded {} slides as {}: {:.1f} ms and {:.1f} KiB per slide".format(
+            len(encoded_statuses),
+            const.IMAGE_FORMAT,
+            1000
+            * sum(status.encode_seconds for status in encoded_statuses)
+            / len(encoded_statuses),
+            sum(status.size_bytes for status in encoded_statuses)
+            / len(encoded_statuses)
+            / 1024,
+        ),
+        color="cyan",
+    )
@@ -0,0 +1,89 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass
+from os import path
+import re
+
+from utils import error_msg
+
+import config as const
+
+RESOLUTION_PATTERN = re.compile(r"^(\d+)x(\d+)$")
+
+
+# all geometry and font sizes of the config are given in layout units, which
+# are the pixels of the WIDTH x HEIGHT base resolution. A layout rasterizes
+# them at another resolution of the same aspect ratio.
+@dataclass(frozen=True)
+class SlideLayout:
+    width: int
+    height: int
+
+    @property
+    def name(self) -> str:
+        return "{}x{}".format(self.width, self.height)
+
+    @property
+    def scale(self) -> float:
+        return self.width / const.WIDTH
+
+    def is_base_layout(self) -> bool:
+        return self.width == const.WIDTH and self.height == const.HEIGHT
+
+    def px(self, layout_units: float) -> int:
+        return round(layout_units * self.scale)
+
+
+def get_base_layout() -> SlideLayout:
+    return SlideLayout(const.WIDTH, const.HEIGHT)
+
+
+def parse_resolution(resolution: str) -> SlideLayout:
+    match = RESOLUTION_PATTERN.match(resolution.strip())
+    if not match:
+        error_msg(
+            "invalid output resolution '{}', use WIDTHxHEIGHT".format(
+                resolution
+            )
+        )
+    layout = SlideLayout(int(match.group(1)), int(match.group(2)))
+    if layout.width == 0 or layout.height != round(
+        layout.width * const.HEIGHT / const.WIDTH
+    ):
+        error_msg(
+            "output resolution '{}' does not match the aspect ratio of "
+            "{}x{}".format(resolution, const.WIDTH, const.HEIGHT)
+        )
+    return layout
+
+
+def get_output_layouts() -> tuple[SlideLayout, ...]:
+    layouts = [get_base_layout()]
+    for resolution in const.OUTPUT_RESOLUTIONS:
+        layout = parse_resolution(resolution)
+        if layout not in layouts:
+            layouts.append(layout)
+    return tuple(layouts)
+
+
+# the slides of the base resolution stay directly in the output directory,
+# the ones of every other resolution go into a subdirectory named after it
+def get_layout_filename(filename: str, layout: SlideLayout) -> str:
+    if layout.is_base_layout():
+        return filename
+    return path.join(
+        path.dirname(filename), layout.name, path.basename(filename)
+    )
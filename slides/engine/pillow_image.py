@@ -0,0 +1,160 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+# margin around the text bounding box reported by pillow, so that glyphs
+# reaching outside of it are not cut off before the canvas gets trimmed
+TEXT_MARGIN = 4
+
+
+@lru_cache(maxsize=64)
+def get_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(font_path, font_size)
+
+
+@lru_cache(maxsize=32)
+def get_color(color: str) -> tuple:
+    return ImageColor.getrgb(color)[:3]
+
+
+def get_line_height(
+    font: ImageFont.FreeTypeFont, interline_spacing: int
+) -> int:
+    ascent, descent = font.getmetrics()
+    return ascent + descent + interline_spacing
+
+
+# same as ImageMagick, the first baseline is placed at the given offset and
+# every following line is moved down by the font height plus the spacing
+def get_text_bbox(
+    text: str, font: ImageFont.FreeTypeFont, interline_spacing: int
+) -> tuple[int, int, int, int]:
+    line_height = get_line_height(font, interline_spacing)
+    left = top = 2**31
+    right = bottom = -(2**31)
+    for line_number, line in enumerate(text.split("\n")):
+        if line == "":
+            continue
+        line_left, line_top, line_right, line_bottom = font.getbbox(
+            line, anchor="ls"
+        )
+        baseline = line_number * line_height
+        left = min(left, line_left)
+        top = min(top, baseline + line_top)
+        right = max(right, line_right)
+        bottom = max(bottom, baseline + line_bottom)
+    if right < left:
+        return 0, 0, 0, 0
+    return left, top, right, bottom
+
+
+def get_trimmed_text_size(
+    text: str, font_path: str, font_size: int, interline_spacing: int = 0
+) -> tuple[int, int]:
+    left, top, right, bottom = get_text_bbox(
+        text, get_font(font_path, font_size), interline_spacing
+    )
+    return right - left, bottom - top
+
+
+def trim_array(img_array: np.ndarray, bg_color: tuple) -> np.ndarray:
+    mask = np.any(img_array != np.array(bg_color, dtype=np.uint8), axis=2)
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    if rows.size == 0:
+        return img_array[:1, :1]
+    return img_array[rows[0] : rows[-1] + 1, cols[0] : cols[-1] + 1]
+
+
+def draw_trimmed_text(
+    text: str,
+    font_path: str,
+    font_size: int,
+    text_color: str,
+    bg_color: str,
+    interline_spacing: int = 0,
+) -> np.ndarray:
+    font = get_font(font_path, font_size)
+    left, top, right, bottom = get_text_bbox(text, font, interline_spacing)
+    img = Image.new(
+        "RGB",
+        (right - left + 2 * TEXT_MARGIN, bottom - top + 2 * TEXT_MARGIN),
+        get_color(bg_color),
+    )
+    draw = ImageDraw.Draw(img)
+    line_height = get_line_height(font, interline_spacing)
+    for line_number, line in enumerate(text.split("\n")):
+        draw.text(
+            (
+                TEXT_MARGIN - left,
+                TEXT_MARGIN - top + line_number * line_height,
+            ),
+            line,
+            fill=get_color(text_color),
+            font=font,
+            anchor="ls",
+        )
+    return trim_array(np.asarray(img), get_color(bg_color))
+
+
+# draws the polygon in a higher resolution and scales it down afterwards, as
+# pillow does not antialias polygons itself
+def draw_polygon(
+    width: int,
+    height: int,
+    points: list[tuple[float, float]],
+    fill_color: str,
+    bg_color: str,
+    supersampling: int = 4,
+) -> np.ndarray:
+    img = Image.new(
+        "RGB",
+        (width * supersampling, height * supersampling),
+        get_color(bg_color),
+    )
+    ImageDraw.Draw(img).polygon(
+        [(x * supersampling, y * supersampling) for x, y in points],
+        fill=get_color(fill_color),
+    )
+    return np.asarray(img.resize((width, height), Image.LANCZOS))
+
+
+def new_array(width: int, height: int, color: str) -> np.ndarray:
+    img_array = np.empty((height, width, 3), dtype=np.uint8)
+    img_array[:, :] = get_color(color)
+    return img_array
+
+
+# like the composite of ImageMagick, the parts of the overlay that lie outside
+# of the base array are simply clipped away
+def composite_array(
+    base: np.ndarray, overlay: np.ndarray, left: int = 0, top: int = 0
+) -> None:
+    base_height, base_width = base.shape[:2]
+    overlay_height, overlay_width = overlay.shape[:2]
+    clipped_left = max(left, 0)
+    clipped_top = max(top, 0)
+    clipped_right = min(left + overlay_width, base_width)
+    clipped_bottom = min(top + overlay_height, base_height)
+    if clipped_right <= clipped_left or clipped_bottom <= clipped_top:
+        return
+    base[clipped_top:clipped_bottom, clipped_left:clipped_right] = overlay[
+        clipped_top - top : clipped_bottom - top,
+        clipped_left - left : clipped_right - left,
+    ]
@@ -0,0 +1,63 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from dataclasses import dataclass
+
+import numpy as np
+from PIL import Image
+
+import config as const
+
+
+@dataclass
+class PixelDiff:
+    mean_diff: float
+    differing_share: float
+    diff_img: Image.Image
+
+    def within_tolerance(
+        self,
+        max_mean: float | None = None,
+        max_differing_share: float | None = None,
+    ) -> bool:
+        if max_mean is None:
+            max_mean = const.PIXEL_DIFF_MAX_MEAN
+        if max_differing_share is None:
+            max_differing_share = const.PIXEL_DIFF_MAX_DIFFERING_SHARE
+        return (
+            self.mean_diff <= max_mean
+            and self.differing_share <= max_differing_share
+        )
+
+
+def get_pixel_diff(first_path: str, second_path: str) -> PixelDiff:
+    with Image.open(first_path) as first_img, Image.open(
+        second_path
+    ) as second_img:
+        first = np.asarray(first_img.convert("RGB"), dtype=np.int16)
+        second = np.asarray(second_img.convert("RGB"), dtype=np.int16)
+    if first.shape != second.shape:
+        return PixelDiff(255.0, 1.0, Image.new("L", (1, 1), 255))
+    # reducing the channels pairwise is much faster than max(axis=2)
+    channel_diff = np.abs(first - second)
+    diff = np.maximum(
+        np.maximum(channel_diff[..., 0], channel_diff[..., 1]),
+        channel_diff[..., 2],
+    )
+    return PixelDiff(
+        float(diff.mean()),
+        float(np.count_nonzero(diff > const.PIXEL_DIFF_THRESHOLD) / diff.size),
+        Image.fromarray(diff.astype(np.uint8)),
+    )
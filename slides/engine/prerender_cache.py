@@ -0,0 +1,90 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import json
+from hashlib import sha256
+
+from utils import log, expand_dir
+
+import config as const
+
+from .slide_cache import get_style_fingerprint
+from .encoder import copy_slide_atomically
+
+
+def get_prerender_cache_dir() -> str:
+    return os.path.join(
+        expand_dir(const.PRERENDER_CACHE_DIR),
+        "v{}".format(const.PRERENDER_CACHE_VERSION),
+    )
+
+
+def get_prerendered_slides_dir(
+    slide_style, song_file_path: str, song_file_digest: str = ""
+) -> str:
+    if not song_file_digest:
+        with open(song_file_path, mode="rb") as song_file_reader:
+            song_file_digest = sha256(song_file_reader.read()).hexdigest()
+    key = sha256(
+        json.dumps(
+            [
+                get_style_fingerprint(slide_style),
+                const.OUTPUT_RESOLUTIONS,
+                song_file_digest,
+            ],
+            ensure_ascii=False,
+        ).encode("utf-8")
+    ).hexdigest()
+    return os.path.join(get_prerender_cache_dir(), key)
+
+
+def copy_prerendered_slides(
+    slide_style, song_file_path: str, dest_dir: str
+) -> bool:
+    if const.PRERENDER_CACHE_DIR == "":
+        return False
+    try:
+        prerendered_slides_dir = get_prerendered_slides_dir(
+            slide_style, song_file_path
+        )
+        if not os.path.isdir(prerendered_slides_dir):
+            return False
+        copy_prerendered_slide_files(prerendered_slides_dir, dest_dir)
+    except (FileNotFoundError, PermissionError, IOError) as error:
+        log(
+            "could not copy prerendered slides. Reason: {}".format(error),
+            color="red",
+        )
+        return False
+    log("copied prerendered slides of '{}'".format(song_file_path))
+    return True
+
+
+# the slides are copied one by one under a temporary name, so that obs never
+# reads a partially copied slide from the live output directory
+def copy_prerendered_slide_files(
+    prerendered_slides_dir: str, dest_dir: str
+) -> None:
+    for current_dir, _, filenames in os.walk(prerendered_slides_dir):
+        current_dest_dir = os.path.join(
+            dest_dir, os.path.relpath(current_dir, prerendered_slides_dir)
+        )
+        os.makedirs(current_dest_dir, exist_ok=True)
+        for filename in sorted(filenames):
+            copy_slide_atomically(
+                os.path.join(current_dir, filename),
+                os.path.join(current_dest_dir, filename),
+            )
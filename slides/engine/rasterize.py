@@ -0,0 +1,75 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import ThreadPoolExecutor
+from re import compile, escape
+import os
+
+from wand.image import Image
+from wand.exceptions import WandException
+
+from utils import log
+
+import config as const
+
+from .encoder import encode_wand_slide, write_slide_atomically
+from .executor import get_render_worker_count
+
+
+def get_raster_file_extension(image_format: str) -> str:
+    return "jpg" if image_format == "jpeg" else image_format
+
+
+def get_svg_slide_files(slides_dir: str) -> list[str]:
+    pattern = compile(rf"{escape(const.FILE_NAMING)}\d+\.svg$")
+    svg_slide_files = []
+    # also covers the subdirectories of the additional output resolutions
+    for root, _, files in os.walk(slides_dir):
+        for file in sorted(files):
+            if pattern.match(file):
+                svg_slide_files.append(os.path.join(root, file))
+    return svg_slide_files
+
+
+def rasterize_svg_slide(svg_file_path: str, image_format: str) -> bool:
+    raster_file_path = "{}.{}".format(
+        os.path.splitext(svg_file_path)[0],
+        get_raster_file_extension(image_format),
+    )
+    try:
+        with Image(filename=svg_file_path, format="svg") as slide_img:
+            data = encode_wand_slide(slide_img, image_format)
+        write_slide_atomically(data, raster_file_path)
+    except (WandException, OSError) as error:
+        log(
+            "could not rasterize '{}': {}".format(svg_file_path, error),
+            color="red",
+        )
+        return False
+    return True
+
+
+def rasterize_svg_slides(slides_dir: str, image_format: str) -> int:
+    svg_slide_files = get_svg_slide_files(slides_dir)
+    with ThreadPoolExecutor(max_workers=get_render_worker_count()) as executor:
+        successes = list(
+            executor.map(
+                lambda svg_file_path: rasterize_svg_slide(
+                    svg_file_path, image_format
+                ),
+                svg_slide_files,
+            )
+        )
+    return sum(successes)
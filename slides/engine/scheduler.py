@@ -0,0 +1,163 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from heapq import heapify, heappush, heappop
+from itertools import count
+from threading import Lock
+from typing import Callable
+
+
+@dataclass(order=True)
+class ScheduledJob:
+    priority: tuple
+    slot: int = field(compare=False)
+    future: Future = field(compare=False)
+    fn: Callable = field(compare=False)
+    args: tuple = field(compare=False)
+    kwargs: dict = field(compare=False)
+
+
+@dataclass
+class SchedulerProgress:
+    queued: int
+    rendering: int
+    done: int
+    total: int
+
+
+# hands the jobs of a whole ssync session to the executor in the order of
+# their song slot, and never more at once than there are workers, so that
+# queued jobs can still be reordered or cancelled
+class RenderScheduler:
+    def __init__(
+        self,
+        executor: Executor,
+        max_running_jobs: int,
+        boost_first_slides: bool = False,
+    ) -> None:
+        self.executor = executor
+        self.max_running_jobs = max(1, max_running_jobs)
+        self.boost_first_slides = boost_first_slides
+        self.lock = Lock()
+        self.queue: list[ScheduledJob] = []
+        self.sequence = count()
+        self.running_jobs = 0
+        self.done_jobs = 0
+        self.submitted_jobs = 0
+
+    def get_slot_executor(self, slot: int) -> "SlotExecutor":
+        return SlotExecutor(self, slot)
+
+    def submit(
+        self, slot: int, slot_index: int, fn: Callable, /, *args, **kwargs
+    ) -> Future:
+        # when streaming, the start slide and the first song slide of every
+        # slot skip ahead of the remaining slides of earlier slots
+        boosted = self.boost_first_slides and slot_index < 2
+        future = Future()
+        with self.lock:
+            heappush(
+                self.queue,
+                ScheduledJob(
+                    (not boosted, slot, slot_index, next(self.sequence)),
+                    slot,
+                    future,
+                    fn,
+                    args,
+                    kwargs,
+                ),
+            )
+            self.submitted_jobs += 1
+        self.dispatch()
+        return future
+
+    def dispatch(self) -> None:
+        while True:
+            with self.lock:
+                if self.running_jobs >= self.max_running_jobs:
+                    return
+                if len(self.queue) == 0:
+                    return
+                job = heappop(self.queue)
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                self.running_jobs += 1
+            try:
+                executor_future = self.executor.submit(
+                    job.fn, *job.args, **job.kwargs
+                )
+            except RuntimeError as error:
+                self.finish_job(job, None, error)
+                continue
+            executor_future.add_done_callback(
+                lambda executor_future, job=job: self.finish_job(
+                    job, executor_future
+                )
+            )
+
+    def finish_job(
+        self,
+        job: ScheduledJob,
+        executor_future: Future | None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self.lock:
+            self.running_jobs -= 1
+            self.done_jobs += 1
+        if executor_future is not None:
+            if executor_future.cancelled():
+                error = RuntimeError("the render job got cancelled")
+            else:
+                error = executor_future.exception()
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(executor_future.result())  # pyright: ignore
+        self.dispatch()
+
+    def cancel_slot(self, slot: int) -> list[Future]:
+        with self.lock:
+            cancelled_jobs = [job for job in self.queue if job.slot == slot]
+            self.queue = [job for job in self.queue if job.slot != slot]
+            heapify(self.queue)
+            self.submitted_jobs -= len(cancelled_jobs)
+        for job in cancelled_jobs:
+            job.future.cancel()
+        return [job.future for job in cancelled_jobs]
+
+    def get_progress(self) -> SchedulerProgress:
+        with self.lock:
+            return SchedulerProgress(
+                len(self.queue),
+                self.running_jobs,
+                self.done_jobs,
+                self.submitted_jobs,
+            )
+
+
+# looks like a regular executor to generate_slides, but submits all jobs to
+# the scheduler under the song slot it was created for
+class SlotExecutor(Executor):
+    def __init__(self, scheduler: RenderScheduler, slot: int) -> None:
+        self.scheduler = scheduler
+        self.slot = slot
+        self.slot_index = count()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return self.scheduler.submit(
+            self.slot, next(self.slot_index), fn, *args, **kwargs
+        )
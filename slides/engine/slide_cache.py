@@ -0,0 +1,199 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import json
+import shutil
+from hashlib import sha256
+from functools import lru_cache
+from tempfile import NamedTemporaryFile
+
+from utils import log, warn, expand_dir
+
+import config as const
+
+from .encoder import copy_slide_atomically
+
+STYLE_CONSTANTS = (
+    "IMAGE_FORMAT",
+    "FILE_EXTENSION",
+    "JPEG_QUALITY",
+    "JPEG_SAMPLING_FACTOR",
+    "PNG_COMPRESSION_LEVEL",
+    "WEBP_QUALITY",
+    "WEBP_LOSSLESS",
+    "WIDTH",
+    "HEIGHT",
+    "BG_COLOR",
+    "FG_COLOR",
+    "TITLE_COLOR",
+    "MAX_TITLE_FONT_SIZE",
+    "MIN_TITLE_FONT_SIZE",
+    "TITLE_FONT_SIZE_STEP",
+    "TITLE_HEIGHT",
+    "TITLEBAR_Y",
+    "TITLEBAR_TRIANGLE_WIDTH",
+    "TITLEBAR_TRIANGLE_HEIGTH",
+    "INFODISPLAY_FONT_SIZE",
+    "INFODISPLAY_ITEM_WIDTH",
+    "INFODISPLAY_X",
+    "INFODISPLAY_Y",
+    "PLAYER_WIDTH",
+    "PLAYER_HEIGHT",
+    "BOLD_FONT_PATH",
+    "FONT_PATH",
+    "METADATA_FONT_SIZE",
+    "METADATA_X",
+    "BOOK_Y",
+    "ATTRIBUTIONS_Y",
+    "TEXT_COLOR",
+    "STRUCTURE_ELEMENT_X",
+    "STRUCTURE_ELEMENT_Y",
+    "TEXT_CANVAS_X",
+    "TEXT_CANVAS_Y",
+    "TEXT_CANVAS_WIDTH",
+    "TEXT_CANVAS_HEIGHT",
+    "MAX_CANVAS_FONT_SIZE",
+    "MIN_CANVAS_FONT_SIZE",
+    "CANVAS_FONT_SIZE_STEP",
+    "INTERLINE_SPACING",
+    "ARROW_HEIGHT",
+    "ARROW_COLOR",
+    "ARROW_X",
+    "ARROW_Y",
+    "SVG_EMBED_FONTS",
+)
+
+
+def slide_cache_enabled() -> bool:
+    return const.SLIDE_CACHE_DIR != ""
+
+
+@lru_cache(maxsize=8)
+def get_font_file_digest(font_path: str) -> str:
+    try:
+        with open(font_path, mode="rb") as font_reader:
+            return sha256(font_reader.read()).hexdigest()
+    except (FileNotFoundError, PermissionError, IOError):
+        return ""
+
+
+def get_style_fingerprint(slide_style) -> list:
+    return [[name, getattr(const, name)] for name in STYLE_CONSTANTS] + [
+        get_font_file_digest(const.FONT_PATH),
+        get_font_file_digest(const.BOLD_FONT_PATH),
+        slide_style.song_template_form.__qualname__,
+        slide_style.start_slide_form.__qualname__,
+        slide_style.song_slide_form.__qualname__,
+    ]
+
+
+# the version has to be bumped whenever a renderer changes its output for the
+# same inputs, as the cached slides of the old renderer would be hit otherwise
+def get_slide_cache_key(slide_style, *slide_parts) -> str:
+    if not slide_cache_enabled():
+        return ""
+    return sha256(
+        json.dumps(
+            [
+                const.SLIDE_CACHE_VERSION,
+                get_style_fingerprint(slide_style),
+                list(slide_parts),
+            ],
+            ensure_ascii=False,
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def get_cached_slide_path(cache_key: str) -> str:
+    return os.path.join(
+        expand_dir(const.SLIDE_CACHE_DIR),
+        cache_key[:2],
+        cache_key + "." + const.FILE_EXTENSION,
+    )
+
+
+# the cached slides are copied instead of hardlinked, as their mtime is
+# touched on every hit to track the least recently used ones, which would
+# otherwise also change the mtime of the slides in the output directory
+def copy_cached_slide(cache_key: str, filename: str) -> bool:
+    if not slide_cache_enabled():
+        return False
+    cached_slide_path = get_cached_slide_path(cache_key)
+    try:
+        copy_slide_atomically(cached_slide_path, filename)
+        os.utime(cached_slide_path)
+    except FileNotFoundError:
+        return False
+    except (PermissionError, IOError) as error:
+        warn("could not read cached slide. Reason: {}".format(error))
+        return False
+    return True
+
+
+def store_slide_in_cache(cache_key: str, filename: str) -> None:
+    if not slide_cache_enabled():
+        return
+    cached_slide_path = get_cached_slide_path(cache_key)
+    try:
+        os.makedirs(os.path.dirname(cached_slide_path), exist_ok=True)
+        with NamedTemporaryFile(
+            dir=os.path.dirname(cached_slide_path), delete=False
+        ) as temp_file:
+            temp_path = temp_file.name
+        shutil.copyfile(filename, temp_path)
+        os.replace(temp_path, cached_slide_path)
+    except (FileNotFoundError, PermissionError, IOError) as error:
+        warn("could not write slide to cache. Reason: {}".format(error))
+
+
+def prune_slide_cache() -> None:
+    if not slide_cache_enabled():
+        return
+    cached_slides = []
+    total_size = 0
+    for root, _, files in os.walk(expand_dir(const.SLIDE_CACHE_DIR)):
+        for file in files:
+            file_path = os.path.join(root, file)
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                continue
+            cached_slides.append((stat.st_mtime, stat.st_size, file_path))
+            total_size += stat.st_size
+
+    max_size = const.SLIDE_CACHE_MAX_MEGABYTES * 1024 * 1024
+    cached_slides.sort()
+    for _, size, file_path in cached_slides:
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+        except (PermissionError, IOError) as error:
+            warn("could not evict cached slide. Reason: {}".format(error))
+            continue
+        total_size -= size
+
+
+def log_slide_cache_stats(statuses: list) -> None:
+    if not slide_cache_enabled():
+        return
+    hits = sum(1 for status in statuses if status.cache_hit)
+    log(
+        "slide cache: {} hits, {} misses".format(hits, len(statuses) - hits),
+        color="cyan",
+    )
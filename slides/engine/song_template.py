@@ -13,14 +13,53 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
+from threading import Lock
+
 from wand.image import Image
 
 from utils import (
     log,
 )
 
+import config as const
+
+from .layout import SlideLayout, get_base_layout
+
+song_templates: OrderedDict[tuple, Image] = OrderedDict()
+song_templates_lock = Lock()
+
 
 def generate_song_template(slidegen) -> Image:
-    song_template = slidegen.slide_style.song_template_form()
-    log("generating template...")
-    return song_template.get_template(slidegen.metadata["title"])
+    return get_song_template(
+        slidegen.slide_style.song_template_form, slidegen.metadata["title"]
+    )
+
+
+# every render worker builds the template of a song only once and reuses it
+# for all of its slides, the returned image must therefore not be modified
+def get_song_template(
+    song_template_form, title: str, layout: SlideLayout | None = None
+) -> Image:
+    layout = layout or get_base_layout()
+    key = (song_template_form, title, layout)
+    with song_templates_lock:
+        if key in song_templates:
+            song_templates.move_to_end(key)
+            return song_templates[key]
+
+        log("generating template...")
+        template_img = song_template_form(layout).get_template(title)
+        song_templates[key] = template_img
+        # bounded per output resolution, as every slide is rendered in all of
+        # them one after another
+        layout_keys = [
+            cached_key
+            for cached_key in song_templates
+            if cached_key[2] == layout
+        ]
+        for cached_key in layout_keys[
+            : len(layout_keys) - const.SONG_TEMPLATE_CACHE_SIZE
+        ]:
+            del song_templates[cached_key]
+        return template_img
@@ -0,0 +1,72 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable
+
+import numpy as np
+from PIL.Image import Image as PillowImage
+
+import config as const
+
+sprites: OrderedDict[tuple, Any] = OrderedDict()
+sprite_sizes: dict[tuple, int] = {}
+sprites_lock = Lock()
+cached_bytes: int = 0  # pylint: disable=invalid-name
+
+
+def get_sprite_byte_size(sprite) -> int:
+    if isinstance(sprite, np.ndarray):
+        return sprite.nbytes
+    if isinstance(sprite, PillowImage):
+        return sprite.width * sprite.height * len(sprite.getbands())
+    # wand images are held as four 16 bit channels by ImageMagick
+    return sprite.width * sprite.height * 8
+
+
+def peek_cached_sprite(key: tuple):
+    with sprites_lock:
+        if key in sprites:
+            sprites.move_to_end(key)
+            return sprites[key]
+    return None
+
+
+# cached sprites are shared between all slides of the process, so callers
+# must only read from (e.g. composite) them and never modify them in place
+def get_cached_sprite(key: tuple, render_sprite: Callable[[], Any]):
+    global cached_bytes  # pylint: disable=global-statement,invalid-name
+    with sprites_lock:
+        if key in sprites:
+            sprites.move_to_end(key)
+            return sprites[key]
+
+    # rendered outside of the lock, so that the threads of the thread backend
+    # do not wait on each other, a sprite may therefore be rendered twice
+    sprite = render_sprite()
+    sprite_size = get_sprite_byte_size(sprite)
+
+    with sprites_lock:
+        if key in sprites:
+            return sprites[key]
+        sprites[key] = sprite
+        sprite_sizes[key] = sprite_size
+        cached_bytes += sprite_size
+        max_bytes = const.SPRITE_CACHE_MAX_MEGABYTES * 1024 * 1024
+        while cached_bytes > max_bytes and len(sprites) > 1:
+            evicted_key, _ = sprites.popitem(last=False)
+            cached_bytes -= sprite_sizes.pop(evicted_key)
+        return sprite
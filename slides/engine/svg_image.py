@@ -0,0 +1,171 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from base64 import b64encode
+from functools import lru_cache
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+import config as const
+
+from .layout import SlideLayout
+from .pillow_image import get_font, get_text_bbox, get_line_height
+
+
+# all coordinates are given in layout units, the viewBox maps them onto the
+# resolution of the layout, so one document renders sharply at any size
+class SvgImage:
+    def __init__(self, layout: SlideLayout, elements: list | None = None):
+        self.layout = layout
+        self.elements: list[str] = list(elements or [])
+
+    def copy(self) -> "SvgImage":
+        return SvgImage(self.layout, self.elements)
+
+    def add(self, element: str) -> None:
+        self.elements.append(element)
+
+    def close(self) -> None:
+        self.elements.clear()
+
+    # pages that embed the slides declare the font faces themselves
+    def to_string(self, include_font_faces: bool = True) -> str:
+        return "".join(
+            [
+                '<svg xmlns="http://www.w3.org/2000/svg" width="{}" '
+                'height="{}" viewBox="0 0 {} {}">'.format(
+                    self.layout.width,
+                    self.layout.height,
+                    const.WIDTH,
+                    const.HEIGHT,
+                ),
+                (
+                    get_font_face_style(
+                        const.FONT_PATH,
+                        const.BOLD_FONT_PATH,
+                        const.SVG_EMBED_FONTS,
+                    )
+                    if include_font_faces
+                    else ""
+                ),
+                *self.elements,
+                "</svg>\n",
+            ]
+        )
+
+    def to_bytes(self) -> bytes:
+        return self.to_string().encode("utf-8")
+
+
+def get_font_face_name(font_path: str) -> str:
+    return "slide-" + Path(font_path).stem
+
+
+@lru_cache(maxsize=8)
+def get_font_source(font_path: str, embed_font: bool) -> str:
+    if not embed_font:
+        return Path(font_path).resolve().as_uri()
+    with open(font_path, mode="rb") as font_reader:
+        font_data = b64encode(font_reader.read()).decode("ascii")
+    return "data:font/ttf;base64," + font_data
+
+
+@lru_cache(maxsize=8)
+def get_font_face_style(
+    font_path: str, bold_font_path: str, embed_fonts: bool
+) -> str:
+    return "<style>{}</style>".format(
+        "".join(
+            '@font-face{{font-family:"{}";src:url("{}")}}'.format(
+                get_font_face_name(path),
+                get_font_source(path, embed_fonts),
+            )
+            for path in dict.fromkeys((font_path, bold_font_path))
+        )
+    )
+
+
+# the font face is only loaded by browsers, rasterizers like the one of
+# ImageMagick fall back to the installed font family of the same name
+@lru_cache(maxsize=8)
+def get_font_attributes(font_path: str) -> str:
+    family, style = get_font(font_path, 1).getname()
+    return "font-family={} font-weight={}".format(
+        quoteattr('"{}", "{}"'.format(get_font_face_name(font_path), family)),
+        quoteattr("bold" if "bold" in (style or "").lower() else "normal"),
+    )
+
+
+# places the ink box of the text at left and top, just like the trimmed text
+# canvases of the raster styles get composited
+def get_svg_text(
+    text: str,
+    font_path: str,
+    font_size: int,
+    color: str,
+    left: float,
+    top: float,
+    interline_spacing: int = 0,
+) -> str:
+    font = get_font(font_path, font_size)
+    bbox_left, bbox_top, _, _ = get_text_bbox(text, font, interline_spacing)
+    line_height = get_line_height(font, interline_spacing)
+    return (
+        '<text {} font-size="{}" fill={} xml:space="preserve">{}</text>'
+    ).format(
+        get_font_attributes(font_path),
+        font_size,
+        quoteattr(color),
+        "".join(
+            '<tspan x="{}" y="{}">{}</tspan>'.format(
+                left - bbox_left,
+                top - bbox_top + line_number * line_height,
+                escape(line),
+            )
+            for line_number, line in enumerate(text.split("\n"))
+            if line != ""
+        ),
+    )
+
+
+def get_svg_polygon(points: list[tuple[float, float]], color: str) -> str:
+    return "<polygon points={} fill={}/>".format(
+        quoteattr(" ".join("{:g},{:g}".format(x, y) for x, y in points)),
+        quoteattr(color),
+    )
+
+
+def get_svg_rect(
+    left: float, top: float, width: float, height: float, color: str
+) -> str:
+    return '<rect x="{}" y="{}" width="{}" height="{}" fill={}/>'.format(
+        left, top, width, height, quoteattr(color)
+    )
+
+
+def get_svg_baseline_text(
+    text: str, font_path: str, font_size: int, color: str, x: float, y: float
+) -> str:
+    return (
+        '<text {} font-size="{}" fill={} x="{}" y="{}" '
+        'xml:space="preserve">{}</text>'
+    ).format(
+        get_font_attributes(font_path),
+        font_size,
+        quoteattr(color),
+        x,
+        y,
+        escape(text),
+    )
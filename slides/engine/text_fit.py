@@ -0,0 +1,92 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from functools import lru_cache
+from math import ceil
+from typing import Callable
+
+from wand.image import Image
+from wand.drawing import Drawing
+
+
+def get_font_size_candidates(
+    max_font_size: int, min_font_size: int, font_size_step: int
+) -> list[int]:
+    return list(range(max_font_size, min_font_size - 1, -font_size_step))
+
+
+@lru_cache(maxsize=1024)
+def measure_text(
+    text: str, font_path: str, font_size: int, interline_spacing: int = 0
+) -> tuple[int, int]:
+    with Drawing() as draw:
+        draw.font = font_path
+        draw.font_size = font_size
+        draw.text_interline_spacing = interline_spacing
+        with Image(width=1, height=1) as img:
+            metrics = draw.get_font_metrics(img, text, multiline="\n" in text)
+    return ceil(metrics.text_width), ceil(metrics.text_height)
+
+
+def text_fits(
+    text: str,
+    font_path: str,
+    font_size: int,
+    max_width: int,
+    max_height: int,
+    interline_spacing: int = 0,
+) -> bool:
+    width, height = measure_text(text, font_path, font_size, interline_spacing)
+    return width <= max_width and height <= max_height
+
+
+# binary searches the descending font sizes for the first one that fits, as
+# the fit is monotonous in the font size. If none fits, the index of the
+# smallest font size is returned, so that the caller still gets exactly one
+# rasterization attempt.
+def get_first_fitting_font_size_index(
+    font_sizes: list[int], fits: Callable[[int], bool]
+) -> int:
+    low = 0
+    high = len(font_sizes) - 1
+    while low < high:
+        middle = (low + high) // 2
+        if fits(font_sizes[middle]):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+# the font metrics include the full ascent, descent and advance of the text,
+# so they can overestimate its trimmed raster by a font size step. Starting
+# at the metric estimate, the raster is therefore checked against the next
+# larger candidates as well as the smaller ones, which yields the same font
+# size as rasterizing every candidate from the largest one down. If no
+# candidate fits, None is returned.
+def get_largest_raster_fitting_font_size(
+    font_sizes: list[int],
+    estimated_index: int,
+    raster_fits: Callable[[int], bool],
+) -> int | None:
+    if raster_fits(font_sizes[estimated_index]):
+        index = estimated_index
+        while index > 0 and raster_fits(font_sizes[index - 1]):
+            index -= 1
+        return font_sizes[index]
+    for font_size in font_sizes[estimated_index + 1 :]:
+        if raster_fits(font_size):
+            return font_size
+    return None
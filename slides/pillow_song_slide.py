@@ -0,0 +1,242 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from utils import trace_span
+
+import config as const
+
+from .song_slide import SongSlide
+from .engine.sprite_cache import get_cached_sprite
+from .engine.text_fit import (
+    get_font_size_candidates,
+    get_first_fitting_font_size_index,
+)
+from .engine.pillow_image import (
+    get_font,
+    get_color,
+    get_trimmed_text_size,
+    draw_trimmed_text,
+    draw_polygon,
+    new_array,
+    trim_array,
+    composite_array,
+)
+
+
+class PillowSongSlide(SongSlide):
+    def get_slide(
+        self,
+        template_img: Image.Image,
+        slide_text: str,
+        font_size: int,
+        song_structure: list,
+        index: int,
+        use_arrow: bool,
+    ) -> Image.Image:
+        px = self.layout.px
+        with trace_span("text canvas"):
+            if font_size:
+                canvas_img = self.get_cached_text_canvas(slide_text, font_size)
+            else:
+                canvas_img = new_array(1, 1, const.BG_COLOR)
+        verse_or_chorus = song_structure[index]
+        bg_img = np.array(template_img)
+        if "R" not in verse_or_chorus:
+            composite_array(
+                bg_img,
+                self.get_index(verse_or_chorus, font_size),
+                top=px(const.STRUCTURE_ELEMENT_Y),
+                left=px(const.STRUCTURE_ELEMENT_X),
+            )
+        composite_array(
+            bg_img,
+            canvas_img,
+            top=px(const.TEXT_CANVAS_Y),
+            left=px(const.TEXT_CANVAS_X),
+        )
+        if use_arrow:
+            composite_array(
+                bg_img,
+                self.get_arrow(),
+                top=px(const.ARROW_Y),
+                left=px(const.ARROW_X),
+            )
+        composite_array(
+            bg_img,
+            self.get_structure_info_display(song_structure, index),
+            top=px(const.INFODISPLAY_Y),
+            left=px(const.INFODISPLAY_X),
+        )
+        return Image.fromarray(bg_img)
+
+    def get_arrow(self) -> np.ndarray:
+        arrow_height = self.layout.px(const.ARROW_HEIGHT)
+        return get_cached_sprite(
+            (
+                "pillow_arrow",
+                arrow_height,
+                const.ARROW_COLOR,
+                const.BG_COLOR,
+            ),
+            lambda: self.render_arrow(arrow_height),
+        )
+
+    def render_arrow(self, arrow_height: int) -> np.ndarray:
+        arrow_width = arrow_height * 3 // 2
+        return draw_polygon(
+            arrow_width,
+            arrow_height,
+            [
+                (0, arrow_height / 2 - arrow_height / 10),
+                (0, arrow_height / 2 + arrow_height / 10),
+                (
+                    arrow_width / 3 * 2,
+                    arrow_height / 2 + arrow_height / 10,
+                ),
+                (arrow_width / 3 * 2, arrow_height),
+                (arrow_width, arrow_height / 2),
+                (arrow_width / 3 * 2, 0),
+                (
+                    arrow_width / 3 * 2,
+                    arrow_height / 2 - arrow_height / 10,
+                ),
+            ],
+            const.ARROW_COLOR,
+            const.BG_COLOR,
+        )
+
+    def get_text_fit(self, slide_text: str) -> int:
+        font_sizes = get_font_size_candidates(
+            const.MAX_CANVAS_FONT_SIZE,
+            const.MIN_CANVAS_FONT_SIZE,
+            const.CANVAS_FONT_SIZE_STEP,
+        )
+
+        def fits(font_size: int) -> bool:
+            width, height = get_trimmed_text_size(
+                slide_text, const.FONT_PATH, font_size, const.INTERLINE_SPACING
+            )
+            return (
+                width <= const.TEXT_CANVAS_WIDTH
+                and height <= const.TEXT_CANVAS_HEIGHT
+            )
+
+        first_fitting_index = get_first_fitting_font_size_index(
+            font_sizes, fits
+        )
+        max_width = self.layout.px(const.TEXT_CANVAS_WIDTH)
+        max_height = self.layout.px(const.TEXT_CANVAS_HEIGHT)
+        for font_size in font_sizes[first_fitting_index:]:
+            img = self.get_cached_text_canvas(slide_text, font_size)
+            if img.shape[1] <= max_width and img.shape[0] <= max_height:
+                return font_size
+        return 0
+
+    def get_cached_text_canvas(
+        self, slide_text: str, font_size: int
+    ) -> np.ndarray:
+        px = self.layout.px
+        return get_cached_sprite(
+            (
+                "pillow_text_canvas",
+                slide_text,
+                const.FONT_PATH,
+                px(font_size),
+                px(const.INTERLINE_SPACING),
+                const.TEXT_COLOR,
+                const.BG_COLOR,
+            ),
+            lambda: draw_trimmed_text(
+                slide_text,
+                const.FONT_PATH,
+                px(font_size),
+                const.TEXT_COLOR,
+                const.BG_COLOR,
+                px(const.INTERLINE_SPACING),
+            ),
+        )
+
+    def get_structure_info_display(
+        self, structure: list, index: int
+    ) -> np.ndarray:
+        font_size = self.layout.px(const.INFODISPLAY_FONT_SIZE)
+        item_width = self.layout.px(const.INFODISPLAY_ITEM_WIDTH)
+        return get_cached_sprite(
+            (
+                "pillow_structure_info_display",
+                tuple(structure),
+                index,
+                const.FONT_PATH,
+                const.BOLD_FONT_PATH,
+                font_size,
+                item_width,
+                const.TEXT_COLOR,
+                const.BG_COLOR,
+            ),
+            lambda: self.render_structure_info_display(
+                structure, index, font_size, item_width
+            ),
+        )
+
+    def render_structure_info_display(
+        self, structure: list, index: int, font_size: int, item_width: int
+    ) -> np.ndarray:
+        img = Image.new(
+            "RGB",
+            (len(structure) * item_width + 4 * font_size, 3 * font_size),
+            get_color(const.BG_COLOR),
+        )
+        draw = ImageDraw.Draw(img)
+        for current_index, item in enumerate(structure):
+            draw.text(
+                (current_index * item_width, 2 * font_size),
+                item,
+                fill=get_color(const.TEXT_COLOR),
+                font=get_font(
+                    (
+                        const.BOLD_FONT_PATH
+                        if current_index == index
+                        else const.FONT_PATH
+                    ),
+                    font_size,
+                ),
+                anchor="ls",
+            )
+        return trim_array(np.asarray(img), get_color(const.BG_COLOR))
+
+    def get_index(self, verse: str, font_size: int) -> np.ndarray:
+        index_font_size = self.layout.px(
+            max(font_size, const.MIN_CANVAS_FONT_SIZE)
+        )
+        return get_cached_sprite(
+            (
+                "pillow_index",
+                verse,
+                const.FONT_PATH,
+                index_font_size,
+                const.TEXT_COLOR,
+                const.BG_COLOR,
+            ),
+            lambda: draw_trimmed_text(
+                verse + ".",
+                const.FONT_PATH,
+                index_font_size,
+                const.TEXT_COLOR,
+                const.BG_COLOR,
+            ),
+        )
@@ -0,0 +1,124 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+from PIL import Image
+
+import config as const
+
+from .song_template import SongTemplate
+from .engine.sprite_cache import get_cached_sprite
+from .engine.text_fit import (
+    get_font_size_candidates,
+    get_first_fitting_font_size_index,
+)
+from .engine.pillow_image import (
+    get_trimmed_text_size,
+    draw_trimmed_text,
+    draw_polygon,
+    new_array,
+    composite_array,
+)
+
+TITLEBAR_TEXT_BORDER = 30
+
+
+class PillowSongTemplate(SongTemplate):
+    def get_titlebar_rectangle(self, text: str) -> np.ndarray:
+        max_width = (
+            const.WIDTH - const.PLAYER_WIDTH - const.TITLEBAR_TRIANGLE_WIDTH
+        )
+        font_sizes = get_font_size_candidates(
+            const.MAX_TITLE_FONT_SIZE,
+            const.MIN_TITLE_FONT_SIZE,
+            const.TITLE_FONT_SIZE_STEP,
+        )
+        font_size = font_sizes[
+            get_first_fitting_font_size_index(
+                font_sizes,
+                lambda font_size: get_trimmed_text_size(
+                    text, const.BOLD_FONT_PATH, font_size
+                )[0]
+                + 2 * TITLEBAR_TEXT_BORDER
+                <= max_width,
+            )
+        ]
+        text_width, _ = get_trimmed_text_size(
+            text, const.BOLD_FONT_PATH, font_size
+        )
+        if text_width + 2 * TITLEBAR_TEXT_BORDER > max_width:
+            return new_array(1, 1, const.BG_COLOR)
+
+        px = self.layout.px
+        text_img = draw_trimmed_text(
+            text,
+            const.BOLD_FONT_PATH,
+            px(font_size),
+            const.TITLE_COLOR,
+            const.FG_COLOR,
+        )
+        text_height, text_width = text_img.shape[:2]
+        rectangle = new_array(
+            text_width + 2 * px(TITLEBAR_TEXT_BORDER),
+            px(const.TITLEBAR_TRIANGLE_HEIGTH),
+            const.FG_COLOR,
+        )
+        composite_array(
+            rectangle,
+            text_img,
+            left=px(TITLEBAR_TEXT_BORDER),
+            top=int((px(const.TITLE_HEIGHT) - text_height) / 2),
+        )
+        return rectangle
+
+    def get_template(self, title: str) -> Image.Image:
+        titlebar_rectangle = self.get_titlebar_rectangle(title)
+        titlebar_triangle = self.get_titlebar_triangle()
+        titlebar_y = self.layout.px(const.TITLEBAR_Y)
+        base_img = new_array(
+            self.layout.width, self.layout.height, const.BG_COLOR
+        )
+        composite_array(base_img, titlebar_rectangle, top=titlebar_y)
+        composite_array(
+            base_img,
+            titlebar_triangle,
+            left=titlebar_rectangle.shape[1],
+            top=titlebar_y,
+        )
+        return Image.fromarray(base_img)
+
+    def get_titlebar_triangle(self) -> np.ndarray:
+        triangle_width = self.layout.px(const.TITLEBAR_TRIANGLE_WIDTH)
+        triangle_height = self.layout.px(const.TITLEBAR_TRIANGLE_HEIGTH)
+        return get_cached_sprite(
+            (
+                "pillow_titlebar_triangle",
+                triangle_width,
+                triangle_height,
+                const.FG_COLOR,
+                const.BG_COLOR,
+            ),
+            lambda: draw_polygon(
+                triangle_width,
+                triangle_height,
+                [
+                    (triangle_width, 0),
+                    (0, 0),
+                    (0, triangle_height),
+                ],
+                const.FG_COLOR,
+                const.BG_COLOR,
+            ),
+        )
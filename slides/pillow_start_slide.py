@@ -0,0 +1,67 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+from PIL import Image
+
+import config as const
+
+from .start_slide import StartSlide
+from .engine.pillow_image import draw_trimmed_text, composite_array
+
+
+class PillowStartSlide(StartSlide):
+    def get_slide(
+        self,
+        template_img: Image.Image,
+        book: str,
+        text_author: str,
+        melody_author: str,
+    ) -> Image.Image:
+        start_img = np.array(template_img)
+        composite_array(
+            start_img,
+            self.get_attributions(text_author, melody_author),
+            left=self.layout.px(const.METADATA_X),
+            top=self.layout.px(const.ATTRIBUTIONS_Y),
+        )
+        composite_array(
+            start_img,
+            self.get_book(book),
+            left=self.layout.px(const.METADATA_X),
+            top=self.layout.px(const.BOOK_Y),
+        )
+        return Image.fromarray(start_img)
+
+    def get_metadata(self, text: str) -> np.ndarray:
+        return draw_trimmed_text(
+            text,
+            const.FONT_PATH,
+            self.layout.px(const.METADATA_FONT_SIZE),
+            const.TEXT_COLOR,
+            const.BG_COLOR,
+        )
+
+    def get_attributions(
+        self, text_author: str, melody_author: str
+    ) -> np.ndarray:
+        if text_author == melody_author:
+            return self.get_metadata("Text & Melodie: " + text_author)
+        return self.get_metadata(
+            "Text: " + text_author + "\nMelodie: " + melody_author
+        )
+
+    def get_book(self, book: str) -> np.ndarray:
+        return self.get_metadata(book)
@@ -0,0 +1,65 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from utils import error_msg
+
+import config as const
+
+from .slide_style import SlideStyle
+from .classic_song_template import ClassicSongTemplate
+from .classic_start_slide import ClassicStartSlide
+from .classic_song_slide import ClassicSongSlide
+from .pillow_song_template import PillowSongTemplate
+from .pillow_start_slide import PillowStartSlide
+from .pillow_song_slide import PillowSongSlide
+from .svg_song_template import SvgSongTemplate
+from .svg_start_slide import SvgStartSlide
+from .svg_song_slide import SvgSongSlide
+
+SLIDE_STYLES = {
+    "classic": SlideStyle(
+        ClassicSongTemplate,  # pyright: ignore [reportGeneralTypeIssues]
+        ClassicStartSlide,  # pyright: ignore [reportGeneralTypeIssues]
+        ClassicSongSlide,  # pyright: ignore [reportGeneralTypeIssues]
+    ),
+    "pillow": SlideStyle(
+        PillowSongTemplate,  # pyright: ignore [reportGeneralTypeIssues]
+        PillowStartSlide,  # pyright: ignore [reportGeneralTypeIssues]
+        PillowSongSlide,  # pyright: ignore [reportGeneralTypeIssues]
+    ),
+    "svg": SlideStyle(
+        SvgSongTemplate,  # pyright: ignore [reportGeneralTypeIssues]
+        SvgStartSlide,  # pyright: ignore [reportGeneralTypeIssues]
+        SvgSongSlide,  # pyright: ignore [reportGeneralTypeIssues]
+    ),
+}
+
+
+def get_slide_style(style_name: str) -> SlideStyle:
+    if style_name not in SLIDE_STYLES:
+        error_msg(
+            "unknown slide style '{}', choose one of: {}".format(
+                style_name, ", ".join(SLIDE_STYLES)
+            )
+        )
+    # the svg documents are written as they are instead of being encoded
+    if style_name == "svg" and (
+        const.IMAGE_FORMAT != "svg" or const.FILE_EXTENSION != "svg"
+    ):
+        error_msg(
+            "the svg slide style needs both IMAGE_FORMAT and FILE_EXTENSION "
+            + "set to 'svg'"
+        )
+    return SLIDE_STYLES[style_name]
@@ -16,13 +16,26 @@
 from abc import ABC, abstractmethod
 from wand.image import Image
 
+from .engine.layout import SlideLayout, get_base_layout
+
 
 class SongSlide(ABC):
+    def __init__(self, layout: SlideLayout | None = None) -> None:
+        self.layout = layout or get_base_layout()
+
+    # returns the font size in layout units that the slide text fits in, or
+    # 0 if it does not fit at all. It is searched once per slide and shared
+    # by the rasterizations of all output resolutions.
+    @abstractmethod
+    def get_text_fit(self, slide_text: str) -> int:
+        pass
+
     @abstractmethod
     def get_slide(
         self,
         template_img: Image,
         slide_text: str,
+        font_size: int,
         song_structure: list,
         index: int,
         use_arrow: bool,
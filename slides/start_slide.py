@@ -16,8 +16,13 @@
 from abc import ABC, abstractmethod
 from wand.image import Image
 
+from .engine.layout import SlideLayout, get_base_layout
+
 
 class StartSlide(ABC):
+    def __init__(self, layout: SlideLayout | None = None) -> None:
+        self.layout = layout or get_base_layout()
+
     @abstractmethod
     def get_slide(
         self,
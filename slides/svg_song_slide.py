@@ -0,0 +1,151 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import config as const
+
+from .song_slide import SongSlide
+from .engine.svg_image import (
+    SvgImage,
+    get_svg_text,
+    get_svg_baseline_text,
+    get_svg_polygon,
+)
+from .engine.text_fit import (
+    get_font_size_candidates,
+    get_first_fitting_font_size_index,
+)
+from .engine.pillow_image import get_font, get_trimmed_text_size
+
+
+class SvgSongSlide(SongSlide):
+    def get_slide(
+        self,
+        template_img: SvgImage,
+        slide_text: str,
+        font_size: int,
+        song_structure: list,
+        index: int,
+        use_arrow: bool,
+    ) -> SvgImage:
+        slide_img = template_img.copy()
+        verse_or_chorus = song_structure[index]
+        if "R" not in verse_or_chorus and font_size:
+            slide_img.add(
+                get_svg_text(
+                    verse_or_chorus + ".",
+                    const.FONT_PATH,
+                    font_size,
+                    const.TEXT_COLOR,
+                    left=const.STRUCTURE_ELEMENT_X,
+                    top=const.STRUCTURE_ELEMENT_Y,
+                )
+            )
+        if font_size:
+            slide_img.add(
+                get_svg_text(
+                    slide_text,
+                    const.FONT_PATH,
+                    font_size,
+                    const.TEXT_COLOR,
+                    left=const.TEXT_CANVAS_X,
+                    top=const.TEXT_CANVAS_Y,
+                    interline_spacing=const.INTERLINE_SPACING,
+                )
+            )
+        if use_arrow:
+            slide_img.add(self.get_arrow())
+        slide_img.add(self.get_structure_info_display(song_structure, index))
+        return slide_img
+
+    # without a rasterization step, the font metrics are the only check
+    def get_text_fit(self, slide_text: str) -> int:
+        font_sizes = get_font_size_candidates(
+            const.MAX_CANVAS_FONT_SIZE,
+            const.MIN_CANVAS_FONT_SIZE,
+            const.CANVAS_FONT_SIZE_STEP,
+        )
+
+        def fits(font_size: int) -> bool:
+            width, height = get_trimmed_text_size(
+                slide_text, const.FONT_PATH, font_size, const.INTERLINE_SPACING
+            )
+            return (
+                width <= const.TEXT_CANVAS_WIDTH
+                and height <= const.TEXT_CANVAS_HEIGHT
+            )
+
+        font_size = font_sizes[
+            get_first_fitting_font_size_index(font_sizes, fits)
+        ]
+        return font_size if fits(font_size) else 0
+
+    def get_arrow(self) -> str:
+        arrow_height = const.ARROW_HEIGHT
+        arrow_width = arrow_height * 3 // 2
+        return get_svg_polygon(
+            [
+                (const.ARROW_X + x, const.ARROW_Y + y)
+                for x, y in [
+                    (0, arrow_height / 2 - arrow_height / 10),
+                    (0, arrow_height / 2 + arrow_height / 10),
+                    (
+                        arrow_width / 3 * 2,
+                        arrow_height / 2 + arrow_height / 10,
+                    ),
+                    (arrow_width / 3 * 2, arrow_height),
+                    (arrow_width, arrow_height / 2),
+                    (arrow_width / 3 * 2, 0),
+                    (
+                        arrow_width / 3 * 2,
+                        arrow_height / 2 - arrow_height / 10,
+                    ),
+                ]
+            ],
+            const.ARROW_COLOR,
+        )
+
+    # the items share one baseline, which is moved so that the ink box of the
+    # whole display starts at the infodisplay position like the trimmed one
+    def get_structure_info_display(self, structure: list, index: int) -> str:
+        font_size = const.INFODISPLAY_FONT_SIZE
+        items = [
+            (
+                current_index * const.INFODISPLAY_ITEM_WIDTH,
+                item,
+                (
+                    const.BOLD_FONT_PATH
+                    if current_index == index
+                    else const.FONT_PATH
+                ),
+            )
+            for current_index, item in enumerate(structure)
+        ]
+        bboxes = [
+            get_font(font_path, font_size).getbbox(item, anchor="ls")
+            for _, item, font_path in items
+        ]
+        left = min(x + bbox[0] for (x, _, _), bbox in zip(items, bboxes))
+        top = min(bbox[1] for bbox in bboxes)
+        return "".join(
+            get_svg_baseline_text(
+                item,
+                font_path,
+                font_size,
+                const.TEXT_COLOR,
+                const.INFODISPLAY_X - left + x,
+                const.INFODISPLAY_Y - top,
+            )
+            for x, item, font_path in items
+        )
@@ -0,0 +1,105 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import config as const
+
+from .song_template import SongTemplate
+from .engine.svg_image import (
+    SvgImage,
+    get_svg_text,
+    get_svg_polygon,
+    get_svg_rect,
+)
+from .engine.text_fit import (
+    get_font_size_candidates,
+    get_first_fitting_font_size_index,
+)
+from .engine.pillow_image import get_trimmed_text_size
+
+TITLEBAR_TEXT_BORDER = 30
+
+
+class SvgSongTemplate(SongTemplate):
+    def get_template(self, title: str) -> SvgImage:
+        template_img = SvgImage(self.layout)
+        template_img.add(
+            get_svg_rect(0, 0, const.WIDTH, const.HEIGHT, const.BG_COLOR)
+        )
+        titlebar_width = self.add_titlebar_rectangle(template_img, title)
+        template_img.add(
+            get_svg_polygon(
+                [
+                    (
+                        titlebar_width + const.TITLEBAR_TRIANGLE_WIDTH,
+                        const.TITLEBAR_Y,
+                    ),
+                    (titlebar_width, const.TITLEBAR_Y),
+                    (
+                        titlebar_width,
+                        const.TITLEBAR_Y + const.TITLEBAR_TRIANGLE_HEIGTH,
+                    ),
+                ],
+                const.FG_COLOR,
+            )
+        )
+        return template_img
+
+    def add_titlebar_rectangle(self, template_img: SvgImage, text: str) -> int:
+        max_width = (
+            const.WIDTH - const.PLAYER_WIDTH - const.TITLEBAR_TRIANGLE_WIDTH
+        )
+        font_sizes = get_font_size_candidates(
+            const.MAX_TITLE_FONT_SIZE,
+            const.MIN_TITLE_FONT_SIZE,
+            const.TITLE_FONT_SIZE_STEP,
+        )
+        font_size = font_sizes[
+            get_first_fitting_font_size_index(
+                font_sizes,
+                lambda font_size: get_trimmed_text_size(
+                    text, const.BOLD_FONT_PATH, font_size
+                )[0]
+                + 2 * TITLEBAR_TEXT_BORDER
+                <= max_width,
+            )
+        ]
+        text_width, text_height = get_trimmed_text_size(
+            text, const.BOLD_FONT_PATH, font_size
+        )
+        if text_width + 2 * TITLEBAR_TEXT_BORDER > max_width:
+            return 0
+
+        titlebar_width = text_width + 2 * TITLEBAR_TEXT_BORDER
+        template_img.add(
+            get_svg_rect(
+                0,
+                const.TITLEBAR_Y,
+                titlebar_width,
+                const.TITLEBAR_TRIANGLE_HEIGTH,
+                const.FG_COLOR,
+            )
+        )
+        template_img.add(
+            get_svg_text(
+                text,
+                const.BOLD_FONT_PATH,
+                font_size,
+                const.TITLE_COLOR,
+                left=TITLEBAR_TEXT_BORDER,
+                top=const.TITLEBAR_Y
+                + int((const.TITLE_HEIGHT - text_height) / 2),
+            )
+        )
+        return titlebar_width
@@ -0,0 +1,53 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import config as const
+
+from .start_slide import StartSlide
+from .engine.svg_image import SvgImage, get_svg_text
+
+
+class SvgStartSlide(StartSlide):
+    def get_slide(
+        self,
+        template_img: SvgImage,
+        book: str,
+        text_author: str,
+        melody_author: str,
+    ) -> SvgImage:
+        start_img = template_img.copy()
+        start_img.add(
+            self.get_metadata(
+                self.get_attributions(text_author, melody_author),
+                const.ATTRIBUTIONS_Y,
+            )
+        )
+        start_img.add(self.get_metadata(book, const.BOOK_Y))
+        return start_img
+
+    def get_metadata(self, text: str, top: int) -> str:
+        return get_svg_text(
+            text,
+            const.FONT_PATH,
+            const.METADATA_FONT_SIZE,
+            const.TEXT_COLOR,
+            left=const.METADATA_X,
+            top=top,
+        )
+
+    def get_attributions(self, text_author: str, melody_author: str) -> str:
+        if text_author == melody_author:
+            return "Text & Melodie: " + text_author
+        return "Text: " + text_author + "\nMelodie: " + melody_author
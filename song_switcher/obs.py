@@ -16,6 +16,8 @@
 
 import obsws_python as obs
 
+from browser_source import send_browser_source_action
+
 import config as const
 
 
@@ -30,6 +32,9 @@ def change_to_song_scene(song_number: int) -> None:
 
 
 def change_to_next_song_slide(song_number: int) -> None:
+    if const.BROWSER_SOURCE_ENABLED:
+        send_browser_source_action("next", song_number)
+        return
     cl = obs.ReqClient(
         host=const.OBS_WEBSOCKET_HOSTNAME,
         port=const.OBS_WEBSOCKET_PORT,
@@ -43,6 +48,9 @@ def change_to_next_song_slide(song_number: int) -> None:
 
 
 def change_to_previous_song_slide(song_number: int) -> None:
+    if const.BROWSER_SOURCE_ENABLED:
+        send_browser_source_action("previous", song_number)
+        return
     cl = obs.ReqClient(
         host=const.OBS_WEBSOCKET_HOSTNAME,
         port=const.OBS_WEBSOCKET_PORT,
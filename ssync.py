@@ -17,39 +17,40 @@
 
 import colorama
 
-from utils import clear_obs_slides_dir
-from slides import (
-    SlideStyle,
-    ClassicSongSlide,
-    ClassicSongTemplate,
-    ClassicStartSlide,
-)
+from utils import clear_obs_slides_dir, enable_tracing, write_trace
+from slides import SlideStyle, get_slide_style
 from input import (
     validate_ssync_config,
+    refresh_library_index,
     slide_selection_iterator,
     parse_ssync_args_as_tuple,
     SsyncFlags,
 )
 from sync import sync_slide_repo, save_new_checkfile, syncing_needed
 
+import config as const
+
 
 def ssync(ssync_flags: SsyncFlags, slide_style: SlideStyle) -> None:
     validate_ssync_config()
     if syncing_needed(ssync_flags.offline_enabled):
         sync_slide_repo()
         save_new_checkfile()
+    refresh_library_index()
     clear_obs_slides_dir()
-    slide_selection_iterator(ssync_flags.disable_async_enabled, slide_style)
+    if ssync_flags.trace_file_path:
+        enable_tracing()
+    slide_selection_iterator(
+        ssync_flags.render_backend, slide_style, ssync_flags.stream_enabled
+    )
+    if ssync_flags.trace_file_path:
+        write_trace(ssync_flags.trace_file_path)
 
 
 if __name__ == "__main__":
     colorama.init()
 
-    classic_slide_style = SlideStyle(
-        ClassicSongTemplate,  # pyright: ignore [reportGeneralTypeIssues]
-        ClassicStartSlide,  # pyright: ignore [reportGeneralTypeIssues]
-        ClassicSongSlide,  # pyright: ignore [reportGeneralTypeIssues]
-    )
+    slide_style = get_slide_style(const.SLIDE_STYLE)
     ssync_flags = SsyncFlags(*parse_ssync_args_as_tuple())
 
-    ssync(ssync_flags, classic_slide_style)
+    ssync(ssync_flags, slide_style)
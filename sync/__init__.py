@@ -16,3 +16,4 @@
 from .sync_slide_repo import sync_slide_repo
 from .save_new_checkfile import save_new_checkfile
 from .syncing_needed import syncing_needed
+from .prerender_library import prerender_library
@@ -0,0 +1,169 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import io
+import shutil
+import contextlib
+from time import perf_counter
+from concurrent.futures import as_completed
+
+from utils import log, error_msg
+from slides import (
+    SlideStyle,
+    RenderBackend,
+    SequentialExecutor,
+    get_slide_executor,
+    get_prerender_cache_dir,
+    get_prerendered_slides_dir,
+)
+
+import slidegen
+from input import refresh_library_index
+
+
+# runs inside a worker process, the slides are rendered into a partial
+# directory first that is only renamed when the whole song succeeded, so an
+# interrupted run can simply be resumed
+def prerender_song(
+    slide_style: SlideStyle, song_file_path: str, target_dir: str
+) -> int:
+    partial_dir = "{}.partial-{}".format(target_dir, os.getpid())
+    shutil.rmtree(partial_dir, ignore_errors=True)
+    os.makedirs(partial_dir)
+
+    slidegen_instance = slidegen.Slidegen(
+        slide_style, song_file_path, partial_dir, ""
+    )
+    # keep the progress bar of the main process readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        slidegen_instance.parse_file()
+        slidegen_instance.chosen_structure = slidegen_instance.metadata[
+            "structure"
+        ]
+        slidegen_instance.calculate_desired_structures()
+        futures = slidegen_instance.generate_slides(SequentialExecutor())
+
+    for future in futures:
+        status = future.result()
+        if not status.success:
+            shutil.rmtree(partial_dir, ignore_errors=True)
+            raise IOError(status.message)
+
+    os.replace(partial_dir, target_dir)
+    return len(futures)
+
+
+def remove_partial_prerenders(prerender_cache_dir: str) -> None:
+    for directory in os.listdir(prerender_cache_dir):
+        if ".partial-" in directory:
+            shutil.rmtree(
+                os.path.join(prerender_cache_dir, directory),
+                ignore_errors=True,
+            )
+
+
+def log_prerender_progress(
+    done_count: int, song_count: int, slide_count: int, start_time: float
+) -> None:
+    elapsed = max(perf_counter() - start_time, 1e-9)
+    bar_width = 30
+    filled_width = bar_width * done_count // max(song_count, 1)
+    log(
+        "[{}{}] {}/{} songs, {:.1f} songs/s, {:.1f} slides/s".format(
+            "#" * filled_width,
+            "." * (bar_width - filled_width),
+            done_count,
+            song_count,
+            done_count / elapsed,
+            slide_count / elapsed,
+        ),
+        end="\r",
+    )
+
+
+def prerender_library(slide_style: SlideStyle) -> None:
+    prerender_cache_dir = get_prerender_cache_dir()
+    try:
+        os.makedirs(prerender_cache_dir, exist_ok=True)
+        remove_partial_prerenders(prerender_cache_dir)
+    except (PermissionError, IOError) as error:
+        error_msg(
+            "could not prepare prerender cache '{}'. Reason: {}".format(
+                prerender_cache_dir, error
+            )
+        )
+
+    # the index knows the content hash of every song and which songs are
+    # invalid, so no song file has to be read to find the pending ones
+    pending_songs = {}
+    skipped_count = 0
+    invalid_songs = []
+    for indexed_song in refresh_library_index().get_songs():
+        if indexed_song.errors:
+            invalid_songs.append((indexed_song.path, "invalid song file"))
+            continue
+        target_dir = get_prerendered_slides_dir(
+            slide_style, indexed_song.path, indexed_song.content_hash
+        )
+        if os.path.isdir(target_dir):
+            skipped_count += 1
+        else:
+            pending_songs[indexed_song.path] = target_dir
+
+    log(
+        "prerendering {} songs, {} already up to date...".format(
+            len(pending_songs), skipped_count
+        )
+    )
+
+    failed_songs = []
+    done_count = 0
+    slide_count = 0
+    start_time = perf_counter()
+    with get_slide_executor(RenderBackend.PROCESS) as executor:
+        futures = {
+            executor.submit(
+                prerender_song, slide_style, song_file_path, target_dir
+            ): song_file_path
+            for song_file_path, target_dir in pending_songs.items()
+        }
+        for future in as_completed(futures):
+            done_count += 1
+            try:
+                slide_count += future.result()
+            except SystemExit:
+                failed_songs.append((futures[future], "invalid song file"))
+            except Exception as error:  # pylint: disable=broad-except
+                failed_songs.append((futures[future], str(error)))
+            log_prerender_progress(
+                done_count, len(pending_songs), slide_count, start_time
+            )
+
+    print()
+    elapsed = perf_counter() - start_time
+    log(
+        "prerendered {} slides of {} songs in {:.1f}s".format(
+            slide_count, done_count - len(failed_songs), elapsed
+        ),
+        color="cyan",
+    )
+    for song_file_path, reason in invalid_songs + failed_songs:
+        log(
+            "could not prerender '{}'. Reason: {}".format(
+                song_file_path, reason
+            ),
+            color="red",
+        )
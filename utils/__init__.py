@@ -15,7 +15,6 @@
 
 from .log import error_msg, warn, log, CustomException, InfoMsgBox
 from .strings import (
-    get_songtext_by_structure,
     structure_as_list,
     get_unique_structure_elements,
 )
@@ -29,3 +28,11 @@ from .choose import (
     DatePickerDialog,
     get_mp3_file_via_picker_dialog,
 )
+from .trace import (
+    enable_tracing,
+    is_tracing_enabled,
+    trace_span,
+    collect_trace_events,
+    add_trace_events,
+    write_trace,
+)
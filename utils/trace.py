@@ -0,0 +1,124 @@
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from contextlib import contextmanager, nullcontext
+from threading import Lock, local, get_native_id
+from time import perf_counter_ns, thread_time_ns
+import json
+import os
+
+trace_events: list[dict] = []
+trace_events_lock = Lock()
+trace_buffers = local()
+tracing_enabled: bool = False  # pylint: disable=invalid-name
+
+NULL_SPAN = nullcontext()
+
+
+def enable_tracing() -> None:
+    global tracing_enabled  # pylint: disable=global-statement,invalid-name
+    tracing_enabled = True
+
+
+def is_tracing_enabled() -> bool:
+    return tracing_enabled
+
+
+class TraceSpan:
+    __slots__ = ("name", "args", "start_ns", "start_cpu_ns")
+
+    def __init__(self, name: str, args: dict) -> None:
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+        self.start_cpu_ns = 0
+
+    def __enter__(self):
+        self.start_cpu_ns = thread_time_ns()
+        self.start_ns = perf_counter_ns()
+        return self
+
+    def __exit__(self, *_) -> bool:
+        end_ns = perf_counter_ns()
+        self.args["cpu_ms"] = (thread_time_ns() - self.start_cpu_ns) / 1e6
+        record_trace_event(
+            {
+                "name": self.name,
+                "ph": "X",
+                "ts": self.start_ns / 1000,
+                "dur": (end_ns - self.start_ns) / 1000,
+                "pid": os.getpid(),
+                "tid": get_native_id(),
+                "args": self.args,
+            }
+        )
+        return False
+
+
+# when tracing is disabled, all spans share a single no-op context manager
+def trace_span(name: str, **args):
+    if not tracing_enabled:
+        return NULL_SPAN
+    return TraceSpan(name, args)
+
+
+def record_trace_event(event: dict) -> None:
+    buffer = getattr(trace_buffers, "events", None)
+    if buffer is not None:
+        buffer.append(event)
+        return
+    with trace_events_lock:
+        trace_events.append(event)
+
+
+# spans recorded inside a render worker are collected per job and handed back
+# to the main process together with the result of the job
+@contextmanager
+def collect_trace_events():
+    events: list[dict] = []
+    if not tracing_enabled:
+        yield events
+        return
+    previous_buffer = getattr(trace_buffers, "events", None)
+    trace_buffers.events = events
+    try:
+        yield events
+    finally:
+        trace_buffers.events = previous_buffer
+
+
+def add_trace_events(events: list[dict]) -> None:
+    with trace_events_lock:
+        trace_events.extend(events)
+
+
+def write_trace(trace_file_path: str) -> None:
+    main_pid = os.getpid()
+    with trace_events_lock:
+        events = list(trace_events)
+    process_names = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "main" if pid == main_pid else "render worker"},
+        }
+        for pid in sorted({event["pid"] for event in events})
+    ]
+    with open(trace_file_path, mode="w", encoding="utf-8") as file_writer:
+        json.dump(
+            {"traceEvents": process_names + events, "displayTimeUnit": "ms"},
+            file_writer,
+        )
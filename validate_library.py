@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# Copyright © 2026 Noah Vogt <noah@noahvogt.com>
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import json
+from timeit import default_timer
+
+import colorama
+
+from input import (
+    parse_validate_library_argv_as_tuple,
+    get_song_file_paths,
+    validate_song_files,
+    get_library_validation_report,
+)
+from utils import log, error_msg
+
+if __name__ == "__main__":
+    colorama.init()
+    library_dir, report_file_path, workers = (
+        parse_validate_library_argv_as_tuple()
+    )
+
+    song_file_paths = get_song_file_paths(library_dir)
+    if not song_file_paths:
+        error_msg("no song files found in '{}'".format(library_dir))
+    log(
+        "validating {} songs with {} worker processes...".format(
+            len(song_file_paths), workers
+        )
+    )
+    start_time = default_timer()
+    validations = validate_song_files(song_file_paths, workers)
+    report = get_library_validation_report(
+        library_dir, validations, default_timer() - start_time
+    )
+
+    for song in report["songs"]:
+        log(song["path"], color="red")
+        for error in song["errors"]:
+            prefix = (
+                "line {}: ".format(error["line_number"])
+                if error["line_number"]
+                else ""
+            )
+            print("    " + prefix + error["message"].replace("\n", "\n    "))
+    log(
+        "{} of {} songs have {} problems, checked in {:.2f}s".format(
+            report["invalid_song_count"],
+            report["song_count"],
+            report["error_count"],
+            report["seconds"],
+        ),
+        color="red" if report["invalid_song_count"] else "green",
+    )
+
+    if report_file_path:
+        with open(report_file_path, mode="w", encoding="utf-8") as writer:
+            json.dump(report, writer, ensure_ascii=False, indent=2)
+        log("wrote the report to '{}'".format(report_file_path))
+    if report["invalid_song_count"]:
+        sys.exit(1)